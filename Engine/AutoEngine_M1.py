@@ -1,18 +1,22 @@
 import time
-import traceback
 from datetime import datetime
 
+import numpy as np
+
 from Engine.Core.X8_MT5_Connector import MT5Connector
 from Engine.Core.X8_6_MarketWeighted_SignalAnalyzer import MarketWeightedSignalAnalyzer
 from Engine.Core.X8_8_Dynamic_Trade_Allocator import DynamicTradeAllocator
-from Engine.Core.X8_4_RL_Core import RLCore
+from ai.rl_agent import RLAgent
+from monitoring.logger import get_logger
+
+log = get_logger(__name__)
 
 
 class AutoEngineM1:
 
     def __init__(self):
 
-        print("✅ AutoEngine_M1 initialized")
+        log.info("✅ AutoEngine_M1 initialized")
 
         # ---------------------------------------------------------
         # PARAMETERS
@@ -33,11 +37,17 @@ class AutoEngineM1:
         # ---------------------------------------------------------
         self.analyzer = MarketWeightedSignalAnalyzer()
         self.allocator = DynamicTradeAllocator()
-        self.rl = RLCore(learning_rate=0.1, discount_factor=0.9)
+        self.rl = RLAgent(
+            n_features=5,
+            learning_rate=0.1,
+            discount_factor=0.9,
+        )
 
         # RL state tracking
         self.prev_state = None
         self.prev_action = None
+        self._prev_close = None
+        self._vol_ewma = None
 
 
     # ======================================================================
@@ -49,7 +59,7 @@ class AutoEngineM1:
 
 
     # ======================================================================
-    # ✅ RL STATE BUILDER (must be hashable → tuple)
+    # ✅ RL STATE BUILDER (scale‑free feature vector, no raw prices)
     # ======================================================================
     def build_state(self, candle, market_score):
 
@@ -58,13 +68,28 @@ class AutoEngineM1:
         momentum = market_score.get("momentum", 0.0)
         direction = market_score.get("direction", "hold")
 
-        return (
-            round(candle["close"], 2),
-            round(candle["volume"], 2),
-            round(ms, 3),                 # ✅ FIXED: use float not dict
-            round(momentum, 3),           # ✅ include momentum
-            1 if direction == "buy" else -1 if direction == "sell" else 0
-        )
+        close = float(candle["close"])
+        volume = float(candle["volume"])
+
+        # Return vs previous candle (not the price level itself)
+        ret = 0.0
+        if self._prev_close:
+            ret = close / self._prev_close - 1.0
+        self._prev_close = close
+
+        # Volume relative to its EWMA
+        if self._vol_ewma is None:
+            self._vol_ewma = volume
+        self._vol_ewma = 0.95 * self._vol_ewma + 0.05 * volume
+        vol_ratio = volume / self._vol_ewma - 1.0 if self._vol_ewma > 0 else 0.0
+
+        return np.array([
+            ret,
+            vol_ratio,
+            ms,
+            momentum,
+            1.0 if direction == "buy" else -1.0 if direction == "sell" else 0.0,
+        ])
 
 
 
@@ -100,11 +125,11 @@ class AutoEngineM1:
     def execute_order(self, direction, lot):
 
         if direction == "BUY":
-            print("🚀 Sending BUY...")
+            log.info("🚀 Sending BUY...")
             return self.mt5.send_order(self.symbol, "BUY", lot)
 
         if direction == "SELL":
-            print("🔻 Sending SELL...")
+            log.info("🔻 Sending SELL...")
             return self.mt5.send_order(self.symbol, "SELL", lot)
 
         return None
@@ -121,7 +146,10 @@ class AutoEngineM1:
             # ---------------------------------------------------------
             candle = self.get_latest_candle()
             if candle is None:
-                print("⚠️ No candle data received. Skipping cycle.")
+                log.warning("⚠️ No candle data received. Skipping cycle.")
+                return
+            if candle.get("stale"):
+                log.warning("⏱️ Stale candle (terminal timeout). Skipping cycle.")
                 return
 
             close = candle["close"]
@@ -131,7 +159,7 @@ class AutoEngineM1:
             # Analyzer computes market score
             # ---------------------------------------------------------
             market_score = self.analyzer.compute(close, volume)
-            print(f"📊 Market Score: {market_score}")
+            log.info("📊 Market Score: %s", market_score)
 
             # ---------------------------------------------------------
             # Build RL state
@@ -142,7 +170,7 @@ class AutoEngineM1:
             # Decide direction (BUY / SELL / HOLD)
             # ---------------------------------------------------------
             direction = self.decide_direction(market_score)
-            print(f"🎯 Direction Decision: {direction}")
+            log.info("🎯 Direction Decision: %s", direction)
 
             # ---------------------------------------------------------
             # Use allocator to determine lot & action type
@@ -153,7 +181,7 @@ class AutoEngineM1:
                  candle["close"]
 )
 
-            print(f"📦 Allocation: {allocation}")
+            log.info("📦 Allocation: %s", allocation)
 
             # ---------------------------------------------------------
             # Execute trade if needed
@@ -178,14 +206,13 @@ class AutoEngineM1:
                 reward = -0.1
 
             if self.prev_state is not None:
-                self.rl.update_q(self.prev_state, self.prev_action, reward, state)
+                self.rl.observe(self.prev_state, self.prev_action, reward, state)
 
             self.prev_state = state
-            self.prev_action = direction
+            self.prev_action = direction.upper()
 
         except Exception as e:
-            print(f"❌ Error in cycle: {e}")
-            traceback.print_exc()
+            log.exception("❌ Error in cycle: %s", e)
 
 
     # ======================================================================
@@ -193,7 +220,7 @@ class AutoEngineM1:
     # ======================================================================
     def run(self):
 
-        print("✅ AutoEngine M1 is now running...")
+        log.info("✅ AutoEngine M1 is now running...")
 
         while True:
             self.process_cycle()
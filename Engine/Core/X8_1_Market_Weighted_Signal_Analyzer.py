@@ -1,4 +1,5 @@
-import numpy as np
+from core.rolling_stats import RollingWindow
+
 
 class MarketWeightedSignalAnalyzer:
     """
@@ -13,14 +14,25 @@ class MarketWeightedSignalAnalyzer:
     """
 
     def __init__(self):
-        pass
+        # Streaming state (update(): one closed bar per call)
+        self._closes = RollingWindow(3)
+        self._volumes = RollingWindow(2)
+        self._last_time = None
+
+    def update(self, close_price, volume, bar_time=None):
+        # یک کندل بسته‌شده؛ همان bar_time دوباره اضافه نمی‌شود
+        if bar_time is None or bar_time != self._last_time:
+            self._closes.push(float(close_price))
+            self._volumes.push(float(volume))
+            self._last_time = bar_time
+        return self.compute(self._closes, self._volumes)
 
     def compute(self, close_price, volume):
-        # اگر ورودی float بود → تبدیل به لیست
-        if isinstance(close_price, (float, int)):
-            close_price = [close_price]
-        if isinstance(volume, (float, int)):
-            volume = [volume]
+        # اگر ورودی اسکالر بود → یک مشاهده (بدون وضعیت)
+        if not hasattr(close_price, "__len__"):
+            close_price = (close_price,)
+        if not hasattr(volume, "__len__"):
+            volume = (volume,)
 
         # ایمنی داده
         if len(close_price) < 3:
@@ -1,3 +1,6 @@
+from core.rolling_stats import EWMA
+
+
 class OrderFlowAnalyzer:
     """
     تحلیل جریان سفارشات (Order Flow)
@@ -5,10 +8,14 @@ class OrderFlowAnalyzer:
         {
             "buy_pressure": value,
             "sell_pressure": value,
-            "order_flow_score": value
+            "order_flow_score": value,
+            "order_flow_ewma": value     # smoothed score (span bars)
         }
     """
 
+    def __init__(self, span=20):
+        self._flow = EWMA(span=span)
+
     def compute(self, spread, volume):
         if spread is None:
             spread = 0
@@ -25,9 +32,11 @@ class OrderFlowAnalyzer:
             sell_pressure = volume * 0.6
 
         flow_score = buy_pressure - sell_pressure
+        flow_ewma = self._flow.push(flow_score)
 
         return {
             "buy_pressure": float(buy_pressure),
             "sell_pressure": float(sell_pressure),
-            "order_flow_score": float(flow_score)
+            "order_flow_score": float(flow_score),
+            "order_flow_ewma": float(flow_ewma)
         }
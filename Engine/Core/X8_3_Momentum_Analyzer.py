@@ -1,11 +1,27 @@
+from core.rolling_stats import RollingWindow
+
+
 class MomentumAnalyzer:
     """
     محاسبه مومنتوم و انرژی قیمت
     """
 
+    def __init__(self):
+        # Streaming state: last 3 closes (update(): one closed bar)
+        self._closes = RollingWindow(3)
+        self._last_time = None
+
+    def update(self, close_price, bar_time=None):
+        # same bar_time as the last push → not pushed again
+        if bar_time is None or bar_time != self._last_time:
+            self._closes.push(float(close_price))
+            self._last_time = bar_time
+        return self.compute(self._closes)
+
     def compute(self, close_price):
-        if isinstance(close_price, (float, int)):
-            close_price = [close_price]
+        # scalar → single observation (stateless); sequence → tail in place
+        if not hasattr(close_price, "__len__"):
+            close_price = (close_price,)
 
         if len(close_price) < 3:
             return {
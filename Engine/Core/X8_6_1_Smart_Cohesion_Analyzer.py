@@ -1,21 +1,20 @@
-import numpy as np
+from core.rolling_stats import RollingMeanVar
 
 
 class SmartCohesionAnalyzer:
-    def __init__(self):
-        self.recent_closes = []
+    def __init__(self, window=20, min_samples=5):
+        # Windowed Welford mean / variance → O(1) per bar, no arrays
+        self.recent_closes = RollingMeanVar(window)
+        self.min_samples = min_samples
 
     def compute(self, close_price):
-        self.recent_closes.append(close_price)
-        if len(self.recent_closes) > 20:
-            self.recent_closes.pop(0)
+        self.recent_closes.push(float(close_price))
 
-        if len(self.recent_closes) < 5:
+        if len(self.recent_closes) < self.min_samples:
             return 0.0
 
-        # Cohesion: inverse of volatility
-        arr = np.array(self.recent_closes)
-        vol = np.std(arr)
+        # Cohesion: inverse of volatility (population std, as np.std)
+        vol = self.recent_closes.std()
 
         if vol == 0:
             return 1.0
@@ -1,49 +1,36 @@
+from core.rolling_stats import RollingWindow
+from monitoring.logger import get_logger
+
+log = get_logger(__name__)
+
+
 class MarketWeightedSignalAnalyzer:
     def __init__(self):
-        pass
+        # Streaming state (update(): one closed bar per call)
+        self._closes = RollingWindow(3)
+        self._volumes = RollingWindow(2)
+        self._last_time = None
 
     # -------------------------------------------------------
     # ✅ Smart compute (accepts float, list, array)
+    #    scalar   → single observation (stateless: zeros / "hold")
+    #    sequence → read from its tail, no conversion / copy
     # -------------------------------------------------------
     def compute(self, close_price, volume=None):
         try:
-            # --- normalize close_price ---
-            if isinstance(close_price, (float, int)):
-                close_price = [close_price]
-            if "numpy" in str(type(close_price)):
-                try:
-                    close_price = close_price.tolist()
-                except:
-                    close_price = [float(close_price)]
+            if not hasattr(close_price, "__len__"):
+                close_price = (close_price,)
 
             # --- normalize volume ---
             if volume is None:
-                volume = [0] * len(close_price)
+                volume = (0.0, 0.0)
+            elif not hasattr(volume, "__len__"):
+                volume = (volume,)
 
-            if isinstance(volume, (float, int)):
-                volume = [volume]
-            if "numpy" in str(type(volume)):
-                try:
-                    volume = volume.tolist()
-                except:
-                    volume = [float(volume)]
-
-            momentum = self.compute_momentum(close_price)
-            volume_pressure = self.compute_volume_pressure(volume)
-            order_flow = self.compute_order_flow(close_price)
-            score = self.compute_market_score(momentum, volume_pressure, order_flow)
-            direction = self.compute_direction(momentum, order_flow)
-
-            return {
-                "momentum": momentum,
-                "volume_pressure": volume_pressure,
-                "order_flow": order_flow,
-                "market_score": score,
-                "direction": direction,
-            }
+            return self._evaluate(close_price, volume)
 
         except Exception as e:
-            print(f"❌ MarketWeightedSignalAnalyzer Error: {e}")
+            log.error("❌ MarketWeightedSignalAnalyzer Error: %s", e)
             return {
                 "momentum": 0,
                 "volume_pressure": 0,
@@ -52,8 +39,35 @@ class MarketWeightedSignalAnalyzer:
                 "direction": "hold",
             }
 
+    # -------------------------------------------------------
+    # ✅ Streaming update: one CLOSED bar, O(1)
+    #    bar_time equal to the last pushed one → not pushed again
+    #    (a poller re‑reading the same candle adds no history)
+    # -------------------------------------------------------
+    def update(self, close_price, volume=None, bar_time=None):
+        if bar_time is None or bar_time != self._last_time:
+            self._closes.push(float(close_price))
+            self._volumes.push(0.0 if volume is None else float(volume))
+            self._last_time = bar_time
+        return self._evaluate(self._closes, self._volumes)
+
+    def _evaluate(self, close_price, volume):
+        momentum = self.compute_momentum(close_price)
+        volume_pressure = self.compute_volume_pressure(volume)
+        order_flow = self.compute_order_flow(close_price)
+        score = self.compute_market_score(momentum, volume_pressure, order_flow)
+        direction = self.compute_direction(momentum, order_flow)
+
+        return {
+            "momentum": momentum,
+            "volume_pressure": volume_pressure,
+            "order_flow": order_flow,
+            "market_score": score,
+            "direction": direction,
+        }
+
     # ----------------------------------------
-    # ✅ Sub‑methods
+    # ✅ Sub‑methods (any sequence with [-k] lag access)
     # ----------------------------------------
     def compute_momentum(self, close_price):
         if len(close_price) < 2:
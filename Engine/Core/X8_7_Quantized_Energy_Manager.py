@@ -1,7 +1,8 @@
 import os
-import pandas as pd
 from datetime import datetime
 
+from Engine.Core.X8_TimeSeries_Store import TailReader, TimeSeriesWriter, csv_last_row
+
 
 class X8_7_QuantizedEnergyManager:
     def __init__(self, base_path="M1_X8_Factory"):
@@ -18,31 +19,31 @@ class X8_7_QuantizedEnergyManager:
         self.default_coh = 1.0
         self.default_sharpe = 1.0
 
+        # Append‑only writers / tail readers (cost independent of history)
+        self._energy = TimeSeriesWriter(self.energy_path, ["Timestamp", "TradingEnergy"])
+        self._qvalues = TimeSeriesWriter(self.qvalue_path, ["Timestamp", "QValue"])
+        self._cohesion = TailReader(self.cohesion_path)
+
     # -----------------------------------------------------
     # Load Q-Value
     # -----------------------------------------------------
     def load_qvalue(self):
-        if not os.path.exists(self.qvalue_path):
-            df = pd.DataFrame([{"Timestamp": 0, "QValue": self.default_q}])
-            df.to_csv(self.qvalue_path, index=False)
+        row = csv_last_row(self.qvalue_path)
+        if row is None:
+            if not os.path.exists(self.qvalue_path):
+                self._qvalues.append({"Timestamp": 0, "QValue": self.default_q})
             return self.default_q
 
-        df = pd.read_csv(self.qvalue_path)
-        return float(df["QValue"].iloc[-1])
+        return float(row["QValue"])
 
     # -----------------------------------------------------
-    # Load CohesionWeighted from log
+    # Load CohesionWeighted from log (last line only)
     # -----------------------------------------------------
     def load_cohesion(self):
-        if not os.path.exists(self.cohesion_path):
-            return self.default_coh
-
-        lines = open(self.cohesion_path, "r", encoding="utf-8").read().strip().split("\n")
-        if len(lines) == 0:
+        last = self._cohesion.last_line()
+        if last is None:
             return self.default_coh
 
-        last = lines[-1]
-
         if "CohesionWeighted" not in last:
             return self.default_coh
 
@@ -96,20 +97,13 @@ class X8_7_QuantizedEnergyManager:
         return result
 
     # -----------------------------------------------------
-    # Save Trading Energy to CSV
+    # Save Trading Energy to CSV (append one row)
     # -----------------------------------------------------
     def store_energy(self, result_dict):
-        if not os.path.exists(self.energy_path):
-            df = pd.DataFrame([], columns=["Timestamp", "TradingEnergy"])
-        else:
-            df = pd.read_csv(self.energy_path)
-
-        df.loc[len(df)] = {
+        self._energy.append({
             "Timestamp": datetime.now(),
             "TradingEnergy": result_dict["TradingEnergy"],
-        }
-
-        df.to_csv(self.energy_path, index=False)
+        })
 
     # -----------------------------------------------------
     # Log
@@ -1,7 +1,179 @@
 import os
-import pandas as pd
+import time
 from datetime import datetime
 
+import numpy as np
+
+from Engine.Core.X8_TimeSeries_Store import TimeSeriesWriter, csv_last_row
+
+
+# -----------------------------------------------------
+# Market closes → memory‑mapped float64 array
+# -----------------------------------------------------
+def load_close_memmap(csv_path, column="close"):
+    """
+    The CSV is parsed once into a sidecar `<csv>.<column>.npy`; later
+    calls memory‑map it (rebuilt only when the CSV is newer).
+    """
+    cache = f"{csv_path}.{column}.npy"
+
+    if (
+        not os.path.exists(cache)
+        or os.path.getmtime(cache) < os.path.getmtime(csv_path)
+    ):
+        import pandas as pd   # lazy: only on cache (re)build
+
+        closes = pd.read_csv(csv_path, usecols=[column])[column].to_numpy(np.float64)
+        tmp = cache + ".tmp.npy"
+        np.save(tmp, closes)
+        os.replace(tmp, cache)
+
+    return np.load(cache, mmap_mode="r")
+
+
+# -----------------------------------------------------
+# Episode summaries (append‑only binary batches)
+# -----------------------------------------------------
+EPISODE_DTYPE = np.dtype([
+    ("ts", "i8"),
+    ("episode", "i8"),
+    ("start", "i8"),
+    ("steps", "i4"),
+    ("lot", "f8"),
+    ("pnl", "f8"),
+    ("final_reward", "f8"),
+    ("q_old", "f8"),
+    ("q_new", "f8"),
+    ("max_drawdown", "f8"),
+    ("win_rate", "f8"),
+])
+
+
+class EpisodeResultLog:
+    """
+    Packed EPISODE_DTYPE records; every batch is one append, nothing
+    already written is ever rewritten.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def append(self, records: np.ndarray):
+        records = np.asarray(records, dtype=EPISODE_DTYPE)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "ab") as f:
+            f.write(records.tobytes())
+
+    def __len__(self):
+        if not os.path.exists(self.path):
+            return 0
+        return os.path.getsize(self.path) // EPISODE_DTYPE.itemsize
+
+    def read(self, last: int = None) -> np.ndarray:
+        n = len(self)
+        if n == 0:
+            return np.zeros(0, dtype=EPISODE_DTYPE)
+        records = np.memmap(self.path, dtype=EPISODE_DTYPE, mode="r", shape=(n,))
+        return np.array(records if last is None else records[-last:])
+
+
+# -----------------------------------------------------
+# Vectorized episode simulator
+# -----------------------------------------------------
+class VectorizedEpisodeSimulator:
+    """
+    RL Trade Simulator (vectorized) – X8 System
+    -------------------------------------------
+    Same cycle as X8_9_RL_TradeSimulator.run, for E episodes at once:
+
+        pnl_t    = (close[s+t+1] − close[s+t]) · lot
+        reward_t = pnl_t + reward_{t−1}
+        q_t      = q_{t−1} + α·(reward_t + γ·q_{t−1} − q_{t−1})
+
+    ✅ Prices read straight from a memmap (no per‑step file I/O)
+    ✅ Time processed in chunks → memory O(chunk × E)
+    ✅ Q recursion solved per chunk with one matrix product
+    """
+
+    def __init__(self, prices, alpha=0.15, gamma=0.95, chunk=256):
+        self.prices = prices
+        self.alpha = alpha
+        self.gamma = gamma
+        self.chunk = int(chunk)
+
+        # q_t = c·q_{t−1} + α·r_t
+        self.c = 1.0 - alpha + alpha * gamma
+        i = np.arange(self.chunk)
+        lag = i[:, None] - i[None, :]
+        self._kernel = np.where(lag >= 0, alpha * self.c ** np.maximum(lag, 0), 0.0)
+        self._decay = self.c ** (i + 1)
+
+    def random_starts(self, n_episodes, steps, seed=None):
+        high = len(self.prices) - steps - 1
+        if high < 1:
+            raise ValueError(f"Not enough bars ({len(self.prices)}) for {steps}-step episodes")
+        return np.random.default_rng(seed).integers(0, high, size=n_episodes)
+
+    def run(self, starts, steps, lots=1.0, q0=1.0, reward0=1.0, on_chunk=None):
+        """
+        starts   : (E,) first bar index of every episode
+        lots     : scalar, (E,) or callable(t0, t1) → (chunk, E) signed lots
+        on_chunk : optional callback(t0, pnl, reward, q) with (chunk, E) arrays
+
+        Returns a dict of (E,) arrays.
+        """
+        starts = np.asarray(starts, dtype=np.int64)
+        n = len(starts)
+
+        reward = np.broadcast_to(np.asarray(reward0, dtype=float), (n,)).copy()
+        q = np.broadcast_to(np.asarray(q0, dtype=float), (n,)).copy()
+        q_old = q.copy()
+        equity = np.zeros(n)
+        peak = np.zeros(n)
+        max_dd = np.zeros(n)
+        wins = np.zeros(n)
+
+        for t0 in range(0, steps, self.chunk):
+            t1 = min(t0 + self.chunk, steps)
+            m = t1 - t0
+
+            idx = starts[None, :] + np.arange(t0, t1 + 1)[:, None]
+            px = np.asarray(self.prices[idx.ravel()], dtype=float).reshape(m + 1, n)
+            lot = lots(t0, t1) if callable(lots) else lots
+            pnl = np.diff(px, axis=0) * lot
+
+            # Running total reward: reward_t = reward_{t−1} + pnl_t
+            rew = reward + np.cumsum(pnl, axis=0)
+            reward = rew[-1]
+
+            q_path = self._decay[:m, None] * q + self._kernel[:m, :m] @ rew
+            q = q_path[-1]
+
+            # Equity curve stats
+            eq = equity + np.cumsum(pnl, axis=0)
+            run_peak = np.maximum(peak, np.maximum.accumulate(eq, axis=0))
+            max_dd = np.maximum(max_dd, (run_peak - eq).max(axis=0))
+            peak = run_peak[-1]
+            equity = eq[-1]
+            wins += (pnl > 0.0).sum(axis=0)
+
+            if on_chunk is not None:
+                on_chunk(t0, pnl, rew, q_path)
+
+        return {
+            "start": starts,
+            "pnl": equity,
+            "final_reward": reward,
+            "q_old": q_old,
+            "q_new": q,
+            "max_drawdown": max_dd,
+            "win_rate": wins / max(steps, 1),
+        }
+
+
+# -----------------------------------------------------
+# X8.9 entry point (file‑based cycle)
+# -----------------------------------------------------
 class X8_9_RL_TradeSimulator:
     def __init__(self, base_path="M1_X8_Factory"):
         self.base = base_path
@@ -18,19 +190,29 @@ class X8_9_RL_TradeSimulator:
 
         # Outputs
         self.reward_path = os.path.join(self.base, "Rewards", "TotalReward_Enhanced.csv")
+        self.episode_path = os.path.join(self.base, "Rewards", "Episodes.bin")
         self.log_path = os.path.join(self.base, "Logs", "RL_Log.txt")
 
         # Parameters
         self.alpha = 0.15
         self.gamma = 0.95
 
+        self._prices = None
+        self._episodes = 0
+
+        self._qvalues = TimeSeriesWriter(self.qvalue_path, ["QValue"])
+        self._rewards = TimeSeriesWriter(self.reward_path, ["Timestamp", "Reward"])
+
     # -----------------------------------------------------
-    # Load market data
+    # Load market data (memory‑mapped closes)
     # -----------------------------------------------------
     def load_market(self):
+        if self._prices is not None:
+            return self._prices
         for p in self.market_paths:
             if os.path.exists(p):
-                return pd.read_csv(p)
+                self._prices = load_close_memmap(p)
+                return self._prices
         raise FileNotFoundError("Market data (XAUUSD_M1_Cleaned_Data.csv) not found in Market/, Data/, or root.")
 
     # -----------------------------------------------------
@@ -39,38 +221,35 @@ class X8_9_RL_TradeSimulator:
     def load_allocation(self):
         if not os.path.exists(self.alloc_path):
             raise FileNotFoundError("Allocation.csv not found. Run X8.8 first.")
-        df = pd.read_csv(self.alloc_path)
-        return float(df["LotSize"].iloc[-1])
+        return float(csv_last_row(self.alloc_path)["LotSize"])
 
     # -----------------------------------------------------
     # Load Q-Value
     # -----------------------------------------------------
     def load_qvalue(self):
-        if not os.path.exists(self.qvalue_path):
-            df = pd.DataFrame([{"QValue": 1.0}])
-            df.to_csv(self.qvalue_path, index=False)
+        row = csv_last_row(self.qvalue_path)
+        if row is None:
+            self._qvalues.append({"QValue": 1.0})
             return 1.0
-        df = pd.read_csv(self.qvalue_path)
-        return float(df["QValue"].iloc[-1])
+        return float(row["QValue"])
 
     # -----------------------------------------------------
     # Load latest adjusted reward
     # -----------------------------------------------------
     def load_reward(self):
-        if not os.path.exists(self.reward_path):
-            df = pd.DataFrame([{"Timestamp": 0, "Reward": 1.0}])
-            df.to_csv(self.reward_path, index=False)
+        row = csv_last_row(self.reward_path)
+        if row is None:
+            self._rewards.append({"Timestamp": 0, "Reward": 1.0})
             return 1.0
-        df = pd.read_csv(self.reward_path)
-        return float(df["Reward"].iloc[-1])
+        return float(row["Reward"])
 
     # -----------------------------------------------------
     # Simulate a trade
     # -----------------------------------------------------
     def simulate_trade(self, lot):
-        df = self.load_market()
-        entry = float(df["close"].iloc[-2])
-        exit = float(df["close"].iloc[-1])
+        closes = self.load_market()
+        entry = float(closes[-2])
+        exit = float(closes[-1])
         pnl = (exit - entry) * lot
         return entry, exit, pnl
 
@@ -79,30 +258,17 @@ class X8_9_RL_TradeSimulator:
     # -----------------------------------------------------
     def compute_reward(self, pnl, adjusted_reward):
         # reward = pnl + adjusted_reward  (base formula)
-        reward = pnl + adjusted_reward
-
-        new_row = {
-            "Timestamp": str(datetime.now()),
-            "Reward": round(reward, 6)
-        }
-
-        df = pd.read_csv(self.reward_path)
-        df.loc[len(df)] = new_row
-        df.to_csv(self.reward_path, index=False)
-
-        return round(reward, 6)
+        reward = round(pnl + adjusted_reward, 6)
+        self._rewards.append({"Timestamp": str(datetime.now()), "Reward": reward})
+        return reward
 
     # -----------------------------------------------------
     # Q-Learning update
     # -----------------------------------------------------
     def update_qvalue(self, q_old, reward):
-        q_new = q_old + self.alpha * (reward + self.gamma * q_old - q_old)
-
-        df = pd.read_csv(self.qvalue_path)
-        df.loc[len(df)] = {"QValue": round(q_new, 12)}
-        df.to_csv(self.qvalue_path, index=False)
-
-        return round(q_new, 12)
+        q_new = round(q_old + self.alpha * (reward + self.gamma * q_old - q_old), 12)
+        self._qvalues.append({"QValue": q_new})
+        return q_new
 
     # -----------------------------------------------------
     # Log data
@@ -137,6 +303,58 @@ class X8_9_RL_TradeSimulator:
         self.log(result)
         return result
 
+    # -----------------------------------------------------
+    # Offline training: many parallel episodes in memory
+    # -----------------------------------------------------
+    def train(self, n_episodes=1000, steps=1000, lot=None, seed=None, batch=1000):
+        """
+        Simulates n_episodes random windows of `steps` bars, starting
+        from the current Q / reward state. Episode summaries are appended
+        to Episodes.bin per batch; the mean final Q is appended to
+        QValue.csv once.
+        """
+        closes = self.load_market()
+        lot = self.load_allocation() if lot is None else lot
+        q0 = self.load_qvalue()
+        r0 = self.load_reward()
+
+        sim = VectorizedEpisodeSimulator(closes, self.alpha, self.gamma)
+        starts = sim.random_starts(n_episodes, steps, seed)
+        out = EpisodeResultLog(self.episode_path)
+
+        t = time.perf_counter()
+        q_sum = 0.0
+        for b0 in range(0, n_episodes, batch):
+            res = sim.run(starts[b0:b0 + batch], steps, lots=lot, q0=q0, reward0=r0)
+            k = len(res["start"])
+
+            records = np.zeros(k, dtype=EPISODE_DTYPE)
+            records["ts"] = time.time_ns()
+            records["episode"] = self._episodes + np.arange(k)
+            records["steps"] = steps
+            records["lot"] = lot
+            for name in ("start", "pnl", "final_reward", "q_old", "q_new",
+                         "max_drawdown", "win_rate"):
+                records[name] = res[name]
+            out.append(records)
+
+            self._episodes += k
+            q_sum += float(res["q_new"].sum())
+
+        q_new = round(q_sum / n_episodes, 12)
+        self._qvalues.append({"QValue": q_new})
+
+        summary = {
+            "Episodes": n_episodes,
+            "Steps": steps,
+            "LotSize": lot,
+            "QValue_Old": q0,
+            "QValue_New": q_new,
+            "Seconds": round(time.perf_counter() - t, 3),
+        }
+        self.log(summary)
+        return summary
+
 
 if __name__ == "__main__":
     sim = X8_9_RL_TradeSimulator()
@@ -1,4 +1,6 @@
-import MetaTrader5 as mt5
+from core.mt5_backend import mt5
+from core.mt5_gateway import get_gateway
+from core.mt5_session import get_session
 import json
 import os
 import time
@@ -26,6 +28,10 @@ class MT5Connector:
         self.default_lot = cfg.get("lot", 0.01)
         self.auto_trade_enabled = cfg.get("auto_trade_enabled", True)
 
+        # Shared terminal session (one initialize per process)
+        self.session = get_session()
+        self.gateway = get_gateway(self.session)
+
         self.connect()
 
         # Auto-select default symbol if provided
@@ -38,9 +44,9 @@ class MT5Connector:
     # ------------------------------------------------------
     def connect(self):
 
-        mt5.initialize()
+        self.session.initialize()
 
-        authorized = mt5.login(
+        authorized = self.session.login(
             login=self.login,
             password=self.password,
             server=self.server
@@ -57,14 +63,14 @@ class MT5Connector:
     # ------------------------------------------------------
     def select_symbol(self, symbol):
 
-        info = mt5.symbol_info(symbol)
+        info = self.session.symbol_info(symbol)
 
         if info is None:
             print(f"❌ Symbol not found: {symbol}")
             return False
 
         if not info.visible:
-            if not mt5.symbol_select(symbol, True):
+            if not self.session.symbol_select(symbol, True):
                 print(f"❌ Failed to activate symbol: {symbol}")
                 return False
 
@@ -78,7 +84,8 @@ class MT5Connector:
     def get_latest_candle(self, symbol):
 
         try:
-            rates = mt5.copy_rates_from_pos(symbol, mt5.TIMEFRAME_M1, 0, 1)
+            res = self.gateway.call("copy_rates_from_pos", symbol, mt5.TIMEFRAME_M1, 0, 1)
+            rates = res.value
 
             if rates is None or len(rates) == 0:
                 print(f"⚠️ No rates received for {symbol}")
@@ -94,6 +101,7 @@ class MT5Connector:
                 "close": float(r["close"]),
                 "volume": float(r["tick_volume"]),
                 "spread": float(r["spread"]),
+                "stale": res.stale,        # terminal timeout → cached candle
             }
 
             return candle
@@ -115,7 +123,10 @@ class MT5Connector:
         if lot is None:
             lot = self.default_lot
 
-        tick = mt5.symbol_info_tick(symbol)
+        # Fresh tick only: a stale price must never be used for an order
+        tick = self.gateway.call(
+            "symbol_info_tick", symbol, max_age=0, stale_ok=False
+        ).value
         if tick is None:
             print(f"❌ Could not get tick for {symbol}")
             return None
@@ -135,7 +146,12 @@ class MT5Connector:
             "type_filling": mt5.ORDER_FILLING_FOK,
         }
 
-        result = mt5.order_send(request)
+        sent = self.gateway.send_order(request)
+        if sent.timed_out:
+            print(f"⏱️ order_send timeout ({'in flight' if sent.in_flight else 'not sent'})")
+            return None
+
+        result = sent.value
 
         if result is None:
             print("❌ order_send returned None")
@@ -0,0 +1,157 @@
+import csv
+import io
+import os
+
+
+# -----------------------------------------------------
+# Tail: last lines without reading the whole file
+# -----------------------------------------------------
+def tail_lines(path, n=1, block=8192):
+    """
+    Last n non‑empty lines of a text file, read backwards from the end
+    in `block`‑sized chunks → cost depends on line length, not file size.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        chunk = b""
+        while pos > 0:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step) + chunk
+            if len([l for l in chunk.split(b"\n") if l.strip()]) > n:
+                break
+
+    lines = [l for l in chunk.split(b"\n") if l.strip()]
+    if pos > 0:
+        lines = lines[1:]     # first piece may be a partial line
+    return [l.decode("utf-8", errors="replace").rstrip("\r") for l in lines[-n:]]
+
+
+def csv_last_row(path):
+    """
+    {column: value} of the last data row, or None (missing / header only).
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        header = f.readline().strip()
+    if not header:
+        return None
+
+    last = tail_lines(path, 1)
+    if not last or last[0].strip() == header:
+        return None
+    names = next(csv.reader([header]))
+    values = next(csv.reader([last[0]]))
+    return dict(zip(names, values))
+
+
+# -----------------------------------------------------
+# Append‑only CSV writer
+# -----------------------------------------------------
+class TimeSeriesWriter:
+    """
+    Append‑Only Time Series – X8 System
+    -----------------------------------
+    ✅ One O(1) append per row (no read / rewrite of the history)
+    ✅ Header written once, when the file is created
+    ✅ Handle opened lazily, kept open, flushed per row
+    """
+
+    def __init__(self, path, fields):
+        self.path = path
+        self.fields = list(fields)
+        self._file = None
+        self._writer = None
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        self._file = open(self.path, "a", encoding="utf-8", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fields)
+        if new:
+            self._writer.writeheader()
+
+    def append(self, row: dict):
+        if self._file is None:
+            self._open()
+        self._writer.writerow(row)
+        self._file.flush()
+
+    def extend(self, rows):
+        if self._file is None:
+            self._open()
+        buf = io.StringIO()
+        csv.DictWriter(buf, fieldnames=self.fields).writerows(rows)
+        self._file.write(buf.getvalue())
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# -----------------------------------------------------
+# Incremental tail (offset index)
+# -----------------------------------------------------
+class TailReader:
+    """
+    Last non‑empty line of a file that only grows.
+
+    Keeps the byte offset where the current last line starts; each call
+    reads only what was appended since (nothing when the size is
+    unchanged). A shrunk / replaced file falls back to tail_lines.
+    """
+
+    def __init__(self, path, max_scan=1 << 20):
+        self.path = path
+        self.max_scan = max_scan
+
+        self._size = None
+        self._line_start = 0
+        self._last = None
+
+    def _reset(self, size):
+        lines = tail_lines(self.path, 1)
+        self._last = lines[0] if lines else None
+        self._size = size
+        self._line_start = size
+
+    def last_line(self):
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            self._size, self._last = None, None
+            return None
+
+        if size == self._size:
+            return self._last
+        if self._size is None or size < self._size or size - self._line_start > self.max_scan:
+            self._reset(size)
+            return self._last
+
+        with open(self.path, "rb") as f:
+            f.seek(self._line_start)
+            chunk = f.read(size - self._line_start)
+
+        lines = [l for l in chunk.split(b"\n") if l.strip()]
+        if lines:
+            self._last = lines[-1].decode("utf-8", errors="replace").rstrip("\r")
+
+        cut = chunk.rfind(b"\n")
+        if cut >= 0 and chunk[cut + 1:].strip():
+            self._line_start += cut + 1
+        elif cut >= 0:
+            self._line_start = size
+        self._size = size
+        return self._last
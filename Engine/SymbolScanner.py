@@ -1,7 +1,36 @@
 # SymbolScanner.py - SAFE VERSION for all brokers
+# Incremental: only new / expired / changed symbols are fetched.
+# Terminal calls run on the gateway's I/O thread (core/mt5_gateway.py);
+# the thread pool only turns the replies into index records.
 
 import json
-import MetaTrader5 as mt5
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from config.settings import (
+    SYMBOL_CACHE_TTL_SEC,
+    SYMBOL_INDEX_PATH,
+    SYMBOL_SCAN_WORKERS,
+)
+from config.symbols import (
+    SYMBOL_DTYPE,
+    get_symbol_index,
+    load_index,
+    record_from_dict,
+    record_to_dict,
+    save_index,
+)
+from core.mt5_backend import mt5
+from core.mt5_gateway import get_gateway
+from core.mt5_session import get_session
+from monitoring.logger import get_logger
+
+log = get_logger(__name__)
+
+# Cheap fields already present in symbols_get() → change detection
+_FINGERPRINT = ("digits", "point", "volume_min", "volume_step", "trade_contract_size")
 
 
 def safe_get(obj, attr):
@@ -9,59 +38,164 @@ def safe_get(obj, attr):
     return getattr(obj, attr, None)
 
 
-def scan_symbols(output_file="symbols.json"):
-    print("✅ Initializing MT5 Connection...")
+def _extract(symbol, info) -> dict:
+    # SAFE extraction using safe_get()
+    return {
+        "symbol": symbol,
+        "digits": safe_get(info, "digits"),
+        "spread": safe_get(info, "spread"),
+        "volume_min": safe_get(info, "volume_min"),
+        "volume_max": safe_get(info, "volume_max"),
+        "volume_step": safe_get(info, "volume_step"),
+        "trade_contract_size": safe_get(info, "trade_contract_size"),
+        "freeze_level": safe_get(info, "freeze_level"),
+        "margin_initial": safe_get(info, "margin_initial"),
+        "margin_maintenance": safe_get(info, "margin_maintenance"),
+        "point": safe_get(info, "point"),
+        "is_tradable": safe_get(info, "trade_mode") == mt5.SYMBOL_TRADE_MODE_FULL,
+        "visible": bool(safe_get(info, "visible")),
+    }
+
+
+class SymbolScanner:
+    """
+    Symbol Scanner – X6 System
+    --------------------------
+    ✅ symbol_select + symbol_info queued on the gateway I/O thread
+    ✅ Replies turned into records by a bounded thread pool
+    ✅ Binary index cache (state/symbols.npy) with a TTL per symbol
+    ✅ Refreshes only new, expired or changed symbols
+    ✅ JSON export rewritten only when its content changed
+    """
+
+    def __init__(
+        self,
+        index_path: str = SYMBOL_INDEX_PATH,
+        ttl_sec: float = SYMBOL_CACHE_TTL_SEC,
+        workers: int = SYMBOL_SCAN_WORKERS,
+        gateway=None,
+    ):
+        self.index_path = index_path
+        self.ttl_sec = ttl_sec
+        self.workers = max(1, int(workers))
+        self.gateway = gateway if gateway is not None else get_gateway()
+
+    # ---------- ONE SYMBOL ----------
+    def _submit(self, symbol):
+        # FIFO on the I/O thread: select lands before the fresh info read
+        self.gateway.submit("symbol_select", symbol, True)
+        return symbol, self.gateway.submit("symbol_info", symbol, max_age=0)
+
+    @staticmethod
+    def _record(job):
+        symbol, fut = job
+        info = fut.result()
+        if info is None:
+            return None
+        return record_from_dict(_extract(symbol, info), time.time())
+
+    @staticmethod
+    def _changed(rec, listed) -> bool:
+        for field in _FINGERPRINT:
+            value = safe_get(listed, field)
+            if value is None:
+                continue
+            cached = rec[field].item()
+            if cached != cached or abs(float(value) - cached) > 1e-12:
+                return True
+        return False
+
+    # ---------- FULL SCAN ----------
+    def scan(self, force: bool = False) -> dict:
+        t0 = time.perf_counter()
+
+        listed = {s.name: s for s in (self.gateway.submit("symbols_get").result() or ())}
+        cached = load_index(self.index_path)
+        rows = {name: cached[i] for i, name in enumerate(cached["symbol"].tolist())}
+
+        now = time.time()
+        keep, refresh = [], []
+        for name, sym in listed.items():
+            rec = rows.get(name)
+            if (
+                force
+                or rec is None
+                or now - rec["fetched_at"] > self.ttl_sec
+                or self._changed(rec, sym)
+            ):
+                refresh.append(name)
+            else:
+                keep.append(rec)
+
+        fetched = []
+        if refresh:
+            jobs = [self._submit(name) for name in refresh]
+            with ThreadPoolExecutor(
+                max_workers=min(self.workers, len(jobs)),
+                thread_name_prefix="x6-symscan",
+            ) as pool:
+                fetched = [r for r in pool.map(self._record, jobs) if r is not None]
+
+        records = np.array(keep + fetched, dtype=SYMBOL_DTYPE)
+        removed = len(set(rows) - set(listed))
+        if fetched or removed or len(cached) == 0:
+            save_index(records, self.index_path)
+            get_symbol_index(reload=True)
+
+        return {
+            "total": len(listed),
+            "refreshed": len(fetched),
+            "cached": len(keep),
+            "removed": removed,
+            "seconds": round(time.perf_counter() - t0, 4),
+        }
 
-    if not mt5.initialize():
-        print("❌ MT5 initialization failed!")
-        return
 
-    all_symbols = mt5.symbols_get()
-    print(f"✅ Total symbols found: {len(all_symbols)}")
+def export_json(output_file="symbols.json", index_path=SYMBOL_INDEX_PATH) -> bool:
+    """
+    Visible symbols in the historical symbols.json format. The file is
+    rewritten only when the content differs. Returns True if written.
+    """
+    records = load_index(index_path)
+    results = [record_to_dict(r) for r in records if r["visible"]]
+    body = json.dumps(results, indent=4, ensure_ascii=False)
 
-    results = []
+    try:
+        with open(output_file, "r", encoding="utf-8") as f:
+            if f.read() == body:
+                return False
+    except OSError:
+        pass
 
-    for sym in all_symbols:
-        symbol = sym.name
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write(body)
+    return True
 
-        # Select symbol
-        mt5.symbol_select(symbol, True)
 
-        info = mt5.symbol_info(symbol)
-        if info is None:
-            continue
-
-        if not info.visible:
-            continue
-
-        # SAFE extraction using safe_get()
-        data = {
-            "symbol": symbol,
-            "digits": safe_get(info, "digits"),
-            "spread": safe_get(info, "spread"),
-            "volume_min": safe_get(info, "volume_min"),
-            "volume_max": safe_get(info, "volume_max"),
-            "volume_step": safe_get(info, "volume_step"),
-            "trade_contract_size": safe_get(info, "trade_contract_size"),
-            "freeze_level": safe_get(info, "freeze_level"),
-            "margin_initial": safe_get(info, "margin_initial"),
-            "margin_maintenance": safe_get(info, "margin_maintenance"),
-            "point": safe_get(info, "point"),
-            "is_tradable": safe_get(info, "trade_mode") == mt5.SYMBOL_TRADE_MODE_FULL,
-        }
+def scan_symbols(output_file="symbols.json", force=False):
+    log.info("✅ Initializing MT5 Connection...")
 
-        results.append(data)
+    session = get_session()
+    if not session.initialize():
+        log.error("❌ MT5 initialization failed!")
+        return
 
-    # Save results
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=4, ensure_ascii=False)
+    stats = SymbolScanner().scan(force=force)
+    log.info(
+        "✅ Total symbols found: %d (refreshed %d, cached %d, removed %d) in %.3fs",
+        stats["total"], stats["refreshed"], stats["cached"], stats["removed"], stats["seconds"],
+    )
 
-    print(f"✅ Scan complete! Saved to {output_file}")
-    mt5.shutdown()
+    if output_file and export_json(output_file):
+        log.info("✅ Scan complete! Saved to %s", output_file)
+    else:
+        log.info("✅ Scan complete! %s unchanged", output_file)
+    session.shutdown()
+    return stats
 
 
 def main():
-    print("🔍 Running Symbol Scanner...")
+    log.info("🔍 Running Symbol Scanner...")
     scan_symbols()
 
 
@@ -1 +1,331 @@
-# feature_engineering.py
+# ai/feature_engineering.py
+
+import numpy as np
+
+from core.rolling_stats import RollingSum
+
+
+# ==================================================
+# INCREMENTAL FEATURE KERNELS (O(1) PER BAR)
+# ==================================================
+class _RollingMean:
+    """
+    Running sum over the last `window` values (NaN until full,
+    same warm‑up as pandas rolling(window).mean()).
+    """
+
+    def __init__(self, window: int):
+        self.window = int(window)
+        self._sum = RollingSum(self.window)
+
+    def push(self, x: float) -> float:
+        total = self._sum.push(x)
+        if not self._sum.full:
+            return np.nan
+        return total / self.window
+
+
+class ReturnFeature:
+    """close / prev_close − 1 (pct_change)"""
+
+    def __init__(self):
+        self._prev = None
+
+    def update(self, o, h, l, c, v) -> float:
+        prev, self._prev = self._prev, c
+        if prev is None or prev == 0.0:
+            return np.nan
+        return c / prev - 1.0
+
+
+class VWAPDevFeature:
+    """
+    (close − vwap) / vwap, vwap over the last `window` bars
+    (NaN until full; window=None → cumulative from the first
+    ingested bar).
+    """
+
+    def __init__(self, window: int = None):
+        self.window = window
+        if window:
+            self._pv = RollingSum(window)
+            self._vol = RollingSum(window)
+        self._pv_sum = 0.0
+        self._vol_sum = 0.0
+
+    def update(self, o, h, l, c, v) -> float:
+        pv = (h + l + c) / 3.0 * v
+
+        if self.window:
+            self._pv_sum = self._pv.push(pv)
+            self._vol_sum = self._vol.push(v)
+            if not self._vol.full:
+                return np.nan
+        else:
+            self._pv_sum += pv
+            self._vol_sum += v
+
+        if self._vol_sum <= 0.0:
+            return np.nan
+        vwap = self._pv_sum / self._vol_sum
+        return (c - vwap) / vwap
+
+
+class VolWeightFeature:
+    """volume / rolling mean volume"""
+
+    def __init__(self, window: int = 20):
+        self._mean = _RollingMean(window)
+
+    def update(self, o, h, l, c, v) -> float:
+        mean = self._mean.push(v)
+        if not mean > 0.0:
+            return np.nan
+        return v / mean
+
+
+class BarRangeFeature:
+    """high − low"""
+
+    def update(self, o, h, l, c, v) -> float:
+        return h - l
+
+
+class AvgRangeFeature:
+    """rolling mean of high − low"""
+
+    def __init__(self, window: int = 20):
+        self._mean = _RollingMean(window)
+
+    def update(self, o, h, l, c, v) -> float:
+        return self._mean.push(h - l)
+
+
+class ATRFeature:
+    """rolling mean of the true range"""
+
+    def __init__(self, window: int = 14):
+        self._mean = _RollingMean(window)
+        self._prev_close = None
+
+    def update(self, o, h, l, c, v) -> float:
+        tr = h - l
+        if self._prev_close is not None:
+            tr = max(tr, abs(h - self._prev_close), abs(l - self._prev_close))
+        self._prev_close = c
+        return self._mean.push(tr)
+
+
+FEATURES = {
+    "return": ReturnFeature,
+    "vwap_dev": VWAPDevFeature,
+    "vol_weight": VolWeightFeature,
+    "bar_range": BarRangeFeature,
+    "avg_range": AvgRangeFeature,
+    "atr": ATRFeature,
+}
+
+
+def feature_key(name: str, params: dict = None) -> tuple:
+    return name, tuple(sorted((params or {}).items()))
+
+
+# ==================================================
+# PER (SYMBOL, TIMEFRAME) SERIES
+# ==================================================
+class _FeatureSeries:
+    """
+    Mirrored ring buffer: every row is written twice (slot, slot + cap),
+    so the last n rows are always one contiguous slice → zero‑copy view.
+    """
+
+    def __init__(self, capacity: int, dtype):
+        self.capacity = capacity
+        self.dtype = dtype
+
+        self.keys = []
+        self.columns = {}         # feature key → column index
+        self.kernels = []
+
+        self.buffer = np.full((2 * capacity, 0), np.nan, dtype=dtype)
+        self.times = np.zeros(2 * capacity, dtype=np.int64)   # bar times (ns)
+        self.count = 0
+        self.last_time = None
+
+    def add(self, key, kernel) -> int:
+        col = self.columns.get(key)
+        if col is not None:
+            return col
+
+        col = len(self.keys)
+        self.keys.append(key)
+        self.columns[key] = col
+        self.kernels.append(kernel)
+
+        # Late declaration → NaN history for the new column
+        extra = np.full((2 * self.capacity, 1), np.nan, dtype=self.dtype)
+        self.buffer = np.concatenate((self.buffer, extra), axis=1)
+        return col
+
+    def push(self, o, h, l, c, v):
+        slot = self.count % self.capacity
+        row = self.buffer[slot]
+        for col, kernel in enumerate(self.kernels):
+            row[col] = kernel.update(o, h, l, c, v)
+        self.buffer[slot + self.capacity] = row
+        self.count += 1
+
+    def set_times(self, times):
+        """Times of the len(times) rows just pushed (mirrored)."""
+        times = times[-self.capacity:]
+        slots = np.arange(self.count - len(times), self.count) % self.capacity
+        self.times[slots] = times
+        self.times[slots + self.capacity] = times
+
+    def _span(self, n: int):
+        available = min(self.count, self.capacity)
+        n = available if n is None else min(int(n), available)
+        end = (self.count - 1) % self.capacity + self.capacity + 1
+        return end - max(n, 0), end
+
+    def view(self, cols: slice, n: int):
+        start, end = self._span(n)
+        if start >= end:
+            return self.buffer[0:0, cols]
+        return self.buffer[start:end, cols]
+
+    def time_view(self, n: int):
+        start, end = self._span(n)
+        if start >= end:
+            return self.times[0:0]
+        return self.times[start:end]
+
+
+class FeatureStore:
+    """
+    Feature Store – X6 System
+    -------------------------
+    ✅ Features declared once, cached by (symbol, timeframe, feature, params)
+    ✅ Computed incrementally, once per CLOSED bar (O(1) kernels)
+    ✅ Preallocated float64 / float32 columns
+    ✅ Zero‑copy windows (mirrored ring buffer)
+
+    Usage:
+        store = FeatureStore()
+        store.declare("BTCUSD", tf, "vwap_dev", window=2000)
+        store.declare("BTCUSD", tf, "vol_weight", window=20)
+        store.ingest("BTCUSD", tf, df)       # new closed bars only
+        X = store.window("BTCUSD", tf, [("vwap_dev", {"window": 2000}),
+                                        ("vol_weight", {"window": 20})])
+    """
+
+    def __init__(self, capacity: int = 4096, dtype=np.float64):
+        self.capacity = int(capacity)
+        self.dtype = np.dtype(dtype)
+        self._series = {}
+
+    # ==================================================
+    # DECLARE
+    # ==================================================
+    def declare(self, symbol, timeframe, name: str, **params) -> int:
+        """
+        Register a feature (idempotent). Returns its column index.
+        """
+        if name not in FEATURES:
+            raise KeyError(f"Unknown feature: {name}")
+
+        series = self._series.get((symbol, timeframe))
+        if series is None:
+            series = self._series[(symbol, timeframe)] = _FeatureSeries(
+                self.capacity, self.dtype
+            )
+
+        key = feature_key(name, params)
+        if key in series.columns:
+            return series.columns[key]
+        return series.add(key, FEATURES[name](**params))
+
+    # ==================================================
+    # INGEST
+    # ==================================================
+    def ingest(self, symbol, timeframe, df, closed_only: bool = True) -> int:
+        """
+        Feed a bar window (DataFrame with time index or "time" column).
+        Only bars newer than the last ingested one are processed; the
+        last (forming) bar is skipped when closed_only. Returns the
+        number of new bars.
+        """
+        series = self._series.get((symbol, timeframe))
+        if series is None or df is None or len(df) == 0:
+            return 0
+
+        if "time" in df.columns:
+            times = df["time"].to_numpy().astype("datetime64[ns]").astype(np.int64)
+        else:
+            times = df.index.to_numpy().astype("datetime64[ns]").astype(np.int64)
+
+        stop = len(times) - 1 if closed_only else len(times)
+        start = 0
+        if series.last_time is not None:
+            start = int(np.searchsorted(times[:stop], series.last_time, side="right"))
+        if start >= stop:
+            return 0
+
+        o = df["open"].to_numpy(dtype=np.float64)[start:stop]
+        h = df["high"].to_numpy(dtype=np.float64)[start:stop]
+        l = df["low"].to_numpy(dtype=np.float64)[start:stop]
+        c = df["close"].to_numpy(dtype=np.float64)[start:stop]
+        v = df["tick_volume"].to_numpy(dtype=np.float64)[start:stop]
+
+        push = series.push
+        for row in zip(o.tolist(), h.tolist(), l.tolist(), c.tolist(), v.tolist()):
+            push(*row)
+
+        series.set_times(times[start:stop])
+        series.last_time = int(times[stop - 1])
+        return stop - start
+
+    # ==================================================
+    # READ (ZERO‑COPY WHEN COLUMNS ARE ADJACENT)
+    # ==================================================
+    def window(self, symbol, timeframe, features, n: int = None):
+        """
+        features : "name" | ("name", params) | list of those
+        n        : last n closed bars (None → all buffered)
+
+        A single feature → 1‑D view. Several features declared
+        consecutively → 2‑D view; otherwise a copy.
+        """
+        series = self._series[(symbol, timeframe)]
+
+        single = isinstance(features, str) or (
+            isinstance(features, tuple) and len(features) == 2
+            and isinstance(features[1], dict)
+        )
+        specs = [features] if single else list(features)
+
+        cols = []
+        for spec in specs:
+            name, params = (spec, {}) if isinstance(spec, str) else spec
+            cols.append(series.columns[feature_key(name, params)])
+
+        if single:
+            return series.view(cols[0], n)
+
+        first = cols[0]
+        if cols == list(range(first, first + len(cols))):
+            return series.view(slice(first, first + len(cols)), n)
+        return series.view(slice(None), n)[:, cols]
+
+    def count(self, symbol, timeframe) -> int:
+        series = self._series.get((symbol, timeframe))
+        return 0 if series is None else min(series.count, series.capacity)
+
+    def times(self, symbol, timeframe, n: int = None):
+        """Bar times (ns since epoch) aligned with window(..., n)."""
+        return self._series[(symbol, timeframe)].time_view(n)
+
+    def last_time(self, symbol, timeframe):
+        """Last ingested closed bar time (ns since epoch) or None."""
+        series = self._series.get((symbol, timeframe))
+        return None if series is None else series.last_time
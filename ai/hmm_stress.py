@@ -1,7 +1,6 @@
 # ai/hmm_stress.py
 
 import numpy as np
-from hmmlearn.hmm import GaussianHMM
 
 
 class HMMStressDetector:
@@ -13,15 +12,28 @@ class HMMStressDetector:
     """
 
     def __init__(self, n_states: int = 2, min_obs: int = 50):
-        self.model = GaussianHMM(
-            n_components=n_states,
-            covariance_type="diag",
-            n_iter=200,
-            random_state=42,
-        )
+        self.n_states = n_states
         self.min_obs = min_obs
+        self._model = None
         self._trained = False
 
+    @property
+    def model(self):
+        """
+        GaussianHMM built on first use – hmmlearn (and through it
+        scikit‑learn / scipy) is only imported when stress is needed.
+        """
+        if self._model is None:
+            from hmmlearn.hmm import GaussianHMM
+
+            self._model = GaussianHMM(
+                n_components=self.n_states,
+                covariance_type="diag",
+                n_iter=200,
+                random_state=42,
+            )
+        return self._model
+
     def detect(self, X: np.ndarray) -> float:
         """
         Parameters
@@ -67,3 +79,31 @@ class HMMStressDetector:
         except Exception:
             # Hard safety — never crash Orchestrator
             return 0.0
+
+    # ==================================================
+    # CHECKPOINT (hot restart – skips the first‑tick fit)
+    # ==================================================
+    def get_state(self) -> dict:
+        if not self._trained:
+            return {"trained": False}
+
+        return {
+            "trained": True,
+            "n_features": int(self.model.n_features),
+            "startprob": np.asarray(self.model.startprob_),
+            "transmat": np.asarray(self.model.transmat_),
+            "means": np.asarray(self.model.means_),
+            "covars": np.asarray(self.model._covars_),
+        }
+
+    def set_state(self, state: dict):
+        if not state.get("trained", False):
+            self._trained = False
+            return
+
+        self.model.n_features = int(state["n_features"])
+        self.model.startprob_ = state["startprob"]
+        self.model.transmat_ = state["transmat"]
+        self.model.means_ = state["means"]
+        self.model._covars_ = state["covars"]
+        self._trained = True
@@ -1 +1,343 @@
-# online_model.py
+# ai/online_model.py
+
+import glob
+import os
+import re
+
+import numpy as np
+
+
+# ==================================================
+# ONLINE STANDARDIZATION (WELFORD, O(d))
+# ==================================================
+class RunningScaler:
+    def __init__(self, n_features: int):
+        self.n = 0
+        self.mean = np.zeros(n_features)
+        self.m2 = np.zeros(n_features)
+
+    def update(self, x: np.ndarray):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    def update_batch(self, X: np.ndarray):
+        """
+        Merge a whole block at once (Chan et al. parallel variance).
+        """
+        X = np.asarray(X, dtype=float)
+        if len(X) == 0:
+            return
+        n_b = len(X)
+        mean_b = X.mean(axis=0)
+        m2_b = ((X - mean_b) ** 2).sum(axis=0)
+
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.mean = self.mean + delta * n_b / n
+        self.m2 = self.m2 + m2_b + delta ** 2 * self.n * n_b / n
+        self.n = n
+
+    def transform(self, x: np.ndarray) -> np.ndarray:
+        if self.n < 2:
+            return x - self.mean
+        std = np.sqrt(self.m2 / (self.n - 1))
+        return (x - self.mean) / np.where(std > 0.0, std, 1.0)
+
+    def get_state(self) -> dict:
+        return {"n": self.n, "mean": self.mean.copy(), "m2": self.m2.copy()}
+
+    def set_state(self, state: dict):
+        self.n = int(state["n"])
+        self.mean = np.asarray(state["mean"], dtype=float).copy()
+        self.m2 = np.asarray(state["m2"], dtype=float).copy()
+
+
+class _OnlineModel:
+    """
+    Shared plumbing: scaler, bookkeeping, versioned state.
+    """
+
+    KIND = "base"
+
+    def __init__(self, n_features: int, standardize: bool = True):
+        self.n_features = int(n_features)
+        self.standardize = standardize
+        self.scaler = RunningScaler(self.n_features)
+        self.n_updates = 0
+        self.version = 0
+
+    def _prepare(self, x, learn: bool) -> np.ndarray:
+        x = np.asarray(x, dtype=float)
+        if not self.standardize:
+            return x
+        if learn:
+            self.scaler.update(x)
+        return self.scaler.transform(x)
+
+    # ---------- CHECKPOINT ----------
+    def get_state(self) -> dict:
+        return {
+            "kind": self.KIND,
+            "n_features": self.n_features,
+            "n_updates": self.n_updates,
+            "version": self.version,
+            "scaler": self.scaler.get_state(),
+            "params": self._get_params(),
+        }
+
+    def set_state(self, state: dict):
+        if not state:
+            return
+        if state.get("kind") != self.KIND or state.get("n_features") != self.n_features:
+            raise ValueError(
+                f"Incompatible {self.KIND} state "
+                f"({state.get('kind')}, d={state.get('n_features')})"
+            )
+        self.n_updates = int(state["n_updates"])
+        self.version = int(state["version"])
+        self.scaler.set_state(state["scaler"])
+        self._set_params(state["params"])
+
+
+class RecursiveLeastSquares(_OnlineModel):
+    """
+    Recursive Least Squares – X6 System
+    -----------------------------------
+    ✅ Exact online linear regression, O(d²) per update
+    ✅ Forgetting factor lam (1.0 = no forgetting)
+    """
+
+    KIND = "rls"
+
+    def __init__(self, n_features: int, lam: float = 0.999, delta: float = 100.0,
+                 standardize: bool = True):
+        super().__init__(n_features, standardize)
+        self.lam = lam
+        self.delta = delta
+
+        d = self.n_features + 1           # + intercept
+        self.w = np.zeros(d)
+        self.P = np.eye(d) * delta
+
+    def predict(self, x) -> float:
+        z = np.append(self._prepare(x, learn=False), 1.0)
+        return float(z @ self.w)
+
+    def update(self, x, y: float) -> float:
+        """
+        Returns the a‑priori error (y − prediction).
+        """
+        z = np.append(self._prepare(x, learn=True), 1.0)
+        Pz = self.P @ z
+        k = Pz / (self.lam + z @ Pz)
+        err = float(y - z @ self.w)
+
+        self.w += k * err
+        self.P = (self.P - np.outer(k, Pz)) / self.lam
+        self.n_updates += 1
+        return err
+
+    def partial_fit_batch(self, X, y, batch_size: int = 256):
+        """
+        Replay a history block (RLS is sequential → row by row).
+        """
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        for i in range(len(X)):
+            self.update(X[i], y[i])
+        return self
+
+    def _get_params(self):
+        return {"w": self.w.copy(), "P": self.P.copy(), "lam": self.lam}
+
+    def _set_params(self, params):
+        self.w = np.asarray(params["w"], dtype=float).copy()
+        self.P = np.asarray(params["P"], dtype=float).copy()
+        self.lam = float(params["lam"])
+
+
+class OnlineLogisticRegression(_OnlineModel):
+    """
+    Online Logistic Regression (SGD) – X6 System
+    --------------------------------------------
+    ✅ O(d) per update
+    ✅ L2 regularization, decaying step size
+    ✅ Vectorized mini‑batch replay for backtests
+    """
+
+    KIND = "logit_sgd"
+
+    def __init__(self, n_features: int, lr: float = 0.05, l2: float = 1e-4,
+                 decay: float = 1e-4, standardize: bool = True):
+        super().__init__(n_features, standardize)
+        self.lr = lr
+        self.l2 = l2
+        self.decay = decay
+
+        self.w = np.zeros(self.n_features)
+        self.b = 0.0
+
+    @staticmethod
+    def _sigmoid(z):
+        return 1.0 / (1.0 + np.exp(-np.clip(z, -30.0, 30.0)))
+
+    def _step(self) -> float:
+        return self.lr / (1.0 + self.decay * self.n_updates)
+
+    def predict_proba(self, x) -> float:
+        z = self._prepare(x, learn=False)
+        return float(self._sigmoid(z @ self.w + self.b))
+
+    def update(self, x, y: float) -> float:
+        """
+        y ∈ {0, 1}. Returns the a‑priori probability.
+        """
+        z = self._prepare(x, learn=True)
+        p = float(self._sigmoid(z @ self.w + self.b))
+        g = p - y
+
+        step = self._step()
+        self.w -= step * (g * z + self.l2 * self.w)
+        self.b -= step * g
+        self.n_updates += 1
+        return p
+
+    def partial_fit_batch(self, X, y, batch_size: int = 256):
+        """
+        Mini‑batch replay: one vectorized gradient step per batch.
+        """
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+
+        for start in range(0, len(X), batch_size):
+            xb = X[start:start + batch_size]
+            yb = y[start:start + batch_size]
+
+            if self.standardize:
+                self.scaler.update_batch(xb)
+                xb = self.scaler.transform(xb)
+
+            g = self._sigmoid(xb @ self.w + self.b) - yb
+            step = self._step()
+            self.w -= step * (xb.T @ g / len(xb) + self.l2 * self.w)
+            self.b -= step * float(g.mean())
+            self.n_updates += len(xb)
+
+        return self
+
+    def _get_params(self):
+        return {"w": self.w.copy(), "b": self.b}
+
+    def _set_params(self, params):
+        self.w = np.asarray(params["w"], dtype=float).copy()
+        self.b = float(params["b"])
+
+
+# ==================================================
+# VERSIONED SNAPSHOTS
+# ==================================================
+class ModelSnapshotStore:
+    """
+    <directory>/<name>_v000001.npz, one file per published version.
+    """
+
+    def __init__(self, directory: str, name: str = "edge_model", keep: int = 20):
+        self.directory = directory
+        self.name = name
+        self.keep = keep
+
+    def _path(self, version: int) -> str:
+        return os.path.join(self.directory, f"{self.name}_v{version:06d}.npz")
+
+    def versions(self) -> list:
+        pattern = re.compile(rf"{re.escape(self.name)}_v(\d+)\.npz$")
+        found = []
+        for path in glob.glob(os.path.join(self.directory, f"{self.name}_v*.npz")):
+            m = pattern.search(path)
+            if m:
+                found.append(int(m.group(1)))
+        return sorted(found)
+
+    def save(self, model: _OnlineModel) -> int:
+        os.makedirs(self.directory, exist_ok=True)
+
+        model.version = (self.versions() or [0])[-1] + 1
+        path = self._path(model.version)
+        tmp = path + ".tmp.npz"
+        np.savez(tmp, state=np.array(model.get_state(), dtype=object))
+        os.replace(tmp, path)
+
+        for old in self.versions()[:-self.keep]:
+            os.remove(self._path(old))
+        return model.version
+
+    def load(self, model: _OnlineModel, version: int = None) -> bool:
+        versions = self.versions()
+        if not versions:
+            return False
+        version = versions[-1] if version is None else version
+
+        with np.load(self._path(version), allow_pickle=True) as data:
+            model.set_state(data["state"].item())
+        return True
+
+
+class EdgeModel:
+    """
+    Edge Score – X6 System
+    ----------------------
+    Learns P(next closed bar return > 0) from feature‑store vectors.
+    edge ∈ [−1, +1] = 2·p − 1 (0 = no edge).
+
+    ✅ One O(d) update per closed bar (label arrives one bar later)
+    ✅ History replay only when the model is fresh
+    """
+
+    def __init__(self, n_features: int, model: OnlineLogisticRegression = None):
+        self.model = model or OnlineLogisticRegression(n_features)
+        self._pending = None
+        self.edge = 0.0
+
+    def warm_start(self, X, returns):
+        """
+        X[t] → label returns[t + 1] > 0 (history replay, fresh model only).
+        """
+        if self.model.n_updates > 0 or len(X) < 2:
+            return
+        X = np.asarray(X, dtype=float)
+        y = (np.asarray(returns, dtype=float)[1:] > 0.0).astype(float)
+        mask = np.isfinite(X[:-1]).all(axis=1) & np.isfinite(y)
+        self.model.partial_fit_batch(X[:-1][mask], y[mask])
+
+    def on_bar(self, x, bar_return: float) -> float:
+        """
+        x          : feature vector of the bar that just closed
+        bar_return : that bar's return (labels the previous vector)
+        """
+        x = np.asarray(x, dtype=float)
+
+        if self._pending is not None and np.isfinite(bar_return):
+            self.model.update(self._pending, 1.0 if bar_return > 0.0 else 0.0)
+
+        if np.isfinite(x).all():
+            self._pending = x.copy()
+            self.edge = 2.0 * self.model.predict_proba(x) - 1.0
+        return self.edge
+
+    # ---------- CHECKPOINT ----------
+    def get_state(self) -> dict:
+        return {
+            "model": self.model.get_state(),
+            "pending": None if self._pending is None else self._pending.copy(),
+            "edge": self.edge,
+        }
+
+    def set_state(self, state: dict):
+        if not state:
+            return
+        self.model.set_state(state.get("model", {}))
+        pending = state.get("pending")
+        self._pending = None if pending is None else np.asarray(pending, dtype=float)
+        self.edge = float(state.get("edge", 0.0))
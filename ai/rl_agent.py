@@ -1 +1,214 @@
-# rl_agent.py
+# ai/rl_agent.py
+
+import numpy as np
+
+from ai.online_model import RunningScaler
+
+
+class ReplayBuffer:
+    """
+    Experience Replay – preallocated ring arrays
+    --------------------------------------------
+    ✅ Fixed memory (capacity × n_features), no per‑step allocation
+    ✅ Vectorized sampling
+    """
+
+    def __init__(self, capacity: int, n_features: int, dtype=np.float32):
+        self.capacity = int(capacity)
+        self.states = np.zeros((self.capacity, n_features), dtype=dtype)
+        self.next_states = np.zeros((self.capacity, n_features), dtype=dtype)
+        self.actions = np.zeros(self.capacity, dtype=np.int16)
+        self.rewards = np.zeros(self.capacity, dtype=np.float32)
+        self.dones = np.zeros(self.capacity, dtype=np.bool_)
+
+        self.size = 0
+        self._pos = 0
+
+    def push(self, state, action: int, reward: float, next_state, done: bool):
+        i = self._pos
+        self.states[i] = state
+        self.next_states[i] = next_state
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.dones[i] = done
+
+        self._pos = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def sample(self, batch_size: int, rng: np.random.Generator):
+        idx = rng.integers(0, self.size, size=batch_size)
+        return (
+            self.states[idx],
+            self.actions[idx],
+            self.rewards[idx],
+            self.next_states[idx],
+            self.dones[idx],
+        )
+
+
+class RLAgent:
+    """
+    Linear Q‑Learning Agent – X6 System
+    -----------------------------------
+    Q(s, a) = W[a] · [z(s), 1],   z = online‑standardized features
+
+    ✅ Generalizes across states (no per‑state table)
+    ✅ Bounded memory: W (A × d) + fixed replay buffer
+    ✅ Vectorized mini‑batch TD updates
+    ✅ Offline training over history arrays (train_offline)
+    """
+
+    ACTIONS = ("BUY", "SELL", "HOLD")
+
+    def __init__(
+        self,
+        n_features: int,
+        actions=ACTIONS,
+        learning_rate: float = 0.01,
+        discount_factor: float = 0.9,
+        epsilon: float = 0.05,
+        replay_capacity: int = 50_000,
+        batch_size: int = 64,
+        train_every: int = 1,
+        clip: float = 5.0,
+        seed: int = 42,
+    ):
+        self.n_features = int(n_features)
+        self.actions = tuple(actions)
+        self._action_index = {a: i for i, a in enumerate(self.actions)}
+
+        self.lr = learning_rate
+        self.gamma = discount_factor
+        self.epsilon = epsilon
+        self.batch_size = batch_size
+        self.train_every = train_every
+        self.clip = clip
+
+        self.W = np.zeros((len(self.actions), self.n_features + 1))
+        self.scaler = RunningScaler(self.n_features)
+        self.replay = ReplayBuffer(replay_capacity, self.n_features)
+        self.rng = np.random.default_rng(seed)
+
+        self.steps = 0
+        self.updates = 0
+
+    # ==================================================
+    # FEATURES
+    # ==================================================
+    def _phi(self, X: np.ndarray) -> np.ndarray:
+        """
+        (n, d) raw → (n, d + 1) standardized + bias, clipped.
+        """
+        Z = np.clip(self.scaler.transform(X), -self.clip, self.clip)
+        return np.concatenate((Z, np.ones((len(Z), 1))), axis=1)
+
+    # ==================================================
+    # POLICY
+    # ==================================================
+    def q_values(self, state) -> np.ndarray:
+        x = np.asarray(state, dtype=float).reshape(1, -1)
+        return (self._phi(x) @ self.W.T)[0]
+
+    def act(self, state, greedy: bool = False) -> str:
+        if not greedy and self.rng.random() < self.epsilon:
+            return self.actions[self.rng.integers(len(self.actions))]
+        return self.actions[int(np.argmax(self.q_values(state)))]
+
+    # ==================================================
+    # LEARNING
+    # ==================================================
+    def observe(self, state, action: str, reward: float, next_state, done: bool = False):
+        """
+        Store one transition; train one mini‑batch every `train_every` steps.
+        """
+        state = np.asarray(state, dtype=float)
+        self.scaler.update(state)
+        self.replay.push(state, self._action_index[action], reward, next_state, done)
+        self.steps += 1
+
+        if (
+            self.replay.size >= self.batch_size
+            and self.steps % self.train_every == 0
+        ):
+            self.update_batch(*self.replay.sample(self.batch_size, self.rng))
+
+    def update_batch(self, states, actions, rewards, next_states, dones) -> float:
+        """
+        One vectorized semi‑gradient Q‑learning step. Returns mean |TD|.
+        """
+        phi = self._phi(np.asarray(states, dtype=float))
+        phi_next = self._phi(np.asarray(next_states, dtype=float))
+        actions = np.asarray(actions, dtype=np.intp)
+
+        q_next = (phi_next @ self.W.T).max(axis=1)
+        target = rewards + self.gamma * q_next * (1.0 - dones)
+        q_sa = np.einsum("ij,ij->i", phi, self.W[actions])
+        td = target - q_sa
+
+        grad = np.zeros_like(self.W)
+        np.add.at(grad, actions, td[:, None] * phi)
+        self.W += self.lr * grad / len(td)
+
+        self.updates += 1
+        return float(np.abs(td).mean())
+
+    def train_offline(
+        self,
+        states,
+        actions,
+        rewards,
+        next_states,
+        dones=None,
+        epochs: int = 1,
+        batch_size: int = 1024,
+    ) -> float:
+        """
+        High‑throughput training over history arrays (no replay buffer).
+        actions: action names or indices.
+        """
+        states = np.asarray(states, dtype=float)
+        next_states = np.asarray(next_states, dtype=float)
+        rewards = np.asarray(rewards, dtype=float)
+        dones = (
+            np.zeros(len(states), dtype=bool) if dones is None
+            else np.asarray(dones, dtype=bool)
+        )
+        actions = np.asarray(actions)
+        if actions.dtype.kind in "US":
+            actions = np.array([self._action_index[a] for a in actions])
+
+        self.scaler.update_batch(states)
+
+        td = 0.0
+        n = len(states)
+        for _ in range(epochs):
+            order = self.rng.permutation(n)
+            for start in range(0, n, batch_size):
+                idx = order[start:start + batch_size]
+                td = self.update_batch(
+                    states[idx], actions[idx], rewards[idx],
+                    next_states[idx], dones[idx],
+                )
+        return td
+
+    # ==================================================
+    # CHECKPOINT (replay buffer is not persisted)
+    # ==================================================
+    def get_state(self) -> dict:
+        return {
+            "actions": self.actions,
+            "W": self.W.copy(),
+            "scaler": self.scaler.get_state(),
+            "steps": self.steps,
+            "updates": self.updates,
+        }
+
+    def set_state(self, state: dict):
+        if not state:
+            return
+        if tuple(state["actions"]) != self.actions or state["W"].shape != self.W.shape:
+            raise ValueError("Incompatible RLAgent state")
+        self.W = np.asarray(state["W"], dtype=float).copy()
+        self.scaler.set_state(state["scaler"])
+        self.steps = int(state.get("steps", 0))
+        self.updates = int(state.get("updates", 0))
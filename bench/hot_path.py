@@ -0,0 +1,488 @@
+# =====================================================
+# bench/hot_path.py
+# HOT‑PATH ENGINE BENCHMARKS (ops/s + allocations)
+# =====================================================
+#
+# Runs every hot‑path engine on the same bars (synthetic from the
+# MT5 simulator, or the last window of a recorded session) and
+# reports ops/s plus tracemalloc allocations per call.
+#
+#   python bench/hot_path.py
+#   python bench/hot_path.py --save                 # bench/results/<HEAD>.json
+#   python bench/hot_path.py --compare HEAD~1       # exit 1 on regression
+#   python bench/hot_path.py --session state/live.x6rs --only vwap
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+# Deterministic, quiet engines (must precede project imports)
+os.environ.setdefault("MT5_BACKEND", "SIM")
+os.environ.setdefault("WARMUP_MODE", "0")
+os.environ.setdefault("PROFILE_STAGES", "0")
+
+import numpy as np
+
+RESULTS_DIR = os.path.join(PROJECT_ROOT, "bench", "results")
+
+SIM_SYMBOL = "BTCUSD"
+SIM_TIME = 1_750_000_000
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """
+    Register setup(bars) → zero‑argument callable to time.
+    """
+    def wrap(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return wrap
+
+
+# ==================================================
+# INPUT BARS
+# ==================================================
+def synthetic_bars(count: int):
+    import pandas as pd
+    from core import mt5_sim
+
+    mt5_sim.sim_reset()
+    mt5_sim.sim_set_time(SIM_TIME)
+    rates = mt5_sim.copy_rates_from_pos(
+        SIM_SYMBOL, mt5_sim.TIMEFRAME_M1, 0, count
+    )
+
+    df = pd.DataFrame(rates)
+    df["time"] = pd.to_datetime(df["time"], unit="s")
+    df.set_index("time", inplace=True)
+    return df
+
+
+def session_bars(path: str):
+    from bt.session_replay_feed import SessionReplayFeed
+
+    feed = SessionReplayFeed(path).load()
+    df = None
+    while feed.step():
+        window = feed.get_data()
+        if window is not None:
+            df = window
+
+    if df is None:
+        raise RuntimeError(f"No bars recorded in {path}")
+    if "time" in df.columns:
+        df = df.set_index("time")
+    return df
+
+
+# ==================================================
+# BENCHMARKS
+# ==================================================
+@benchmark("vwap_engine.compute")
+def _vwap_compute(bars):
+    from core.vwap_engine import VWAPEngine
+
+    engine = VWAPEngine()
+    return lambda: engine.compute(bars)
+
+
+@benchmark("vwap_engine_stream.step")
+def _vwap_stream_step(bars):
+    from core.vwap_engine_stream import VWAPEngine
+
+    engine = VWAPEngine()
+    engine.warmup(bars)
+    n = len(bars)
+    cursor = [0]
+
+    def run():
+        i = cursor[0]
+        engine.step(i)
+        engine.snapshot(i)
+        cursor[0] = i + 1 if i + 1 < n else 0
+
+    return run
+
+
+@benchmark("vwap_multi_anchor.compute")
+def _vwap_multi_compute(bars):
+    from core.vwap_multi_anchor import MultiAnchorVWAP
+
+    engine = MultiAnchorVWAP()
+    return lambda: engine.compute_frame(bars)
+
+
+@benchmark("vwap_multi_anchor.update")
+def _vwap_multi_update(bars):
+    from core.vwap_multi_anchor import MultiAnchorVWAP
+
+    engine = MultiAnchorVWAP()
+    times = bars.index.to_numpy().astype("datetime64[s]").astype(np.int64).tolist()
+    high = bars["high"].tolist()
+    low = bars["low"].tolist()
+    close = bars["close"].tolist()
+    volume = bars["tick_volume"].astype(float).tolist()
+    n = len(bars)
+    cursor = [0]
+
+    def run():
+        i = cursor[0]
+        if i == 0:
+            engine.reset()
+        engine.update(times[i], high[i], low[i], close[i], volume[i])
+        cursor[0] = i + 1 if i + 1 < n else 0
+
+    return run
+
+
+@benchmark("hmm_stress.detect")
+def _hmm_detect(bars):
+    import hmmlearn  # noqa: F401  (skip cleanly when missing)
+    from core.vwap_engine import VWAPEngine
+    from ai.hmm_stress import HMMStressDetector
+
+    features = VWAPEngine().compute(bars)[["vwap_dev", "vol_weight"]].values
+    detector = HMMStressDetector()
+    detector.detect(features)          # one‑time fit outside the timer
+    return lambda: detector.detect(features)
+
+
+@benchmark("nds_core.evaluate")
+def _nds_evaluate(bars):
+    from core.vwap_engine import VWAPEngine
+    from nds.nds_core import NDSCore
+
+    last = VWAPEngine().compute(bars).iloc[-1]
+    context = {
+        "vwap_dev": float(last["vwap_dev"]),
+        "bar_range": float(last["bar_range"]),
+        "avg_range": float(last["avg_range"]),
+        "atr": float(last["atr"]),
+        "vol_weight": float(last["vol_weight"]),
+        "stress": 0.2,
+        "regime": "TREND",
+        "volatility_norm": 0.5,
+    }
+    nds = NDSCore()
+    return lambda: nds.evaluate(context)
+
+
+@benchmark("execution_gate.send")
+def _gate_send(bars):
+    import contextlib
+    import io
+
+    from execution.execution_gate import ExecutionGate
+    from execution.execution_intent import ExecutionIntent
+    from execution.mock_execution_adapter import MockExecutionAdapter
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        gate = ExecutionGate(
+            adapter=MockExecutionAdapter(simulated_latency_ms=0)
+        )
+
+    prices = bars["close"].to_numpy(dtype=float)
+    cursor = [0]
+
+    def run():
+        i = cursor[0]
+        cursor[0] = (i + 1) % len(prices)
+        gate.send(ExecutionIntent(
+            symbol=SIM_SYMBOL,
+            side="BUY",
+            size=0.1,
+            limit_price=float(prices[i]),
+            stop_price=float(prices[i]) * 0.99,
+        ))
+
+    return run
+
+
+@benchmark("trade_ledger.cycle")
+def _ledger_cycle(bars):
+    from core.trade_ledger import TradeLedger
+
+    ledger = TradeLedger()
+    prices = bars["close"].to_numpy(dtype=float)
+    cursor = [0]
+
+    def run():
+        i = cursor[0]
+        cursor[0] = (i + 1) % len(prices)
+        p = float(prices[i])
+
+        if len(ledger.closed_trades) >= 10_000:
+            ledger.reset()
+
+        ledger.open("LONG", p, p * 0.999, 0.1, i)
+        if ledger.check_stop(p * 0.998, i + 1) is None:
+            ledger.close(p, i + 1)
+
+    return run
+
+
+@benchmark("fractal_engine.update")
+def _fractal_update(bars):
+    from strategy.fractal_engine import FractalEngine
+
+    high = bars["high"].to_numpy(dtype=float).tolist()
+    low = bars["low"].to_numpy(dtype=float).tolist()
+    engine = FractalEngine().warm_up(high, low)
+    cursor = [0]
+
+    def run():
+        i = cursor[0]
+        cursor[0] = (i + 1) % len(high)
+        engine.update(high[i], low[i])
+        engine.context()
+
+    return run
+
+
+@benchmark("signal_fusion.window")
+def _signal_fusion(bars):
+    from strategy.signal_fusion import SignalFusion
+
+    fusion = SignalFusion()
+    close = bars["close"].to_numpy(dtype=float)
+    volume = bars["tick_volume"].to_numpy(dtype=float)
+    spread = bars["spread"].to_numpy(dtype=float)
+
+    def run():
+        fusion.compute(close, volume, spread, nds_conf=0.7)
+
+    return run
+
+
+@benchmark("exit_engine.chain")
+def _exit_chain(bars):
+    from exit_engine.contracts import ExitContext
+    from exit_engine.m15_trend_exit_detector import M15TrendExitDetector
+    from exit_engine.m5_exit_confirmation_gate import M5ExitConfirmationGate
+    from exit_engine.m1_exit_executor import M1ExitExecutor
+
+    detector = M15TrendExitDetector()
+    gate = M5ExitConfirmationGate()
+    executor = M1ExitExecutor()
+
+    structure = {"slope_norm": 0.1, "slope_prev": 0.6, "expansion": 0.8, "regime": "RANGE"}
+    vwap = {"deviation": 0.001, "slope": -0.2}
+    fractal = {"stability": 0.4}
+    momentum = {"momentum_norm": -0.4}
+    ctx = ExitContext(
+        symbol=SIM_SYMBOL,
+        side="LONG",
+        entry_price=float(bars["close"].iloc[0]),
+        size=0.1,
+        unrealized_pnl=12.5,
+        open_time=0.0,
+    )
+
+    def run():
+        warning = detector.evaluate(structure, vwap, fractal, "LONG")
+        confirmation = gate.confirm(warning, structure, vwap, momentum, "LONG")
+        executor.execute(confirmation, ctx)
+
+    return run
+
+
+# ==================================================
+# MEASUREMENT
+# ==================================================
+def measure_ops(fn, min_time: float, repeat: int) -> dict:
+    """
+    Calibrate a loop count ≥ min_time, keep the best of `repeat` runs.
+    """
+    fn()  # warm caches / lazy imports
+
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        if time.perf_counter() - t0 >= min_time:
+            break
+        loops *= 2
+
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        best = min(best, time.perf_counter() - t0)
+
+    return {
+        "loops": loops,
+        "ops_per_sec": loops / best,
+        "ns_per_op": best / loops * 1e9,
+    }
+
+
+def measure_alloc(fn, calls: int) -> dict:
+    """
+    alloc    : peak bytes allocated during one call (transient)
+    retained : bytes still alive after the call (leak / growth)
+    """
+    fn()
+    gc.collect()
+
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    transient = 0
+
+    for _ in range(calls):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        transient += peak - before
+
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "alloc_bytes_per_call": transient / calls,
+        "retained_bytes_per_call": (end - start) / calls,
+    }
+
+
+# ==================================================
+# BASELINES
+# ==================================================
+def git_commit(ref: str = "HEAD") -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", ref],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def baseline_path(ref_or_path: str) -> str:
+    if os.path.exists(ref_or_path):
+        return ref_or_path
+    return os.path.join(RESULTS_DIR, f"{git_commit(ref_or_path)}.json")
+
+
+def compare(current: dict, baseline: dict, threshold_pct: float) -> bool:
+    """
+    Print per‑benchmark deltas. True when something regressed.
+    """
+    regressed = False
+    print(f"\nvs {baseline.get('commit', '?')} (threshold {threshold_pct:.0f}%)")
+
+    for name, cur in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"  {name:<26} (new)")
+            continue
+
+        speed = (cur["ops_per_sec"] / base["ops_per_sec"] - 1.0) * 100.0
+        alloc = cur["alloc_bytes_per_call"] - base["alloc_bytes_per_call"]
+
+        status = "OK"
+        if speed < -threshold_pct:
+            status = "REGRESSION"
+            regressed = True
+
+        print(f"  {name:<26} {speed:+7.1f}% ops/s  {alloc:+10.0f} B/call   {status}")
+
+    return regressed
+
+
+# ==================================================
+# MAIN
+# ==================================================
+def main():
+    parser = argparse.ArgumentParser(description="X6 hot‑path benchmarks")
+    parser.add_argument("--bars", type=int, default=500)
+    parser.add_argument("--session", default=None, help="recorded session file")
+    parser.add_argument("--only", action="append", default=None)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--alloc-calls", type=int, default=200)
+    parser.add_argument("--save", nargs="?", const="", default=None)
+    parser.add_argument("--compare", default=None, help="git ref or JSON file")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args()
+
+    if args.session:
+        bars = session_bars(args.session)
+        source = f"session:{os.path.basename(args.session)}"
+    else:
+        bars = synthetic_bars(args.bars)
+        source = f"synthetic:{SIM_SYMBOL}:M1:{len(bars)}"
+
+    report = {
+        "commit": git_commit(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.platform(),
+        "bars": source,
+        "results": {},
+    }
+
+    print(f"bars: {source}")
+    print(f"{'benchmark':<26} {'ops/s':>12} {'µs/op':>10} {'alloc B':>10} {'retained B':>11}")
+
+    for name, setup in BENCHMARKS.items():
+        if args.only and not any(key in name for key in args.only):
+            continue
+
+        try:
+            fn = setup(bars)
+        except ImportError as exc:
+            print(f"{name:<26} skipped ({exc.name} not installed)")
+            continue
+
+        result = measure_ops(fn, args.min_time, args.repeat)
+        result.update(measure_alloc(fn, args.alloc_calls))
+        report["results"][name] = result
+
+        print(
+            f"{name:<26} {result['ops_per_sec']:12,.0f} "
+            f"{result['ns_per_op'] / 1000.0:10.2f} "
+            f"{result['alloc_bytes_per_call']:10.0f} "
+            f"{result['retained_bytes_per_call']:11.1f}"
+        )
+
+    if args.save is not None:
+        path = args.save or os.path.join(RESULTS_DIR, f"{report['commit']}.json")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 saved {path}")
+
+    if args.compare:
+        path = baseline_path(args.compare)
+        if not os.path.exists(path):
+            print(f"\n⚠️ no baseline at {path} (run --save on that commit)")
+            sys.exit(2)
+        with open(path, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(report, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# =====================================================
+# bench/import_time.py
+# COLD‑START BENCHMARK (python -X importtime)
+# =====================================================
+#
+# Imports each entry point in a fresh interpreter and parses the
+# -X importtime report. Fails (exit 1) when an entry point pulls a
+# heavy dependency at import time or exceeds its budget.
+#
+#   python bench/import_time.py
+#   python bench/import_time.py --budget-ms 400 --top 15
+
+import argparse
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+ENTRY_POINTS = (
+    "main",
+    "core.orchestrator",
+    "bt.bt_mt5_runner",
+)
+
+# Must only load on the code paths that use them
+HEAVY_MODULES = (
+    "pandas",
+    "hmmlearn",
+    "sklearn",
+    "scipy",
+    "MetaTrader5",
+)
+
+
+def measure(module: str, env: dict) -> dict:
+    """
+    Returns {"total_us", "modules": {name: (self_us, cumulative_us)}}.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr}")
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cum_us))
+
+    total = modules.get(module, (0, 0))[1]
+    return {"total_us": total, "modules": modules}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="X6 cold‑start benchmark")
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env.setdefault("MT5_BACKEND", "SIM")   # runs on any OS
+
+    failed = False
+
+    for entry in ENTRY_POINTS:
+        runs = [measure(entry, env) for _ in range(args.runs)]
+        best = min(runs, key=lambda r: r["total_us"])
+        total_ms = best["total_us"] / 1000.0
+
+        heavy = sorted(
+            name for name in best["modules"]
+            if name.split(".")[0] in HEAVY_MODULES
+        )
+        heavy_roots = sorted({name.split(".")[0] for name in heavy})
+
+        status = "OK"
+        if heavy_roots:
+            status = "FAIL (heavy: " + ", ".join(heavy_roots) + ")"
+            failed = True
+        if args.budget_ms is not None and total_ms > args.budget_ms:
+            status = f"FAIL (>{args.budget_ms:.0f} ms)"
+            failed = True
+
+        print(f"{entry:<22} {total_ms:8.1f} ms   {status}")
+
+        top = sorted(
+            best["modules"].items(),
+            key=lambda kv: kv[1][0],
+            reverse=True,
+        )[: args.top]
+        for name, (self_us, cum_us) in top:
+            print(f"    {self_us / 1000.0:7.2f} ms self  {cum_us / 1000.0:8.2f} ms cum  {name}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
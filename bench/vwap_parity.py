@@ -0,0 +1,152 @@
+# =====================================================
+# bench/vwap_parity.py
+# STREAMING VWAP PARITY (core.vwap_engine_stream vs core.vwap_engine)
+# =====================================================
+#
+# Steps the O(1) streaming engine bar by bar and compares every
+# snapshot field with the pandas engine's row:
+#   cumulative : warmup(df) + step(i)      vs VWAPEngine().compute(df)
+#   rolling    : VWAPEngine(vwap_window=N) vs VWAPEngine(rolling_window=N)
+#   replay     : MT5ReplayFeed.vwap_snapshot() vs compute(get_data())
+# NaN positions must match, values within --rtol. Exit 1 on mismatch.
+#
+#   python bench/vwap_parity.py
+#   python bench/vwap_parity.py --bars 20000 --window 500 --replay-steps 300
+
+import argparse
+import math
+import os
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+# Deterministic, quiet engines (must precede project imports)
+os.environ.setdefault("MT5_BACKEND", "SIM")
+os.environ.setdefault("WARMUP_MODE", "0")
+os.environ.setdefault("PROFILE_STAGES", "0")
+
+SIM_SYMBOL = "BTCUSD"
+SIM_TIME = 1_750_000_000
+
+FIELDS = ("vwap_dev", "vol_weight", "bar_range", "avg_range", "atr")
+
+
+def sim_bars(count: int):
+    import pandas as pd
+    from core import mt5_sim
+
+    mt5_sim.sim_reset()
+    mt5_sim.sim_set_time(SIM_TIME)
+    rates = mt5_sim.copy_rates_from_pos(SIM_SYMBOL, mt5_sim.TIMEFRAME_M1, 0, count)
+
+    df = pd.DataFrame(rates)
+    df["time"] = pd.to_datetime(df["time"], unit="s")
+    return df
+
+
+def close_enough(a: float, b: float, rtol: float) -> bool:
+    if math.isnan(a) or math.isnan(b):
+        return math.isnan(a) and math.isnan(b)
+    return abs(a - b) <= rtol * max(1.0, abs(a), abs(b))
+
+
+class Parity:
+    def __init__(self, name: str, rtol: float):
+        self.name = name
+        self.rtol = rtol
+        self.rows = 0
+        self.worst = 0.0
+        self.mismatches = []
+
+    def check(self, i: int, snap, row):
+        self.rows += 1
+        for field in FIELDS:
+            a = snap[field]
+            b = float(row[field])
+            if not close_enough(a, b, self.rtol):
+                if len(self.mismatches) < 10:
+                    self.mismatches.append((i, field, a, b))
+            elif a == a:
+                self.worst = max(self.worst, abs(a - b) / max(1.0, abs(b)))
+
+    def report(self) -> bool:
+        status = "OK  " if not self.mismatches else "FAIL"
+        print(f"{status} {self.name:<28} rows={self.rows:<7} max rel err={self.worst:.2e}")
+        for i, field, a, b in self.mismatches:
+            print(f"     bar {i}: {field} stream={a!r} pandas={b!r}")
+        return not self.mismatches
+
+
+def check_series(name, stream, pandas_engine, df, rtol) -> bool:
+    frame = pandas_engine.compute(df)
+    rows = frame[list(FIELDS)].to_dict("records")
+
+    parity = Parity(name, rtol)
+    stream.warmup(df)
+    for i, row in enumerate(rows):
+        stream.step(i)
+        parity.check(i, stream.snapshot(i), row)
+    return parity.report()
+
+
+def check_replay(window: int, steps: int, rtol) -> bool:
+    from datetime import datetime, timedelta
+
+    from bt.mt5_replay_feed import MT5ReplayFeed
+    from core.vwap_engine import VWAPEngine
+
+    end = datetime.utcfromtimestamp(SIM_TIME)
+    feed = MT5ReplayFeed(
+        symbol=SIM_SYMBOL,
+        start_date=end - timedelta(days=14),
+        end_date=end,
+        timeframes=["M5"],
+        bars=window,
+    )
+    feed.load()
+
+    engine = VWAPEngine()
+    parity = Parity(f"replay M5 window={window}", rtol)
+    for i in range(steps + 1):
+        if i and not feed.step():
+            break
+        row = engine.compute(feed.get_data()).iloc[-1]
+        parity.check(i, feed.vwap_snapshot(), row)
+    return parity.report()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="X6 streaming VWAP parity")
+    parser.add_argument("--bars", type=int, default=5000)
+    parser.add_argument("--window", type=int, default=500)
+    parser.add_argument("--replay-steps", type=int, default=200)
+    parser.add_argument("--rtol", type=float, default=1e-9)
+    args = parser.parse_args()
+
+    from core import vwap_engine, vwap_engine_stream
+
+    df = sim_bars(args.bars)
+    ok = check_series(
+        "cumulative",
+        vwap_engine_stream.VWAPEngine(),
+        vwap_engine.VWAPEngine(),
+        df,
+        args.rtol,
+    )
+    ok &= check_series(
+        f"rolling window={args.window}",
+        vwap_engine_stream.VWAPEngine(vwap_window=args.window),
+        vwap_engine.VWAPEngine(rolling_window=args.window),
+        df,
+        args.rtol,
+    )
+    if args.replay_steps:
+        ok &= check_replay(args.window, args.replay_steps, args.rtol)
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
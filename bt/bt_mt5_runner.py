@@ -16,13 +16,12 @@ sys.path.insert(0, PROJECT_ROOT)
 # -----------------------------------------------------
 # IMPORTS
 # -----------------------------------------------------
-import MetaTrader5 as mt5
+from core.mt5_backend import mt5
 
 from bt.mt5_replay_feed import MT5ReplayFeed
 from core.orchestrator import Orchestrator
 
 from execution import ExecutionGate
-print(ExecutionGate)
 from execution.mock_execution_adapter import MockExecutionAdapter
 
 # -----------------------------------------------------
@@ -3,29 +3,29 @@
 # FINAL – NUMPY‑FIRST / FREEZE‑PROOF / O(1)
 # =====================================================
 
-import MetaTrader5 as mt5
-import pandas as pd
-import numpy as np
+from core.mt5_backend import mt5
+from core.vwap_engine_stream import VWAPEngine
 from datetime import datetime
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class MT5ReplayFeed:
     """
     MT5 Replay Feed – X6 System
     --------------------------
-    ✅ Fixed RangeIndex
     ✅ Fixed dtypes
-    ✅ NumPy sliding window
+    ✅ Window = zero‑copy slice of the loaded history
     ✅ Zero Pandas access in step()
+    ✅ Streaming VWAP (core.vwap_engine_stream) over the window
+       → vwap_snapshot() == VWAPEngine.compute(window).iloc[-1]
     ✅ O(1) iteration safe
     """
 
-    TF_MAP = {
-        "M1": mt5.TIMEFRAME_M1,
-        "M5": mt5.TIMEFRAME_M5,
-        "M15": mt5.TIMEFRAME_M15,
-    }
+    # every window row is a closed historical bar
+    last_bar_forming = False
 
     # ==================================================
     # INIT
@@ -44,16 +44,19 @@ class MT5ReplayFeed:
         self.timeframes = timeframes
         self.bars = bars
 
-        self._data: Dict[str, pd.DataFrame] = {}
+        self._data: Dict[str, "pd.DataFrame"] = {}
         self._cursor: int = 0
 
-        self._df_window: pd.DataFrame | None = None
-        self._values: np.ndarray | None = None
-        self._base_values: np.ndarray | None = None
+        self._base_df: "pd.DataFrame | None" = None
+        self._df_window: "pd.DataFrame | None" = None
+        self._window_end: int = 0
+        self._n_rows: int = 0
 
         self._columns: List[str] | None = None
         self._dtypes: Dict[str, str] | None = None
-        self._n_cols: int = 0
+
+        # window VWAP = rolling `bars` VWAP, stepped once per bar
+        self.vwap = VWAPEngine(vwap_window=bars)
 
         self._equity: float = 100_000.0
 
@@ -61,6 +64,7 @@ class MT5ReplayFeed:
     # LOAD DATA (ONE‑TIME)
     # ==================================================
     def load(self):
+        import pandas as pd  # lazy: keep cold start free of pandas
 
         base_tf = self.timeframes[0]
 
@@ -68,7 +72,7 @@ class MT5ReplayFeed:
         for tf in self.timeframes:
             rates = mt5.copy_rates_range(
                 self.symbol,
-                self.TF_MAP[tf],
+                getattr(mt5, f"TIMEFRAME_{tf}"),  # "M5" → TIMEFRAME_M5
                 self.start_date,
                 self.end_date,
             )
@@ -88,25 +92,19 @@ class MT5ReplayFeed:
         if len(base_df) <= self.bars:
             raise RuntimeError("Not enough historical data")
 
-        # ---- Initialize rolling window ----
-        window = base_df.iloc[: self.bars].copy()
-        window.reset_index(drop=True, inplace=True)
-
-        self._columns = list(window.columns)
+        self._columns = list(base_df.columns)
 
         # ---- Freeze dtypes ----
-        self._dtypes = window.dtypes.to_dict()
+        self._dtypes = base_df.dtypes.to_dict()
         for c, dt in self._dtypes.items():
-            window[c] = window[c].astype(dt, copy=False)
+            base_df[c] = base_df[c].astype(dt, copy=False)
 
-        self._df_window = window
+        self._base_df = base_df
+        self._n_rows = len(base_df)
 
-        # ---- NumPy backing buffer (window) ----
-        self._values = self._df_window.to_numpy(copy=False)
-        self._n_cols = self._values.shape[1]
-
-        # ---- NumPy backing buffer (full history) ----
-        self._base_values = base_df.to_numpy(copy=False)
+        # ---- Streaming VWAP over the full history arrays ----
+        self.vwap.warmup(base_df)
+        self.vwap.step(self.bars - 1)
 
         self._cursor = self.bars
 
@@ -120,31 +118,37 @@ class MT5ReplayFeed:
         ✅ NumPy only
         """
 
-        base_values = self._base_values
-
-        if self._cursor >= base_values.shape[0]:
+        if self._cursor >= self._n_rows:
             return False
 
-        # ---- Fetch next row (NumPy) ----
-        row = base_values[self._cursor]
+        # ---- Next bar enters the window (running sums only) ----
+        self.vwap.step(self._cursor)
         self._cursor += 1
 
-        # ---- Shift rolling window ----
-        self._values[:-1] = self._values[1:]
-
-        # ---- Overwrite last row ----
-        self._values[-1, :self._n_cols] = row[:self._n_cols]
-
         return True
 
     # ==================================================
     # DATA ACCESS
     # ==================================================
-    def get_data(self) -> pd.DataFrame | None:
-        if self._df_window is None or len(self._df_window) < 30:
+    def get_data(self) -> "pd.DataFrame | None":
+        if self._base_df is None or self.bars < 30:
             return None
+
+        # one slice per bar, built on first read (views, no row copy)
+        if self._window_end != self._cursor:
+            self._df_window = self._base_df.iloc[self._cursor - self.bars : self._cursor]
+            self._window_end = self._cursor
         return self._df_window
 
+    def vwap_snapshot(self):
+        """
+        VWAP / vol_weight / ranges / ATR of the last window bar
+        (preallocated record, updated in place by step()).
+        """
+        if self._base_df is None:
+            return None
+        return self.vwap.record
+
     # ==================================================
     # EQUITY (BACKTEST SAFE)
     # ==================================================
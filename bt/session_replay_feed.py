@@ -0,0 +1,183 @@
+# =====================================================
+# bt/session_replay_feed.py
+# DETERMINISTIC REPLAY OF RECORDED LIVE SESSIONS
+# =====================================================
+
+import time
+from collections import defaultdict, deque
+
+import numpy as np
+import pandas as pd
+
+from core.session_recorder import read_session
+
+
+class SessionReplayFeed:
+    """
+    Session Replay Feed – X6 System
+    -------------------------------
+    ✅ Rebuilds every get_data() window from recorded bar deltas
+    ✅ Same ticks / equity / point value / adapter responses, same order
+    ✅ Same data_stale flag (stale windows skip execution again)
+    ✅ No terminal, no sleeps (unless paced)
+
+    Usage:
+        feed = SessionReplayFeed(path).load()
+        orchestrator = Orchestrator(feed)
+        orchestrator.execution_gate = ExecutionGate(
+            adapter=feed.execution_adapter()
+        )
+        while feed.step():
+            orchestrator.run_once()
+    """
+
+    def __init__(self, path: str, symbol: str = None, speed: float = None):
+        self.path = path
+        self.symbol = symbol
+        self.speed = speed        # None → as fast as possible
+
+        # as the recorded feed (meta); live MT5 windows end in a forming bar
+        self.last_bar_forming = True
+        # recorded per get_data(): a stale live window skipped execution
+        self.data_stale = False
+
+        self._iterations = []
+        self._cursor = -1
+        self._current = None
+        self._prelude = defaultdict(deque)
+
+        self._columns = None
+        self._arrays = None
+        self._time_in_index = True
+        self._df = None
+
+        self._last_equity = 0.0
+        self._last_tick = None
+        self._wall_prev = None
+
+    # ==================================================
+    # LOAD (ONE‑TIME)
+    # ==================================================
+    def load(self):
+        current = self._prelude
+        for kind, payload in read_session(self.path):
+            if kind == "meta":
+                self.symbol = self.symbol or payload["symbol"]
+                self.last_bar_forming = payload.get("last_bar_forming", True)
+                continue
+            if kind == "iter":
+                current = defaultdict(deque)
+                current["iter"].append(payload)
+                self._iterations.append(current)
+                continue
+            current[kind].append(payload)
+        return self
+
+    # ==================================================
+    # STEP
+    # ==================================================
+    def step(self) -> bool:
+        if self._cursor + 1 >= len(self._iterations):
+            return False
+
+        self._cursor += 1
+        self._current = self._iterations[self._cursor]
+
+        if self.speed:
+            wall = self._current["iter"][0]
+            if self._wall_prev is not None:
+                time.sleep(max(0.0, (wall - self._wall_prev) / self.speed))
+            self._wall_prev = wall
+
+        return True
+
+    def _next(self, kind):
+        for bucket in (self._prelude, self._current):
+            if bucket is not None and bucket[kind]:
+                return True, bucket[kind].popleft()
+        return False, None
+
+    # ==================================================
+    # FEED API
+    # ==================================================
+    def get_data(self) -> pd.DataFrame | None:
+        found, rec = self._next("data")
+        if not found:
+            return self._df
+        if rec is None:
+            return None
+
+        self._apply(rec)
+        return self._df
+
+    def get_tick(self) -> dict | None:
+        """Recorded tick of this iteration (field dict)."""
+        found, tick = self._next("tick")
+        if found:
+            self._last_tick = tick
+        return self._last_tick
+
+    def get_equity(self) -> float:
+        found, value = self._next("equity")
+        if found:
+            self._last_equity = value
+        return self._last_equity
+
+    def get_point_value(self) -> float:
+        found, value = self._next("point")
+        return value if found else 1.0
+
+    def execution_adapter(self):
+        return ReplayExecutionAdapter(self)
+
+    # ==================================================
+    # WINDOW RECONSTRUCTION
+    # ==================================================
+    def _apply(self, rec):
+        delta = rec["delta"]
+        self.data_stale = rec.get("stale", False)
+        self._time_in_index = rec["time_in_index"]
+        self._columns = rec["columns"]
+
+        time_key = "time" if "time" in delta else next(
+            k for k in delta if k not in self._columns
+        )
+        new_times = delta[time_key]
+
+        if self._arrays is None:
+            self._arrays = {k: v for k, v in delta.items()}
+        else:
+            old_times = self._arrays[time_key]
+            keep = (
+                int(np.searchsorted(old_times, new_times[0], side="left"))
+                if len(new_times) else len(old_times)
+            )
+            self._arrays = {
+                k: np.concatenate((self._arrays[k][:keep], delta[k]))
+                for k in delta
+            }
+
+        rows = rec["rows"]
+        self._arrays = {k: v[-rows:] for k, v in self._arrays.items()}
+
+        data = {c: self._arrays[c] for c in self._columns}
+        if self._time_in_index:
+            index = pd.DatetimeIndex(self._arrays[time_key], name=time_key)
+            self._df = pd.DataFrame(data, index=index, copy=False)
+        else:
+            self._df = pd.DataFrame(data, copy=False)
+
+
+class ReplayExecutionAdapter:
+    """
+    Returns the recorded adapter responses, in order.
+    """
+
+    def __init__(self, feed: SessionReplayFeed):
+        self._feed = feed
+
+    def execute(self, intent):
+        found, result = self._feed._next("exec")
+        if not found:
+            return {"success": False, "reason": "REPLAY_NO_RECORD"}
+        return result
@@ -89,3 +89,219 @@ MIN_VWAP_DEV = float(
 MAX_TRADE_STRESS = float(
     os.getenv("MAX_TRADE_STRESS", "0.35")
 )
+
+# =====================================================
+# HOT-RESTART CHECKPOINT
+# =====================================================
+
+CHECKPOINT_PATH = os.getenv("CHECKPOINT_PATH", "state/x6_engine.ckpt")
+
+CHECKPOINT_INTERVAL_SEC = float(
+    os.getenv("CHECKPOINT_INTERVAL_SEC", "60")
+)
+
+# =====================================================
+# LIVE SESSION RECORDING (REPLAY)
+# =====================================================
+
+RECORD_SESSION_PATH = os.getenv("RECORD_SESSION_PATH", "")
+
+# =====================================================
+# MT5 BACKEND (TERMINAL | SIM)
+# =====================================================
+
+class MT5Backend(Enum):
+    TERMINAL = "TERMINAL"
+    SIM      = "SIM"
+
+
+try:
+    MT5_BACKEND = MT5Backend(os.getenv("MT5_BACKEND", MT5Backend.TERMINAL.value))
+except ValueError:
+    MT5_BACKEND = MT5Backend.TERMINAL
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MT5_SIM_DATA_DIR = os.getenv(
+    "MT5_SIM_DATA_DIR", os.path.join(_PROJECT_ROOT, "data", "bars")
+)
+
+MT5_SIM_SYMBOLS_FILE = os.getenv(
+    "MT5_SIM_SYMBOLS_FILE", os.path.join(_PROJECT_ROOT, "symbols.json")
+)
+
+MT5_SIM_BALANCE = float(
+    os.getenv("MT5_SIM_BALANCE", "100000")
+)
+
+MT5_SIM_HISTORY_BARS = int(
+    os.getenv("MT5_SIM_HISTORY_BARS", "50000")
+)
+
+# =====================================================
+# PIPELINE STAGE PROFILER
+# =====================================================
+
+PROFILE_STAGES = os.getenv("PROFILE_STAGES", "1") == "1"
+
+PROFILE_REPORT_SEC = float(
+    os.getenv("PROFILE_REPORT_SEC", "60")
+)
+
+# =====================================================
+# ASYNC LOGGING (monitoring/logger.py)
+# =====================================================
+
+class LogFormat(Enum):
+    TEXT   = "TEXT"
+    JSON   = "JSON"
+    BINARY = "BINARY"
+
+
+try:
+    LOG_FORMAT = LogFormat(os.getenv("LOG_FORMAT", LogFormat.TEXT.value))
+except ValueError:
+    LOG_FORMAT = LogFormat.TEXT
+
+# "" → stdout (TEXT / JSON). BINARY always needs a file.
+LOG_PATH = os.getenv("LOG_PATH", "")
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+
+# Per‑module overrides: "core.orchestrator=WARNING,nds=DEBUG"
+LOG_LEVELS = os.getenv("LOG_LEVELS", "")
+
+# Per message template; 0 → unlimited
+LOG_RATE_PER_SEC = float(
+    os.getenv("LOG_RATE_PER_SEC", "20")
+)
+
+LOG_QUEUE_MAX = int(
+    os.getenv("LOG_QUEUE_MAX", "100000")
+)
+
+# =====================================================
+# TELEMETRY ENDPOINT (Prometheus text, /metrics)
+# =====================================================
+
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+
+# 0 → disabled
+METRICS_PORT = int(
+    os.getenv("METRICS_PORT", "9108")
+)
+
+# =====================================================
+# ONLINE EDGE MODEL (versioned weight snapshots)
+# =====================================================
+
+# "" → no snapshots
+EDGE_MODEL_DIR = os.getenv("EDGE_MODEL_DIR", "state/models")
+
+# =====================================================
+# SYMBOL METADATA INDEX (Engine/SymbolScanner.py)
+# =====================================================
+
+SYMBOL_INDEX_PATH = os.getenv(
+    "SYMBOL_INDEX_PATH", os.path.join(_PROJECT_ROOT, "state", "symbols.npy")
+)
+
+# Cached metadata older than this is re‑fetched on the next scan
+SYMBOL_CACHE_TTL_SEC = float(
+    os.getenv("SYMBOL_CACHE_TTL_SEC", "86400")
+)
+
+SYMBOL_SCAN_WORKERS = int(
+    os.getenv("SYMBOL_SCAN_WORKERS", "8")
+)
+
+# =====================================================
+# MT5 SESSION (core/mt5_session.py)
+# =====================================================
+
+# account_info / symbol_info / tick reuse within one iteration
+MT5_SNAPSHOT_TTL_SEC = float(
+    os.getenv("MT5_SNAPSHOT_TTL_SEC", "0.5")
+)
+
+MT5_RECONNECT_BACKOFF_SEC = float(
+    os.getenv("MT5_RECONNECT_BACKOFF_SEC", "1")
+)
+
+MT5_RECONNECT_BACKOFF_MAX_SEC = float(
+    os.getenv("MT5_RECONNECT_BACKOFF_MAX_SEC", "60")
+)
+
+# =====================================================
+# MT5 CALL GATEWAY (core/mt5_gateway.py)
+# =====================================================
+
+# Data calls (rates / ticks): stale cached value after this
+MT5_CALL_TIMEOUT_SEC = float(
+    os.getenv("MT5_CALL_TIMEOUT_SEC", "2.0")
+)
+
+MT5_ORDER_TIMEOUT_SEC = float(
+    os.getenv("MT5_ORDER_TIMEOUT_SEC", "10.0")
+)
+
+# Longest one iteration can legitimately block on gateway deadlines:
+# rates + tick + equity (×2 on the arming iteration) + order‑pricing
+# tick, then one order_send
+MT5_ITERATION_MAX_WAIT_SEC = 5 * MT5_CALL_TIMEOUT_SEC + MT5_ORDER_TIMEOUT_SEC
+
+# =====================================================
+# LOOP WATCHDOG (monitoring/watchdog.py)
+# =====================================================
+
+# 0 → disabled; must exceed MT5_ITERATION_MAX_WAIT_SEC (checked in main.py)
+WATCHDOG_BUDGET_SEC = float(
+    os.getenv("WATCHDOG_BUDGET_SEC", str(MT5_ITERATION_MAX_WAIT_SEC + 5))
+)
+
+# Consecutive stalled iterations before the kill switch trips (0 → never)
+WATCHDOG_TRIP_AFTER = int(
+    os.getenv("WATCHDOG_TRIP_AFTER", "0")
+)
+
+# Loop‑thread stack samples per second (0 → profiler off)
+WATCHDOG_SAMPLE_HZ = float(
+    os.getenv("WATCHDOG_SAMPLE_HZ", "5")
+)
+
+WATCHDOG_REPORT_SEC = float(
+    os.getenv("WATCHDOG_REPORT_SEC", "300")
+)
+
+# =====================================================
+# DECISION CACHE (core/orchestrator.py)
+# =====================================================
+
+# Reuse the last decision until a new bar closes
+DECISION_CACHE = os.getenv("DECISION_CACHE", "1") == "1"
+
+# Equity moves smaller than this (% of armed equity) keep the decision
+DECISION_EQUITY_BUCKET_PCT = float(
+    os.getenv("DECISION_EQUITY_BUCKET_PCT", "0.1")
+)
+
+# =====================================================
+# SIGNAL FUSION (strategy/signal_fusion.py)
+# =====================================================
+
+# Overrides: "market_score=0.5,cohesion=0.3,stability=0.2,nds=0.5"
+FUSION_WEIGHTS = os.getenv("FUSION_WEIGHTS", "")
+
+# =====================================================
+# VWAP REGIME ANTI‑FLICKER (core/vwap_regime.py)
+# =====================================================
+
+# TREND kept while |dev| > 2.5 − h, RANGE while |dev| < 1.0 + h
+REGIME_HYSTERESIS = float(
+    os.getenv("REGIME_HYSTERESIS", "0")
+)
+
+# Bars a new regime must persist before it is taken (1 → immediate)
+REGIME_MIN_DWELL = int(
+    os.getenv("REGIME_MIN_DWELL", "1")
+)
@@ -1 +1,190 @@
-# symbols.py
+# config/symbols.py
+# =====================================================
+# Broker symbol metadata – fast lookup by name / prefix
+#   Backed by the binary index written by Engine/SymbolScanner.py
+#   (state/symbols.npy). Falls back to symbols.json once and
+#   writes the index, so later starts are a single np.load.
+# =====================================================
+
+import json
+import os
+from bisect import bisect_left
+
+import numpy as np
+
+from config.settings import MT5_SIM_SYMBOLS_FILE, SYMBOL_INDEX_PATH
+
+# Same fields as the historical symbols.json export (+ scan bookkeeping)
+SYMBOL_DTYPE = np.dtype([
+    ("symbol", "U32"),
+    ("digits", "i4"),
+    ("spread", "i4"),
+    ("volume_min", "f8"),
+    ("volume_max", "f8"),
+    ("volume_step", "f8"),
+    ("trade_contract_size", "f8"),
+    ("freeze_level", "i4"),           # −1 = unknown (null)
+    ("margin_initial", "f8"),
+    ("margin_maintenance", "f8"),
+    ("point", "f8"),
+    ("is_tradable", "?"),
+    ("visible", "?"),
+    ("fetched_at", "f8"),             # epoch seconds of the last fetch
+])
+
+_INT_FIELDS = ("digits", "spread", "freeze_level")
+
+
+def record_from_dict(spec: dict, fetched_at: float = 0.0) -> tuple:
+    """
+    symbols.json‑style dict → SYMBOL_DTYPE row (None → −1 / NaN).
+    """
+    row = []
+    for name in SYMBOL_DTYPE.names:
+        if name == "fetched_at":
+            row.append(fetched_at)
+            continue
+        value = spec.get(name)
+        if name == "visible" and value is None:
+            value = True
+        if value is None:
+            value = -1 if name in _INT_FIELDS else (False if name == "is_tradable" else np.nan)
+        row.append(value)
+    return tuple(row)
+
+
+def record_to_dict(rec) -> dict:
+    out = {}
+    for name in SYMBOL_DTYPE.names:
+        if name in ("visible", "fetched_at"):
+            continue
+        value = rec[name].item()
+        if name in _INT_FIELDS and value == -1:
+            value = None
+        elif isinstance(value, float) and value != value:
+            value = None
+        out[name] = value
+    return out
+
+
+# ==================================================
+# INDEX I/O
+# ==================================================
+def load_index(path: str = SYMBOL_INDEX_PATH) -> np.ndarray:
+    """
+    Sorted SYMBOL_DTYPE array (empty when no index exists).
+    """
+    if os.path.exists(path):
+        arr = np.load(path, allow_pickle=False)
+        if arr.dtype == SYMBOL_DTYPE:
+            return arr
+    return np.zeros(0, dtype=SYMBOL_DTYPE)
+
+
+def save_index(records: np.ndarray, path: str = SYMBOL_INDEX_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp.npy"
+    np.save(tmp, np.sort(records, order="symbol"), allow_pickle=False)
+    os.replace(tmp, path)
+
+
+def index_from_json(json_path: str = MT5_SIM_SYMBOLS_FILE) -> np.ndarray:
+    with open(json_path, "r", encoding="utf-8") as f:
+        specs = json.load(f)
+    records = np.array([record_from_dict(s) for s in specs], dtype=SYMBOL_DTYPE)
+    return np.sort(records, order="symbol")
+
+
+# ==================================================
+# LOOKUP
+# ==================================================
+class SymbolIndex:
+    """
+    Symbol Index – X6 System
+    ------------------------
+    ✅ O(1) exact lookup (name → row)
+    ✅ O(log n) prefix lookup (bisect over sorted names)
+    ✅ Loads in a few ms (one np.load, no JSON parse)
+    """
+
+    def __init__(self, records: np.ndarray):
+        self.records = np.sort(np.asarray(records, dtype=SYMBOL_DTYPE), order="symbol")
+        self.names = self.records["symbol"].tolist()
+        self._rows = {name: i for i, name in enumerate(self.names)}
+
+    @classmethod
+    def load(cls, path: str = SYMBOL_INDEX_PATH, json_path: str = MT5_SIM_SYMBOLS_FILE):
+        records = load_index(path)
+        if len(records) == 0 and json_path and os.path.exists(json_path):
+            records = index_from_json(json_path)
+            try:
+                save_index(records, path)
+            except OSError:
+                pass
+        return cls(records)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._rows
+
+    def get(self, name: str):
+        """
+        Metadata dict (symbols.json format) or None.
+        """
+        i = self._rows.get(name)
+        return None if i is None else record_to_dict(self.records[i])
+
+    def record(self, name: str):
+        i = self._rows.get(name)
+        return None if i is None else self.records[i]
+
+    def with_prefix(self, prefix: str) -> list:
+        lo = bisect_left(self.names, prefix)
+        hi = bisect_left(self.names, prefix + "\U0010ffff", lo)
+        return self.names[lo:hi]
+
+    def resolve(self, base: str, tradable_only: bool = True):
+        """
+        Exact name first, else the first (sorted) visible name starting
+        with `base`; tradable symbols preferred.
+        """
+        if base in self._rows:
+            return base
+
+        fallback = None
+        for name in self.with_prefix(base):
+            rec = self.records[self._rows[name]]
+            if not rec["visible"]:
+                continue
+            if rec["is_tradable"] or not tradable_only:
+                return name
+            if fallback is None:
+                fallback = name
+        return fallback
+
+
+_INDEX = None
+
+
+def get_symbol_index(reload: bool = False) -> SymbolIndex:
+    """
+    Process‑wide index (loaded on first use).
+    """
+    global _INDEX
+    if _INDEX is None or reload:
+        _INDEX = SymbolIndex.load()
+    return _INDEX
+
+
+def lookup(name: str):
+    return get_symbol_index().get(name)
+
+
+def find_prefix(prefix: str) -> list:
+    return get_symbol_index().with_prefix(prefix)
+
+
+def resolve_symbol(base: str):
+    return get_symbol_index().resolve(base)
@@ -0,0 +1,139 @@
+# core/checkpoint.py
+
+import os
+import pickle
+import struct
+import time
+import zlib
+
+
+class EngineCheckpointer:
+    """
+    Hot‑Restart Engine Checkpointer – X6 System
+    -------------------------------------------
+    ✅ One compact, versioned, compressed state file
+    ✅ Atomic write (tmp + rename) – never a half file
+    ✅ Timer‑driven from the main loop (no extra thread)
+    ✅ Restore = file read (no HMM refit on first tick)
+
+    Components are any objects exposing:
+      • get_state() -> dict
+      • set_state(state: dict)
+    """
+
+    MAGIC = b"X6CK"
+    VERSION = 1
+
+    # magic | version | crc32 | payload length
+    _HEADER = struct.Struct(">4sHII")
+
+    def __init__(
+        self,
+        path: str,
+        components: dict,
+        interval_sec: float = 60.0,
+    ):
+        self.path = path
+        self.components = components
+        self.interval_sec = interval_sec
+
+        self._last_save = time.monotonic()
+        self.saves = 0
+
+    # ==================================================
+    # SAVE
+    # ==================================================
+    def save(self) -> int:
+        """
+        Serialize all component states. Returns bytes written.
+        """
+        states = {
+            name: component.get_state()
+            for name, component in self.components.items()
+        }
+
+        payload = zlib.compress(
+            pickle.dumps(
+                {"saved_at": time.time(), "states": states},
+                protocol=pickle.HIGHEST_PROTOCOL,
+            ),
+            6,
+        )
+
+        header = self._HEADER.pack(
+            self.MAGIC,
+            self.VERSION,
+            zlib.crc32(payload),
+            len(payload),
+        )
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, self.path)
+
+        self._last_save = time.monotonic()
+        self.saves += 1
+        return len(header) + len(payload)
+
+    def maybe_save(self) -> bool:
+        """
+        Cheap timer check – call once per loop iteration.
+        """
+        if time.monotonic() - self._last_save < self.interval_sec:
+            return False
+
+        self.save()
+        return True
+
+    # ==================================================
+    # RESTORE
+    # ==================================================
+    def load(self) -> dict | None:
+        """
+        Read and validate the checkpoint file.
+        Returns None if missing, corrupt or of another version.
+        """
+        if not os.path.exists(self.path):
+            return None
+
+        with open(self.path, "rb") as f:
+            raw = f.read()
+
+        if len(raw) < self._HEADER.size:
+            return None
+
+        magic, version, crc, length = self._HEADER.unpack_from(raw)
+        payload = raw[self._HEADER.size:]
+
+        if magic != self.MAGIC or version != self.VERSION:
+            return None
+
+        if len(payload) != length or zlib.crc32(payload) != crc:
+            return None
+
+        return pickle.loads(zlib.decompress(payload))
+
+    def restore(self) -> bool:
+        """
+        Push stored states back into the registered components.
+        Unknown components in the file are ignored.
+        """
+        data = self.load()
+        if data is None:
+            return False
+
+        states = data.get("states", {})
+        for name, component in self.components.items():
+            if name in states:
+                component.set_state(states[name])
+
+        return True
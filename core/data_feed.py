@@ -1,7 +1,6 @@
 # core/data_feed.py
 
-import MetaTrader5 as mt5
-import pandas as pd
+from core.mt5_backend import mt5
 
 class MarketDataFeed:
     def __init__(self, base_symbol, timeframe, bars=500):
@@ -12,6 +11,13 @@ class MarketDataFeed:
     def get_point_value(self) -> float:
             return 1.0
     def _resolve_symbol(self):
+        # Fast path: cached symbol index (no broker round‑trip per symbol)
+        from config.symbols import resolve_symbol
+
+        name = resolve_symbol(self.base_symbol)
+        if name is not None and mt5.symbol_select(name, True):
+            return name
+
         symbols = mt5.symbols_get()
         for s in symbols:
             if s.name.startswith(self.base_symbol):
@@ -20,6 +26,8 @@ class MarketDataFeed:
         raise RuntimeError(f"Symbol {self.base_symbol} not found in broker")
 
     def get_data(self):
+        import pandas as pd  # lazy: keep cold start free of pandas
+
         rates = mt5.copy_rates_from_pos(
             self.symbol,
             self.timeframe,
@@ -1,9 +1,9 @@
 # core/market_data.py
 
-import pandas as pd
-import MetaTrader5 as MetaTrader5
-import os
-print("✅ LOADING MARKET_DATA FROM:", os.path.abspath(__file__))
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class MarketDataFeed:
@@ -12,6 +12,9 @@ class MarketDataFeed:
     (Hard-decoupled from MT5Connector)
     """
 
+    # copy_rates_from_pos(..., 0, n) ends in the forming bar
+    last_bar_forming = True
+
     def __init__(
         self,
         mt5,
@@ -19,12 +22,28 @@ class MarketDataFeed:
         timeframe: int = None,
         bars: int = 500
     ):
+        from core.mt5_session import get_session
+
         if hasattr(mt5, 'mt5'):  # اگر MT5Connector است
             self.connector = mt5
-            self.mt5 = mt5.mt5  # ماژول اصلی MT5
+            api = mt5.mt5  # ماژول اصلی MT5
         else:  # اگر ماژول مستقیم MT5 است
             self.connector = None
-            self.mt5 = mt5
+            api = mt5
+
+        # Shared terminal session (one initialize, per‑iteration snapshot)
+        self.session = get_session(api)
+        self.mt5 = self.session
+
+        # Blocking data calls go through the I/O thread (deadline + stale flag)
+        from core.mt5_gateway import get_gateway
+
+        self.gateway = get_gateway(self.session)
+        self.data_stale = False
+
+        # Last built frame (reused while no bar closes)
+        self._frame = None
+        self._frame_span = None
 
         self.symbol = base_symbol
         self.timeframe = timeframe if timeframe is not None else self.mt5.TIMEFRAME_M5
@@ -36,37 +55,66 @@ class MarketDataFeed:
 
         print("✅ MT5 Connected")
 
-        info = self.mt5.account_info()
+        info = self.gateway.call("account_info").value
         if info:
             print(f"Account: {info.login}")
             print(f"Broker : {info.company}")
             print(f"Balance: {info.balance}")
 
+    # ==================================================
+    # Iteration boundary (fresh account / symbol snapshot)
+    # ==================================================
+    def begin_iteration(self):
+        self.session.begin_iteration()
+
     # ==================================================
     # Market Data
     # ==================================================
-    def get_data(self) -> pd.DataFrame:
-        rates = self.mt5.copy_rates_from_pos(
+    def get_data(self) -> "pd.DataFrame":
+        import pandas as pd  # lazy: keep cold start free of pandas
+
+        res = self.gateway.call(
+            "copy_rates_from_pos",
             self.symbol,
             self.timeframe,
             0,
             self.bars,
         )
+        self.data_stale = res.stale
+        rates = res.value
 
         if rates is None or len(rates) == 0:
             return None
 
+        # Same bar window (only the forming bar moved) → patch last row
+        df = self._frame
+        span = (rates["time"][0], rates["time"][-1])
+        if df is not None and len(df) == len(rates) and span == self._frame_span:
+            last = rates[-1]
+            for j, name in enumerate(df.columns):
+                df.iat[-1, j] = last[name]
+            return df
+
         df = pd.DataFrame(rates)
         df["time"] = pd.to_datetime(df["time"], unit="s")
         df.set_index("time", inplace=True)
+
+        self._frame = df
+        self._frame_span = span
         return df
 
     # ==================================================
-    # Account Equity ✅ STABLE
+    # Tick (I/O thread, stale on timeout)
+    # ==================================================
+    def get_tick(self):
+        return self.gateway.call("symbol_info_tick", self.symbol).value
+
+    # ==================================================
+    # Account Equity ✅ STABLE (I/O thread, stale on timeout)
     # ==================================================
     def get_equity(self) -> float:
         try:
-            info = self.mt5.account_info()
+            info = self.gateway.call("account_info").value
             if info is None:
                 return 0.0
             return float(info.equity) if info.equity is not None else float(info.balance)
@@ -74,11 +122,11 @@ class MarketDataFeed:
             return 0.0
 
     # ==================================================
-    # Point Value ✅ STABLE
+    # Point Value ✅ STABLE (I/O thread, stale on timeout)
     # ==================================================
     def get_point_value(self) -> float:
         try:
-            info = self.mt5.symbol_info(self.symbol)
+            info = self.gateway.call("symbol_info", self.symbol).value
             if info is None:
                 return 1.0
             return float(info.trade_tick_value)
@@ -0,0 +1,47 @@
+# core/mt5_backend.py
+# =====================================================
+# Single import point for the MetaTrader5 API
+#   MT5_BACKEND=TERMINAL → MetaTrader5 package (Windows)
+#   MT5_BACKEND=SIM      → core.mt5_sim (any OS)
+#
+# `mt5` is a lazy proxy: the backend module is imported on
+# first attribute access, not when this module is imported.
+# =====================================================
+
+import importlib
+
+from config.settings import MT5_BACKEND, MT5Backend
+
+
+def load_backend():
+    if MT5_BACKEND == MT5Backend.SIM:
+        return importlib.import_module("core.mt5_sim")
+    return importlib.import_module("MetaTrader5")
+
+
+class _LazyModule:
+    """
+    Resolves attributes from the backend on first use and caches
+    them on the instance (later lookups are plain attribute hits).
+    """
+
+    def __init__(self, loader):
+        self.__dict__["_loader"] = loader
+        self.__dict__["_module"] = None
+
+    def __getattr__(self, name):
+        module = self.__dict__["_module"]
+        if module is None:
+            module = self.__dict__["_module"] = self.__dict__["_loader"]()
+
+        value = getattr(module, name)
+        self.__dict__[name] = value
+        return value
+
+    def __repr__(self):
+        return f"<lazy MT5 backend {MT5_BACKEND.value}>"
+
+
+mt5 = _LazyModule(load_backend)
+
+__all__ = ["mt5", "load_backend"]
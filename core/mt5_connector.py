@@ -1,18 +1,20 @@
 # X6/core/mt5_connector.py
 
-import MetaTrader5 as mt5
 import datetime
 
+from core.mt5_session import get_session
+
 
 class MT5Connector:
     def __init__(self):
         self.connected = False
+        self.session = get_session()
 
     def connect(self):
-        if not mt5.initialize():
+        if not self.session.initialize():
             raise RuntimeError("❌ MT5 initialize() failed")
 
-        acc = mt5.account_info()
+        acc = self.session.account_info()
         if acc is None:
             raise RuntimeError("❌ MT5 connected but account_info() is None")
 
@@ -25,6 +27,6 @@ class MT5Connector:
 
     def shutdown(self):
         if self.connected:
-            mt5.shutdown()
+            self.session.shutdown()
             self.connected = False
             print(f"🔌 MT5 Disconnected {datetime.datetime.now()}")
@@ -0,0 +1,274 @@
+# core/mt5_gateway.py
+# =====================================================
+# MT5 call gateway: blocking terminal calls run on one
+# dedicated I/O thread, callers wait with a deadline.
+#   • data calls  → stale‑but‑flagged last good value on timeout
+#   • order_send  → never stale; cancelled if not yet started,
+#                   otherwise reported as in flight
+#   • account_info / symbol_info / symbol_info_tick → the session's
+#     per‑iteration snapshot (fetched on the I/O thread on a miss)
+# =====================================================
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import CancelledError, Future, TimeoutError
+
+from config.settings import MT5_CALL_TIMEOUT_SEC, MT5_ORDER_TIMEOUT_SEC
+from core.mt5_session import get_session
+from monitoring.logger import get_logger
+from monitoring.telemetry import REGISTRY
+
+log = get_logger(__name__)
+
+# Served by MT5Session's snapshot cache (max_age kwarg honoured)
+SNAPSHOT_CALLS = frozenset(("account_info", "symbol_info", "symbol_info_tick"))
+
+
+class CallResult:
+    """
+    value     : terminal result (or last good value when stale)
+    stale     : value comes from an earlier call (timeout fallback)
+    timed_out : the deadline passed
+    in_flight : timed out while already running (order may still land)
+    latency   : seconds waited by the caller
+    age       : seconds since a stale value was fetched
+    """
+
+    __slots__ = ("value", "stale", "timed_out", "in_flight", "latency", "age")
+
+    def __init__(self, value, stale=False, timed_out=False, in_flight=False,
+                 latency=0.0, age=0.0):
+        self.value = value
+        self.stale = stale
+        self.timed_out = timed_out
+        self.in_flight = in_flight
+        self.latency = latency
+        self.age = age
+
+    def __repr__(self):
+        flags = [f for f in ("stale", "timed_out", "in_flight") if getattr(self, f)]
+        return f"CallResult({self.value!r}, {'|'.join(flags) or 'ok'}, {self.latency * 1e3:.1f}ms)"
+
+
+class MT5Gateway:
+    """
+    MT5 Call Gateway – X6 System
+    ----------------------------
+    ✅ One I/O thread owns every blocking terminal call
+       (incl. the session's account / symbol / tick snapshot misses)
+    ✅ Per‑call deadlines (MT5_CALL_TIMEOUT_SEC / MT5_ORDER_TIMEOUT_SEC)
+    ✅ Identical pending data calls are coalesced (a hung terminal
+       never builds a backlog of duplicates)
+    ✅ Timeout → last good value, flagged stale (data calls only)
+    ✅ Call latency / timeout metrics per call name
+    """
+
+    def __init__(self, session=None, timeout_sec: float = MT5_CALL_TIMEOUT_SEC,
+                 order_timeout_sec: float = MT5_ORDER_TIMEOUT_SEC):
+        self.session = get_session(session)
+        self.timeout_sec = timeout_sec
+        self.order_timeout_sec = order_timeout_sec
+
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+        self._inflight = {}       # key → Future (coalescing)
+        self._last = {}           # key → (monotonic ts, value)
+        self.late_orders = deque(maxlen=100)
+        self.busy_since = None
+
+        self._m_latency = {}
+        self._m_timeouts = {}
+        self._m_stale = REGISTRY.counter(
+            "x6_mt5_stale_results_total", "Timed‑out MT5 calls answered from cache"
+        )
+
+    # ==================================================
+    # I/O THREAD
+    # ==================================================
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._worker, name="x6-mt5-io", daemon=True
+                )
+                self._thread.start()
+
+    def _worker(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            fut, name, args, kwargs = job
+            if not fut.set_running_or_notify_cancel():
+                continue                       # cancelled before start
+
+            t0 = time.perf_counter()
+            self.busy_since = time.monotonic()
+            try:
+                if name in SNAPSHOT_CALLS:
+                    value = getattr(self.session, name)(*args, **kwargs)
+                else:
+                    value = self.session.call(name, *args, **kwargs)
+            except BaseException as e:
+                fut.set_exception(e)
+            else:
+                fut.set_result(value)
+            finally:
+                self.busy_since = None
+                self._latency_metric(name).observe(time.perf_counter() - t0)
+
+    def _latency_metric(self, name):
+        m = self._m_latency.get(name)
+        if m is None:
+            m = self._m_latency[name] = REGISTRY.histogram(
+                "x6_mt5_call_latency_seconds", "MT5 terminal call latency (I/O thread)",
+                labels={"call": name},
+            )
+        return m
+
+    def _timeout_metric(self, name):
+        m = self._m_timeouts.get(name)
+        if m is None:
+            m = self._m_timeouts[name] = REGISTRY.counter(
+                "x6_mt5_call_timeouts_total", "MT5 calls that missed their deadline",
+                labels={"call": name},
+            )
+        return m
+
+    # ==================================================
+    # SUBMIT / CALL
+    # ==================================================
+    def submit(self, name, *args, key=None, **kwargs) -> Future:
+        """
+        Queue a call; returns its Future. Calls with the same `key`
+        share one pending Future.
+        """
+        self._ensure_thread()
+
+        with self._lock:
+            if key is not None:
+                pending = self._inflight.get(key)
+                if pending is not None and not pending.done():
+                    return pending
+
+            fut = Future()
+            if key is not None:
+                self._inflight[key] = fut
+                fut.add_done_callback(lambda f, k=key: self._on_done(k, f))
+            self._queue.put((fut, name, args, kwargs))
+        return fut
+
+    def _on_done(self, key, fut):
+        with self._lock:
+            if self._inflight.get(key) is fut:
+                del self._inflight[key]
+        if fut.cancelled() or fut.exception() is not None:
+            return
+        value = fut.result()
+        if value is not None:
+            self._last[key] = (time.monotonic(), value)
+
+    def call(self, name, *args, timeout: float = None, stale_ok: bool = True, **kwargs) -> CallResult:
+        """
+        Run a (hashable‑argument) data call with a deadline.
+        """
+        key = (name, args, tuple(sorted(kwargs.items())))
+        timeout = self.timeout_sec if timeout is None else timeout
+
+        t0 = time.perf_counter()
+        fut = self.submit(name, *args, key=key, **kwargs)
+        try:
+            value = fut.result(timeout)
+            return CallResult(value, latency=time.perf_counter() - t0)
+        except (TimeoutError, CancelledError):
+            pass
+
+        in_flight = not fut.cancel()
+        self._timeout_metric(name).inc()
+        latency = time.perf_counter() - t0
+
+        last = self._last.get(key)
+        if stale_ok and last is not None:
+            self._m_stale.inc()
+            log.warning("⏱️ MT5 %s timed out after %.2fs → stale value", name, latency)
+            return CallResult(
+                last[1], stale=True, timed_out=True, in_flight=in_flight,
+                latency=latency, age=time.monotonic() - last[0],
+            )
+
+        log.warning("⏱️ MT5 %s timed out after %.2fs (no cached value)", name, latency)
+        return CallResult(None, timed_out=True, in_flight=in_flight, latency=latency)
+
+    def send_order(self, request: dict, timeout: float = None) -> CallResult:
+        """
+        order_send with a deadline. Never coalesced, never stale.
+        Timed out before start → cancelled (not sent). Timed out while
+        running → in_flight; the late result is kept in late_orders.
+        """
+        timeout = self.order_timeout_sec if timeout is None else timeout
+
+        t0 = time.perf_counter()
+        fut = self.submit("order_send", request)
+        try:
+            value = fut.result(timeout)
+            return CallResult(value, latency=time.perf_counter() - t0)
+        except (TimeoutError, CancelledError):
+            pass
+
+        in_flight = not fut.cancel()
+        self._timeout_metric("order_send").inc()
+        latency = time.perf_counter() - t0
+
+        if in_flight:
+            fut.add_done_callback(lambda f, r=request: self._late_order(r, f))
+            log.error("⏱️ MT5 order_send timed out after %.2fs – IN FLIGHT: %s", latency, request)
+        else:
+            log.error("⏱️ MT5 order_send timed out after %.2fs – cancelled before send", latency)
+
+        return CallResult(None, timed_out=True, in_flight=in_flight, latency=latency)
+
+    def _late_order(self, request, fut):
+        if fut.cancelled():
+            return
+        result = fut.exception() or fut.result()
+        self.late_orders.append((time.time(), request, result))
+        log.error("📬 Late order_send result: %s", result)
+
+    # ==================================================
+    # STATUS / SHUTDOWN
+    # ==================================================
+    def stalled_for(self) -> float:
+        """Seconds the I/O thread has been inside the current call."""
+        busy = self.busy_since
+        return 0.0 if busy is None else time.monotonic() - busy
+
+    def stop(self, timeout: float = 1.0):
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+        self._thread = None
+
+
+_GATEWAY = None
+_GATEWAY_LOCK = threading.Lock()
+
+
+def get_gateway(session=None) -> MT5Gateway:
+    """
+    Process‑wide gateway over the shared session; another session
+    (tests / fakes) gets its own gateway.
+    """
+    global _GATEWAY
+    session = get_session(session)
+    with _GATEWAY_LOCK:
+        if _GATEWAY is None:
+            _GATEWAY = MT5Gateway(session)
+        if _GATEWAY.session is not session:
+            return MT5Gateway(session)
+        return _GATEWAY
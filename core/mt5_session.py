@@ -0,0 +1,237 @@
+# core/mt5_session.py
+# =====================================================
+# One MT5 terminal session per process
+#   • initialize() once, reconnect with exponential backoff
+#   • account_info / symbol_info / symbol_info_tick coalesced into
+#     a per‑iteration snapshot (TTL)
+#   • drop‑in for the mt5 module (constants + functions pass through)
+# =====================================================
+
+import threading
+import time
+
+from config.settings import (
+    MT5_RECONNECT_BACKOFF_MAX_SEC,
+    MT5_RECONNECT_BACKOFF_SEC,
+    MT5_SNAPSHOT_TTL_SEC,
+)
+from core.mt5_backend import mt5 as _default_api
+from monitoring.logger import get_logger
+
+log = get_logger(__name__)
+
+# Terminal IPC failures (MetaTrader5 RES_E_INTERNAL_FAIL_*)
+_IPC_ERRORS = frozenset((-10001, -10002, -10003, -10004, -10005))
+
+
+class MT5Session:
+    """
+    MT5 Session Manager – X6 System
+    -------------------------------
+    ✅ Owns the terminal connection (initialize / shutdown refcount)
+    ✅ Reconnect with exponential backoff, never blocks the loop
+    ✅ account_info / symbol_info / symbol_info_tick cached per
+       iteration (begin_iteration) and for at most snapshot_ttl
+    ✅ Any other mt5.* attribute passes through (reconnect‑aware)
+    """
+
+    def __init__(
+        self,
+        api=_default_api,
+        snapshot_ttl: float = MT5_SNAPSHOT_TTL_SEC,
+        backoff_sec: float = MT5_RECONNECT_BACKOFF_SEC,
+        backoff_max_sec: float = MT5_RECONNECT_BACKOFF_MAX_SEC,
+    ):
+        self.api = api
+        self.snapshot_ttl = snapshot_ttl
+        self.backoff_sec = backoff_sec
+        self.backoff_max_sec = backoff_max_sec
+
+        self.connected = False
+        self._users = 0
+        self._lock = threading.Lock()
+
+        self._backoff = backoff_sec
+        self._next_attempt = 0.0
+        self.reconnects = 0
+
+        # snapshot: key → (monotonic ts, value)
+        self._snapshot = {}
+        self.ipc_calls = 0
+        self.cache_hits = 0
+
+        self._wrapped = {}
+
+    # ==================================================
+    # CONNECTION
+    # ==================================================
+    def connect(self, *args, **kwargs) -> bool:
+        """
+        initialize() once; afterwards a no‑op. While disconnected,
+        retries are spaced by the current backoff.
+        """
+        if self.connected:
+            return True
+
+        with self._lock:
+            if self.connected:
+                return True
+
+            now = time.monotonic()
+            if now < self._next_attempt:
+                return False
+
+            self.ipc_calls += 1
+            if self.api.initialize(*args, **kwargs):
+                if self._next_attempt:
+                    self.reconnects += 1
+                    log.info("🔌 MT5 reconnected (attempt backoff %.1fs)", self._backoff)
+                self.connected = True
+                self._backoff = self.backoff_sec
+                self._next_attempt = 0.0
+                return True
+
+            log.warning(
+                "❌ MT5 initialize failed: %s (retry in %.1fs)",
+                self.api.last_error(), self._backoff,
+            )
+            self._next_attempt = now + self._backoff
+            self._backoff = min(self._backoff * 2.0, self.backoff_max_sec)
+            return False
+
+    # mt5‑module compatible names
+    def initialize(self, *args, **kwargs) -> bool:
+        ok = self.connect(*args, **kwargs)
+        if ok:
+            self._users += 1
+        return ok
+
+    def shutdown(self):
+        """
+        Release one user; the terminal is shut down with the last one.
+        """
+        self._users = max(0, self._users - 1)
+        if self._users == 0 and self.connected:
+            self.api.shutdown()
+            self.connected = False
+            self.invalidate()
+        return True
+
+    def _mark_lost(self):
+        if self.connected:
+            log.warning("⚠️ MT5 connection lost: %s", self.api.last_error())
+        self.connected = False
+        self._next_attempt = time.monotonic()   # first retry immediately
+        self.invalidate()
+
+    def _checked(self, result):
+        if result is None:
+            err = self.api.last_error()
+            if err and err[0] in _IPC_ERRORS:
+                self._mark_lost()
+        return result
+
+    # ==================================================
+    # SNAPSHOT (PER ITERATION, TTL)
+    # ==================================================
+    def begin_iteration(self):
+        """Called once per decision loop: next reads hit the terminal."""
+        self._snapshot.clear()
+
+    def invalidate(self, key=None):
+        if key is None:
+            self._snapshot.clear()
+        else:
+            self._snapshot.pop(key, None)
+
+    def _cached(self, key, fetch, max_age):
+        ttl = self.snapshot_ttl if max_age is None else max_age
+        now = time.monotonic()
+
+        hit = self._snapshot.get(key)
+        if hit is not None and now - hit[0] <= ttl:
+            self.cache_hits += 1
+            return hit[1]
+
+        if not self.connected and not self.connect():
+            return None
+
+        self.ipc_calls += 1
+        value = self._checked(fetch())
+        if value is not None:
+            self._snapshot[key] = (now, value)
+        return value
+
+    def account_info(self, max_age: float = None):
+        return self._cached("account", self.api.account_info, max_age)
+
+    def symbol_info(self, symbol, max_age: float = None):
+        return self._cached(
+            ("info", symbol), lambda: self.api.symbol_info(symbol), max_age
+        )
+
+    def symbol_info_tick(self, symbol, max_age: float = None):
+        """max_age=0 → always fresh (order pricing)."""
+        return self._cached(
+            ("tick", symbol), lambda: self.api.symbol_info_tick(symbol), max_age
+        )
+
+    def equity(self) -> float:
+        info = self.account_info()
+        if info is None:
+            return 0.0
+        return float(info.equity) if info.equity is not None else float(info.balance)
+
+    # ==================================================
+    # PASS‑THROUGH (constants raw, calls reconnect‑aware)
+    # ==================================================
+    def call(self, name, *args, **kwargs):
+        if not self.connected and not self.connect():
+            return None
+        self.ipc_calls += 1
+        return self._checked(getattr(self.api, name)(*args, **kwargs))
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        attr = getattr(self.api, name)
+        if not callable(attr) or isinstance(attr, type):
+            return attr
+
+        wrapper = self._wrapped.get(name)
+        if wrapper is None:
+            def wrapper(*args, **kwargs):
+                return self.call(name, *args, **kwargs)
+            wrapper.__name__ = name
+            self._wrapped[name] = wrapper
+        return wrapper
+
+    def stats(self) -> dict:
+        return {
+            "connected": self.connected,
+            "ipc_calls": self.ipc_calls,
+            "cache_hits": self.cache_hits,
+            "reconnects": self.reconnects,
+        }
+
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_session(api=None) -> MT5Session:
+    """
+    Process‑wide session. A session object passed as `api` is
+    returned unchanged; a different API module (tests / fakes) gets
+    its own, unshared session.
+    """
+    global _SESSION
+    if isinstance(api, MT5Session):
+        return api
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = MT5Session(api or _default_api)
+        if api is not None and api is not _SESSION.api:
+            return MT5Session(api)
+        return _SESSION
@@ -0,0 +1,762 @@
+# core/mt5_sim.py
+# =====================================================
+# Simulated MetaTrader5 backend (drop‑in, pure NumPy)
+# Selected with MT5_BACKEND=SIM (see core/mt5_backend.py)
+# =====================================================
+
+import calendar
+import json
+import os
+import time
+import zlib
+from collections import namedtuple
+from datetime import datetime
+
+import numpy as np
+
+from config.settings import (
+    MT5_SIM_DATA_DIR,
+    MT5_SIM_SYMBOLS_FILE,
+    MT5_SIM_BALANCE,
+    MT5_SIM_HISTORY_BARS,
+)
+
+
+# =====================================================
+# CONSTANTS (same values as the MetaTrader5 package)
+# =====================================================
+
+TIMEFRAME_M1 = 1
+TIMEFRAME_M2 = 2
+TIMEFRAME_M3 = 3
+TIMEFRAME_M4 = 4
+TIMEFRAME_M5 = 5
+TIMEFRAME_M6 = 6
+TIMEFRAME_M10 = 10
+TIMEFRAME_M12 = 12
+TIMEFRAME_M15 = 15
+TIMEFRAME_M20 = 20
+TIMEFRAME_M30 = 30
+TIMEFRAME_H1 = 0x4000 | 1
+TIMEFRAME_H2 = 0x4000 | 2
+TIMEFRAME_H3 = 0x4000 | 3
+TIMEFRAME_H4 = 0x4000 | 4
+TIMEFRAME_H6 = 0x4000 | 6
+TIMEFRAME_H8 = 0x4000 | 8
+TIMEFRAME_H12 = 0x4000 | 12
+TIMEFRAME_D1 = 0x4000 | 24
+TIMEFRAME_W1 = 0x8000 | 1
+TIMEFRAME_MN1 = 0xC000 | 1
+
+ORDER_TYPE_BUY = 0
+ORDER_TYPE_SELL = 1
+ORDER_TYPE_BUY_LIMIT = 2
+ORDER_TYPE_SELL_LIMIT = 3
+ORDER_TYPE_BUY_STOP = 4
+ORDER_TYPE_SELL_STOP = 5
+
+TRADE_ACTION_DEAL = 1
+TRADE_ACTION_PENDING = 5
+TRADE_ACTION_SLTP = 6
+TRADE_ACTION_MODIFY = 7
+TRADE_ACTION_REMOVE = 8
+TRADE_ACTION_CLOSE_BY = 10
+
+ORDER_TIME_GTC = 0
+ORDER_TIME_DAY = 1
+
+ORDER_FILLING_FOK = 0
+ORDER_FILLING_IOC = 1
+ORDER_FILLING_RETURN = 2
+
+TRADE_RETCODE_PLACED = 10008
+TRADE_RETCODE_DONE = 10009
+TRADE_RETCODE_REJECT = 10006
+TRADE_RETCODE_INVALID = 10013
+TRADE_RETCODE_INVALID_VOLUME = 10014
+TRADE_RETCODE_INVALID_PRICE = 10015
+TRADE_RETCODE_MARKET_CLOSED = 10018
+TRADE_RETCODE_NO_MONEY = 10019
+TRADE_RETCODE_PRICE_OFF = 10021
+
+SYMBOL_TRADE_MODE_DISABLED = 0
+SYMBOL_TRADE_MODE_FULL = 4
+
+RES_S_OK = 1
+RES_E_FAIL = -1
+RES_E_NOT_FOUND = -4
+
+RATES_DTYPE = np.dtype([
+    ("time", "<i8"),
+    ("open", "<f8"),
+    ("high", "<f8"),
+    ("low", "<f8"),
+    ("close", "<f8"),
+    ("tick_volume", "<u8"),
+    ("spread", "<i4"),
+    ("real_volume", "<u8"),
+])
+
+
+# =====================================================
+# RESULT STRUCTURES
+# =====================================================
+
+AccountInfo = namedtuple("AccountInfo", [
+    "login", "trade_mode", "leverage", "balance", "credit", "profit",
+    "equity", "margin", "margin_free", "currency", "company", "name",
+    "server",
+])
+
+TerminalInfo = namedtuple("TerminalInfo", [
+    "connected", "trade_allowed", "name", "company", "path",
+])
+
+SymbolInfo = namedtuple("SymbolInfo", [
+    "name", "visible", "select", "digits", "spread", "point",
+    "volume_min", "volume_max", "volume_step", "trade_contract_size",
+    "trade_tick_value", "trade_tick_size", "trade_mode", "freeze_level",
+    "margin_initial", "margin_maintenance", "bid", "ask", "description",
+])
+
+Tick = namedtuple("Tick", [
+    "time", "bid", "ask", "last", "volume", "time_msc", "flags",
+    "volume_real",
+])
+
+OrderSendResult = namedtuple("OrderSendResult", [
+    "retcode", "deal", "order", "volume", "price", "bid", "ask",
+    "comment", "request_id", "retcode_external", "request",
+])
+
+TradePosition = namedtuple("TradePosition", [
+    "ticket", "time", "type", "magic", "symbol", "volume", "price_open",
+    "sl", "tp", "price_current", "profit", "comment",
+])
+
+TradeOrder = namedtuple("TradeOrder", [
+    "ticket", "time_setup", "type", "magic", "symbol", "volume_current",
+    "price_open", "sl", "tp", "comment",
+])
+
+
+def timeframe_seconds(timeframe: int) -> int:
+    if timeframe & 0xC000 == 0xC000:
+        return 30 * 86400 * (timeframe & 0x3FFF)
+    if timeframe & 0x8000:
+        return 7 * 86400 * (timeframe & 0x3FFF)
+    if timeframe & 0x4000:
+        return 3600 * (timeframe & 0x3FFF)
+    return 60 * timeframe
+
+
+def _to_epoch(value) -> int:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            return calendar.timegm(value.timetuple())  # MT5: naive = UTC
+        return int(value.timestamp())
+    return int(value)
+
+
+# =====================================================
+# BAR STORE
+# =====================================================
+
+class _BarSeries:
+    """
+    One (symbol, timeframe) series.
+    Loaded from <data_dir>/<SYMBOL>_<TF>.npy, else synthesized
+    (seeded random walk, extended on demand as the clock moves).
+    """
+
+    BLOCK = 4096
+
+    def __init__(self, symbol, timeframe, spec, data_dir, history, now):
+        self.symbol = symbol
+        self.tf_sec = timeframe_seconds(timeframe)
+        self._rng = None
+
+        path = os.path.join(data_dir, f"{symbol}_{timeframe}.npy")
+        if os.path.exists(path):
+            self.rates = np.load(path, mmap_mode="r")
+            self.times = np.asarray(self.rates["time"])
+            return
+
+        seed = zlib.crc32(f"{symbol}:{timeframe}".encode())
+        self._rng = np.random.default_rng(seed)
+        self._spread = int(spec.get("spread") or 10)
+        self._digits = int(spec.get("digits") or 2)
+        self._vol = 0.0008 * np.sqrt(self.tf_sec / 60.0)
+        self._last_close = 10.0 ** (1 + seed % 4) * (1.0 + (seed % 997) / 997.0)
+
+        first = (now // self.tf_sec - history + 1) * self.tf_sec
+        self.rates = np.empty(0, dtype=RATES_DTYPE)
+        self.times = self.rates["time"]
+        self._next_time = first
+        self._extend(history)
+
+    def _block(self, n, first_time, start_price):
+        rng = self._rng
+        r = rng.normal(0.0, self._vol, n)
+        close = start_price * np.exp(np.cumsum(r))
+        open_ = np.empty(n)
+        open_[0] = start_price
+        open_[1:] = close[:-1]
+
+        wick = np.abs(rng.normal(0.0, self._vol * 0.5, (2, n)))
+        block = np.empty(n, dtype=RATES_DTYPE)
+        block["time"] = first_time + np.arange(n) * self.tf_sec
+        block["open"] = np.round(open_, self._digits)
+        block["close"] = np.round(close, self._digits)
+        block["high"] = np.round(np.maximum(open_, close) * (1.0 + wick[0]), self._digits)
+        block["low"] = np.round(np.minimum(open_, close) * (1.0 - wick[1]), self._digits)
+        block["tick_volume"] = rng.poisson(100, n) + 1
+        block["spread"] = self._spread
+        block["real_volume"] = 0
+        return block, float(close[-1])
+
+    def _extend(self, n):
+        block, self._last_close = self._block(n, self._next_time, self._last_close)
+        self.rates = np.concatenate((self.rates, block))
+        self.times = self.rates["time"]
+        self._next_time += n * self.tf_sec
+
+    def _prepend(self, n):
+        first_open = float(self.rates["open"][0])
+        first_time = int(self.times[0]) - n * self.tf_sec
+        block, last_close = self._block(n, first_time, first_open)
+
+        # rescale so the walk ends exactly where the series starts
+        scale = first_open / last_close
+        for name in ("open", "high", "low", "close"):
+            block[name] = np.round(block[name] * scale, self._digits)
+
+        self.rates = np.concatenate((block, self.rates))
+        self.times = self.rates["time"]
+
+    def end_index(self, now: int) -> int:
+        """
+        Number of bars opened at or before `now`.
+        """
+        if self._rng is not None:
+            while self._next_time <= now:
+                self._extend(self.BLOCK)
+        return int(np.searchsorted(self.times, now, side="right"))
+
+    def ensure_from(self, t: int):
+        if self._rng is not None:
+            while len(self.times) and int(self.times[0]) > t:
+                self._prepend(max(self.BLOCK, (int(self.times[0]) - t) // self.tf_sec + 1))
+
+
+# =====================================================
+# TERMINAL STATE
+# =====================================================
+
+class _SimTerminal:
+
+    def __init__(self):
+        self.connected = False
+        self.last_error = (RES_S_OK, "Success")
+
+        self.clock = None          # None → wall clock
+        self.symbols = {}
+        self.selected = set()
+        self.series = {}
+
+        self.balance = MT5_SIM_BALANCE
+        self.positions = {}
+        self.orders = {}
+        self.next_ticket = 1
+
+    def now(self) -> int:
+        return int(time.time()) if self.clock is None else int(self.clock)
+
+    def load_symbols(self):
+        if self.symbols:
+            return
+        if os.path.exists(MT5_SIM_SYMBOLS_FILE):
+            with open(MT5_SIM_SYMBOLS_FILE, "r", encoding="utf-8") as f:
+                for spec in json.load(f):
+                    self.symbols[spec["symbol"]] = spec
+
+    def spec(self, symbol):
+        self.load_symbols()
+        return self.symbols.get(symbol)
+
+    def get_series(self, symbol, timeframe):
+        key = (symbol, timeframe)
+        series = self.series.get(key)
+        if series is None:
+            series = _BarSeries(
+                symbol,
+                timeframe,
+                self.spec(symbol) or {},
+                MT5_SIM_DATA_DIR,
+                MT5_SIM_HISTORY_BARS,
+                self.now(),
+            )
+            self.series[key] = series
+        return series
+
+    def last_bar(self, symbol):
+        series = self.get_series(symbol, TIMEFRAME_M1)
+        end = series.end_index(self.now())
+        if end == 0:
+            return None
+        return series.rates[end - 1]
+
+    def quote(self, symbol):
+        """
+        (bid, ask) from the last M1 close and the bar spread.
+        """
+        bar = self.last_bar(symbol)
+        if bar is None:
+            return None
+        spec = self.spec(symbol) or {}
+        half = 0.5 * float(bar["spread"]) * float(spec.get("point") or 0.01)
+        close = float(bar["close"])
+        return close - half, close + half
+
+
+_term = _SimTerminal()
+
+
+# =====================================================
+# SIMULATION CONTROL (not part of the MT5 API)
+# =====================================================
+
+def sim_set_time(ts):
+    """
+    Freeze the simulated clock at `ts` (epoch seconds or datetime).
+    """
+    _term.clock = _to_epoch(ts)
+    _match_pending()
+
+
+def sim_advance(seconds: float):
+    if _term.clock is None:
+        _term.clock = _term.now()
+    _term.clock += int(seconds)
+    _match_pending()
+
+
+def sim_reset():
+    global _term
+    _term = _SimTerminal()
+
+
+def save_rates(symbol: str, timeframe: int, rates, data_dir: str = None):
+    """
+    Store rates (e.g. dumped from a real terminal) in the local bar store.
+    """
+    data_dir = data_dir or MT5_SIM_DATA_DIR
+    os.makedirs(data_dir, exist_ok=True)
+    out = np.zeros(len(rates), dtype=RATES_DTYPE)
+    for name in RATES_DTYPE.names:
+        if name in rates.dtype.names:
+            out[name] = rates[name]
+    np.save(os.path.join(data_dir, f"{symbol}_{timeframe}.npy"), out)
+
+
+# =====================================================
+# TERMINAL / ACCOUNT
+# =====================================================
+
+def initialize(*args, **kwargs) -> bool:
+    _term.load_symbols()
+    _term.connected = True
+    _term.last_error = (RES_S_OK, "Success")
+    return True
+
+
+def login(login=None, password=None, server=None, **kwargs) -> bool:
+    return _term.connected or initialize()
+
+
+def shutdown():
+    _term.connected = False
+    return True
+
+
+def last_error():
+    return _term.last_error
+
+
+def version():
+    return (500, 0, "SIM")
+
+
+def terminal_info():
+    return TerminalInfo(
+        connected=_term.connected,
+        trade_allowed=True,
+        name="X6 MT5 Simulator",
+        company="X6",
+        path=MT5_SIM_DATA_DIR,
+    )
+
+
+def account_info():
+    if not _term.connected:
+        return None
+
+    profit = sum((p.profit for p in positions_get()), 0.0)
+    equity = _term.balance + profit
+
+    return AccountInfo(
+        login=0,
+        trade_mode=0,
+        leverage=100,
+        balance=round(_term.balance, 2),
+        credit=0.0,
+        profit=round(profit, 2),
+        equity=round(equity, 2),
+        margin=0.0,
+        margin_free=round(equity, 2),
+        currency="USD",
+        company="X6 Simulator",
+        name="SIM",
+        server="SIM",
+    )
+
+
+# =====================================================
+# SYMBOLS
+# =====================================================
+
+def _symbol_info(name, spec):
+    # Only quote symbols whose bars are already in use
+    # (a full scan must not synthesize 300+ series).
+    bid = ask = 0.0
+    if (name, TIMEFRAME_M1) in _term.series:
+        bid, ask = _term.quote(name) or (0.0, 0.0)
+
+    point = float(spec.get("point") or 0.01)
+    contract = float(spec.get("trade_contract_size") or 1.0)
+
+    return SymbolInfo(
+        name=name,
+        visible=True,
+        select=name in _term.selected,
+        digits=spec.get("digits") or 2,
+        spread=spec.get("spread") or 0,
+        point=point,
+        volume_min=spec.get("volume_min") or 0.01,
+        volume_max=spec.get("volume_max") or 100.0,
+        volume_step=spec.get("volume_step") or 0.01,
+        trade_contract_size=contract,
+        trade_tick_value=point * contract,
+        trade_tick_size=point,
+        trade_mode=(
+            SYMBOL_TRADE_MODE_FULL if spec.get("is_tradable", True)
+            else SYMBOL_TRADE_MODE_DISABLED
+        ),
+        freeze_level=spec.get("freeze_level") or 0,
+        margin_initial=spec.get("margin_initial") or 0.0,
+        margin_maintenance=spec.get("margin_maintenance") or 0.0,
+        bid=bid,
+        ask=ask,
+        description=name,
+    )
+
+
+def symbols_total() -> int:
+    _term.load_symbols()
+    return len(_term.symbols)
+
+
+def symbols_get(group=None):
+    _term.load_symbols()
+    names = _term.symbols.keys()
+    if group and group != "*":
+        prefix = group.rstrip("*")
+        names = [n for n in names if n.startswith(prefix)]
+    return tuple(_symbol_info(n, _term.symbols[n]) for n in names)
+
+
+def symbol_select(symbol, enable=True) -> bool:
+    if _term.spec(symbol) is None:
+        _term.last_error = (RES_E_NOT_FOUND, f"Unknown symbol {symbol}")
+        return False
+    if enable:
+        _term.selected.add(symbol)
+    else:
+        _term.selected.discard(symbol)
+    return True
+
+
+def symbol_info(symbol):
+    spec = _term.spec(symbol)
+    if spec is None:
+        _term.last_error = (RES_E_NOT_FOUND, f"Unknown symbol {symbol}")
+        return None
+    return _symbol_info(symbol, spec)
+
+
+def symbol_info_tick(symbol):
+    if _term.spec(symbol) is None:
+        _term.last_error = (RES_E_NOT_FOUND, f"Unknown symbol {symbol}")
+        return None
+    quote = _term.quote(symbol)
+    if quote is None:
+        # No M1 bar yet → no prices (the real API returns None too)
+        _term.last_error = (RES_E_FAIL, f"No quotes for {symbol}")
+        return None
+    bid, ask = quote
+    now = _term.now()
+    return Tick(
+        time=now,
+        bid=bid,
+        ask=ask,
+        last=0.0,
+        volume=0,
+        time_msc=now * 1000,
+        flags=0,
+        volume_real=0.0,
+    )
+
+
+# =====================================================
+# RATES
+# =====================================================
+
+def copy_rates_from_pos(symbol, timeframe, start_pos, count):
+    if _term.spec(symbol) is None:
+        return None
+    series = _term.get_series(symbol, timeframe)
+    end = series.end_index(_term.now()) - int(start_pos)
+    if end <= 0:
+        return np.empty(0, dtype=RATES_DTYPE)
+    return np.array(series.rates[max(0, end - int(count)):end])
+
+
+def copy_rates_from(symbol, timeframe, date_from, count):
+    if _term.spec(symbol) is None:
+        return None
+    series = _term.get_series(symbol, timeframe)
+    series.end_index(_term.now())
+    series.ensure_from(_to_epoch(date_from) - int(count) * series.tf_sec)
+    end = int(np.searchsorted(series.times, _to_epoch(date_from), side="right"))
+    return np.array(series.rates[max(0, end - int(count)):end])
+
+
+def copy_rates_range(symbol, timeframe, date_from, date_to):
+    if _term.spec(symbol) is None:
+        return None
+    series = _term.get_series(symbol, timeframe)
+    series.end_index(_term.now())
+    series.ensure_from(_to_epoch(date_from))
+    lo = int(np.searchsorted(series.times, _to_epoch(date_from), side="left"))
+    hi = int(np.searchsorted(series.times, _to_epoch(date_to), side="right"))
+    return np.array(series.rates[lo:hi])
+
+
+# =====================================================
+# FILL SIMULATOR
+# =====================================================
+
+def _result(retcode, request, comment, order=0, deal=0, volume=0.0, price=0.0, quote=(0.0, 0.0)):
+    return OrderSendResult(
+        retcode=retcode,
+        deal=deal,
+        order=order,
+        volume=volume,
+        price=price,
+        bid=quote[0],
+        ask=quote[1],
+        comment=comment,
+        request_id=0,
+        retcode_external=0,
+        request=request,
+    )
+
+
+def _valid_volume(spec, volume) -> bool:
+    vmin = spec.get("volume_min") or 0.01
+    vmax = spec.get("volume_max") or 100.0
+    step = spec.get("volume_step") or 0.01
+    if volume < vmin - 1e-12 or volume > vmax + 1e-12:
+        return False
+    return abs(round(volume / step) * step - volume) < 1e-9
+
+
+def _open_position(symbol, order_type, volume, price, request):
+    ticket = _term.next_ticket
+    _term.next_ticket += 1
+    _term.positions[ticket] = {
+        "ticket": ticket,
+        "time": _term.now(),
+        "type": ORDER_TYPE_BUY if order_type in (ORDER_TYPE_BUY, ORDER_TYPE_BUY_LIMIT) else ORDER_TYPE_SELL,
+        "magic": request.get("magic", 0),
+        "symbol": symbol,
+        "volume": volume,
+        "price_open": price,
+        "sl": request.get("sl", 0.0),
+        "tp": request.get("tp", 0.0),
+        "comment": request.get("comment", ""),
+    }
+    return ticket
+
+
+def _close_position(ticket, price):
+    pos = _term.positions.pop(ticket)
+    _term.balance += _position_profit(pos, price)
+
+
+def _position_profit(pos, price) -> float:
+    spec = _term.spec(pos["symbol"]) or {}
+    contract = float(spec.get("trade_contract_size") or 1.0)
+    sign = 1.0 if pos["type"] == ORDER_TYPE_BUY else -1.0
+    return sign * (price - pos["price_open"]) * pos["volume"] * contract
+
+
+def _match_pending():
+    """
+    Fill resting limit orders touched by the latest M1 bar.
+    """
+    for ticket, order in list(_term.orders.items()):
+        bar = _term.last_bar(order["symbol"])
+        if bar is None:
+            continue
+        price = order["price_open"]
+        touched = (
+            float(bar["low"]) <= price if order["type"] == ORDER_TYPE_BUY_LIMIT
+            else float(bar["high"]) >= price
+        )
+        if touched:
+            del _term.orders[ticket]
+            _open_position(order["symbol"], order["type"], order["volume"], price, order)
+
+
+def order_send(request: dict):
+    if not _term.connected:
+        _term.last_error = (RES_E_FAIL, "Terminal not initialized")
+        return None
+
+    symbol = request.get("symbol")
+    action = request.get("action")
+    spec = _term.spec(symbol) if symbol else None
+
+    if action == TRADE_ACTION_REMOVE:
+        order = _term.orders.pop(request.get("order"), None)
+        if order is None:
+            return _result(TRADE_RETCODE_INVALID, request, "Unknown order")
+        return _result(TRADE_RETCODE_DONE, request, "Removed", order=order["ticket"])
+
+    if spec is None:
+        return _result(TRADE_RETCODE_INVALID, request, "Unknown symbol")
+
+    if not spec.get("is_tradable", True):
+        return _result(TRADE_RETCODE_MARKET_CLOSED, request, "Trade disabled")
+
+    volume = float(request.get("volume", 0.0))
+    if not _valid_volume(spec, volume):
+        return _result(TRADE_RETCODE_INVALID_VOLUME, request, "Invalid volume")
+
+    quote = _term.quote(symbol)
+    order_type = request.get("type")
+
+    # ---- Market deal (fill at bid / ask) ----
+    if action == TRADE_ACTION_DEAL:
+        if quote is None:
+            return _result(TRADE_RETCODE_PRICE_OFF, request, "No prices")
+        price = quote[1] if order_type == ORDER_TYPE_BUY else quote[0]
+
+        position = request.get("position")
+        if position in _term.positions:
+            _close_position(position, price)
+            return _result(TRADE_RETCODE_DONE, request, "Closed",
+                           deal=position, volume=volume, price=price, quote=quote)
+
+        ticket = _open_position(symbol, order_type, volume, price, request)
+        return _result(TRADE_RETCODE_DONE, request, "Done",
+                       order=ticket, deal=ticket, volume=volume, price=price, quote=quote)
+
+    # ---- Pending limit (rests until touched) ----
+    if action == TRADE_ACTION_PENDING:
+        if order_type not in (ORDER_TYPE_BUY_LIMIT, ORDER_TYPE_SELL_LIMIT):
+            return _result(TRADE_RETCODE_INVALID, request, "Unsupported order type")
+
+        price = float(request.get("price", 0.0))
+        if price <= 0:
+            return _result(TRADE_RETCODE_INVALID_PRICE, request, "Invalid price")
+
+        ticket = _term.next_ticket
+        _term.next_ticket += 1
+        _term.orders[ticket] = {
+            "ticket": ticket,
+            "time_setup": _term.now(),
+            "type": order_type,
+            "magic": request.get("magic", 0),
+            "symbol": symbol,
+            "volume": volume,
+            "price_open": price,
+            "sl": request.get("sl", 0.0),
+            "tp": request.get("tp", 0.0),
+            "comment": request.get("comment", ""),
+        }
+        _match_pending()
+        return _result(TRADE_RETCODE_DONE, request, "Placed",
+                       order=ticket, volume=volume, price=price, quote=quote or (0.0, 0.0))
+
+    return _result(TRADE_RETCODE_INVALID, request, "Unsupported action")
+
+
+# =====================================================
+# POSITIONS / ORDERS
+# =====================================================
+
+def positions_get(symbol=None, ticket=None):
+    out = []
+    for pos in _term.positions.values():
+        if symbol and pos["symbol"] != symbol:
+            continue
+        if ticket and pos["ticket"] != ticket:
+            continue
+        # No quote yet → mark at the open price (zero profit)
+        bid, ask = _term.quote(pos["symbol"]) or (pos["price_open"], pos["price_open"])
+        current = bid if pos["type"] == ORDER_TYPE_BUY else ask
+        out.append(TradePosition(
+            ticket=pos["ticket"],
+            time=pos["time"],
+            type=pos["type"],
+            magic=pos["magic"],
+            symbol=pos["symbol"],
+            volume=pos["volume"],
+            price_open=pos["price_open"],
+            sl=pos["sl"],
+            tp=pos["tp"],
+            price_current=current,
+            profit=round(_position_profit(pos, current), 2),
+            comment=pos["comment"],
+        ))
+    return tuple(out)
+
+
+def positions_total() -> int:
+    return len(_term.positions)
+
+
+def orders_get(symbol=None, ticket=None):
+    return tuple(
+        TradeOrder(
+            ticket=o["ticket"],
+            time_setup=o["time_setup"],
+            type=o["type"],
+            magic=o["magic"],
+            symbol=o["symbol"],
+            volume_current=o["volume"],
+            price_open=o["price_open"],
+            sl=o["sl"],
+            tp=o["tp"],
+            comment=o["comment"],
+        )
+        for o in _term.orders.values()
+        if (not symbol or o["symbol"] == symbol)
+        and (not ticket or o["ticket"] == ticket)
+    )
+
+
+def orders_total() -> int:
+    return len(_term.orders)
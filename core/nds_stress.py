@@ -1,5 +1,8 @@
 import numpy as np
 
+from core.rolling_stats import RollingSum
+
+
 class NDSStressEngine:
     def __init__(
         self,
@@ -18,7 +21,8 @@ class NDSStressEngine:
         if len(cycle_htf) < 2:
             return 0.0
 
-        slope = np.gradient(cycle_htf)[-1]
+        # last point of np.gradient (one‑sided) – no full‑array pass
+        slope = float(cycle_htf[-1]) - float(cycle_htf[-2])
         return self.alpha_k * abs(slope)
 
     def compute_nodal_capacity(self, nodes_ltf: np.ndarray) -> float:
@@ -37,3 +41,113 @@ class NDSStressEngine:
 
         stress = pressure / capacity
         return float(np.clip(stress, 0.0, self.clip_max))
+
+    # ---------- streaming / batch with the same parameters ----------
+    def stream(self, window: int = 50) -> "NDSStressStream":
+        return NDSStressStream(self.alpha_k, self.eps, self.clip_max, window)
+
+    def series(self, cycle_htf, nodes_ltf, htf_index=None, window: int = 50):
+        return stress_series(
+            cycle_htf, nodes_ltf, htf_index, window,
+            self.alpha_k, self.eps, self.clip_max,
+        )
+
+
+class NDSStressStream:
+    """
+    Streaming NDS Stress – X6 System
+    --------------------------------
+    ✅ Pressure : |last HTF cycle slope| · α_k   (update_htf, O(1))
+    ✅ Capacity : Σ|Δn| over the last `window` LTF node moves + eps
+                  (update_ltf, O(1) rolling sum)
+    ✅ stress   : clip(P / C, 0, clip_max), readable at any time
+
+    HTF and LTF are fed independently, each on its own bar close.
+    """
+
+    __slots__ = (
+        "alpha_k", "eps", "clip_max", "window",
+        "_cycle", "_node", "_moves", "pressure",
+    )
+
+    def __init__(
+        self,
+        alpha_k: float = 1.0,
+        eps: float = 1e-8,
+        clip_max: float = 5.0,
+        window: int = 50,
+    ):
+        self.alpha_k = alpha_k
+        self.eps = eps
+        self.clip_max = clip_max
+        self.window = int(window)
+
+        self._cycle = None
+        self._node = None
+        self._moves = RollingSum(self.window)
+        self.pressure = 0.0
+
+    def update_htf(self, cycle: float) -> float:
+        cycle = float(cycle)
+        if self._cycle is not None:
+            self.pressure = self.alpha_k * abs(cycle - self._cycle)
+        self._cycle = cycle
+        return self.pressure
+
+    def update_ltf(self, node: float) -> float:
+        node = float(node)
+        if self._node is not None:
+            self._moves.push(abs(node - self._node))
+        self._node = node
+        return self.stress
+
+    @property
+    def capacity(self) -> float:
+        return self._moves.sum + self.eps if len(self._moves) else self.eps
+
+    @property
+    def stress(self) -> float:
+        stress = self.pressure / self.capacity
+        return min(max(stress, 0.0), self.clip_max)
+
+
+def stress_series(
+    cycle_htf,
+    nodes_ltf,
+    htf_index=None,
+    window: int = 50,
+    alpha_k: float = 1.0,
+    eps: float = 1e-8,
+    clip_max: float = 5.0,
+):
+    """
+    Whole stress history in one vectorized pass (last axis = time).
+
+    cycle_htf : (H,) or (symbols, H) HTF cycle values
+    nodes_ltf : (T,) or (symbols, T) LTF node values
+    htf_index : (T,) index of the latest closed HTF value at each
+                LTF bar (‑1 → none yet); None → both on one clock
+
+    stress[..., t] equals NDSStressStream after the same updates.
+    """
+    cycle = np.asarray(cycle_htf, dtype=np.float64)
+    nodes = np.asarray(nodes_ltf, dtype=np.float64)
+    size = nodes.shape[-1]
+
+    # ---- pressure per HTF value, mapped onto the LTF clock ----
+    pressure = np.zeros_like(cycle)
+    pressure[..., 1:] = alpha_k * np.abs(np.diff(cycle, axis=-1))
+    if htf_index is None:
+        htf_index = np.arange(size)
+    htf_index = np.asarray(htf_index)
+    p = np.where(htf_index >= 1, pressure[..., np.maximum(htf_index, 0)], 0.0)
+
+    # ---- rolling Σ|Δn| over the last `window` moves ----
+    moves = np.abs(np.diff(nodes, axis=-1))
+    csum = np.zeros(nodes.shape)
+    csum[..., 1:] = np.cumsum(moves, axis=-1)
+    end = np.arange(size)
+    begin = np.maximum(end - window, 0)
+    capacity = csum[..., end] - csum[..., begin] + eps
+
+    return np.clip(p / capacity, 0.0, clip_max)
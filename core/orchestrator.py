@@ -1,17 +1,36 @@
+import time
+from typing import TYPE_CHECKING
+
 import numpy as np
 
-from core.data_feed import MarketDataFeed
 from core.vwap_engine import VWAPEngine
 from core.vwap_regime import VWAPRegimeDetector
 
 from monitoring.kill_switch import KillSwitch
 from ai.hmm_stress import HMMStressDetector
+from ai.feature_engineering import FeatureStore
+from ai.online_model import EdgeModel
 from risk.risk_mapper import RiskBudgetMapper
 
 from execution.stop_engine import StopEngine
 from execution.position_sizer import PositionSizer
 from execution.execution_intent import ExecutionIntent
 
+from monitoring.stage_profiler import StageProfiler
+from monitoring.logger import get_logger
+from monitoring.telemetry import REGISTRY
+from config.settings import (
+    PROFILE_STAGES,
+    PROFILE_REPORT_SEC,
+    DECISION_CACHE,
+    DECISION_EQUITY_BUCKET_PCT,
+)
+
+if TYPE_CHECKING:
+    from core.market_data import MarketDataFeed
+
+log = get_logger(__name__)
+
 
 class Orchestrator:
     """
@@ -24,12 +43,23 @@ class Orchestrator:
     ✅ Position Sizing
     ✅ ExecutionIntent creation
     ✅ ExecutionGate injection
+    ✅ Per‑stage latency profile (PROFILE_STAGES)
+    ✅ Telemetry (monitoring.telemetry REGISTRY)
+    ✅ Feature Store (HMM features + returns, once per closed bar)
+    ✅ Online edge score (O(d) update per closed bar)
+    ✅ Decision cache (one decision + send per closed bar)
+    ✅ Streaming VWAP snapshot when the feed provides one (replay)
     ❌ Ledger
     ❌ Forced Entry / Exit
     ====================================================
     """
 
-    def __init__(self, data_feed: MarketDataFeed):
+    STAGES = (
+        "data", "equity", "vwap", "regime", "stress",
+        "risk", "stop", "sizing", "execution",
+    )
+
+    def __init__(self, data_feed: "MarketDataFeed"):
         if isinstance(data_feed, type):
             raise RuntimeError(
                 "MarketDataFeed must be an instance, not a class"
@@ -56,6 +86,32 @@ class Orchestrator:
         self.risk_mapper = RiskBudgetMapper()
         self.stop_engine = StopEngine()
 
+        # ===============================
+        # Feature Store (closed bars)
+        # ===============================
+        self.features = FeatureStore()
+        self._feature_series = (
+            self.data_feed.symbol,
+            getattr(self.data_feed, "timeframe", None),
+        )
+        # Windowed VWAP is NaN until full: half the feed window leaves
+        # the stress model finite rows from the first iteration
+        hmm_vwap_window = max(1, getattr(self.data_feed, "bars", 2000) // 2)
+        self._hmm_features = [
+            ("vwap_dev", {"window": hmm_vwap_window}),
+            ("vol_weight", {"window": self.vwap_engine.vol_ma_window}),
+        ]
+        self._edge_features = self._hmm_features + [("return", {})]
+        for name, params in self._edge_features:
+            self.features.declare(*self._feature_series, name, **params)
+
+        # ===============================
+        # Online Edge Model
+        # ===============================
+        self.edge_model = EdgeModel(n_features=len(self._edge_features))
+        # Restored model: bars up to this time (ns) are already learned
+        self._edge_learned_until = None
+
         # ===============================
         # Position Sizer
         # ===============================
@@ -73,14 +129,94 @@ class Orchestrator:
         # ===============================
         # Execution (Injected by Runner)
         # ===============================
+        # wrap_adapter(adapter) → adapter, applied to every injected
+        # gate (e.g. session recording of adapter responses)
+        self.wrap_adapter = None
+        self._pending_feedback = None       # restored before injection
         self.execution_gate = None
 
+        # ===============================
+        # Stage Profiler
+        # ===============================
+        self.profiler = StageProfiler(
+            stages=self.STAGES,
+            enabled=PROFILE_STAGES,
+            report_every_sec=PROFILE_REPORT_SEC,
+            sink=lambda line: log.info("%s", line),
+        )
+
+        self._init_metrics()
+
+        # Live feeds refresh their account / symbol snapshot per iteration
+        self._begin_iteration = getattr(self.data_feed, "begin_iteration", None)
+
+        # Replay feeds keep a streaming VWAP of their window (O(1) per bar)
+        self._vwap_snapshot = getattr(self.data_feed, "vwap_snapshot", None)
+
+        # Decision cache: bumped whenever engine state is replaced
+        self.last_decision = None
+        self._state_version = 0
+
         self._i = 0
 
+    # ==================================================
+    # Telemetry handles (registered once)
+    # ==================================================
+    def _init_metrics(self):
+        ks = self.kill_switch
+
+        self._m_loops = REGISTRY.counter(
+            "x6_loop_iterations_total", "Orchestrator.run_once calls"
+        )
+        self._m_loop_latency = REGISTRY.histogram(
+            "x6_loop_latency_seconds", "Orchestrator.run_once wall time"
+        )
+        self._m_stress = REGISTRY.gauge(
+            "x6_stress_score", "Latest HMM stress score"
+        )
+        self._m_equity = REGISTRY.gauge(
+            "x6_equity", "Latest account equity"
+        )
+        self._m_vwap_dev = REGISTRY.gauge(
+            "x6_vwap_dev", "Latest VWAP deviation"
+        )
+        self._m_edge = REGISTRY.gauge(
+            "x6_edge_score", "Online model edge score [-1, 1]"
+        )
+        self._m_decision_hits = REGISTRY.counter(
+            "x6_decision_cache_hits_total", "Iterations that reused the last decision"
+        )
+
+        REGISTRY.gauge(
+            "x6_kill_switch_tripped", "1 when the kill switch is tripped",
+            fn=lambda: float(ks.tripped),
+        )
+        REGISTRY.gauge(
+            "x6_kill_switch_armed", "1 once the kill switch is armed",
+            fn=lambda: float(ks.start_equity is not None),
+        )
+        REGISTRY.gauge(
+            "x6_kill_switch_rejections", "Rejections counted by the kill switch",
+            fn=lambda: ks.rejections,
+        )
+
     # ==================================================
     # One deterministic iteration – Phase‑10A
     # ==================================================
     def run_once(self):
+        t0 = time.perf_counter()
+        self.profiler.begin()
+        if self._begin_iteration is not None:
+            self._begin_iteration()
+        try:
+            self._run_pipeline()
+        finally:
+            self.profiler.end()
+            self._m_loops.inc()
+            self._m_loop_latency.observe(time.perf_counter() - t0)
+
+    def _run_pipeline(self):
+        prof = self.profiler
 
         # ===== ARM KILL SWITCH (ONCE) =====
         if not self._armed:
@@ -89,50 +225,168 @@ class Orchestrator:
             self._armed = True
 
         if not self.kill_switch.can_trade():
-            print(f"🚨 KILL SWITCH: {self.kill_switch.trip_reason}")
+            log.warning("🚨 KILL SWITCH: %s", self.kill_switch.trip_reason)
             return
 
         # ===== MARKET DATA =====
         df = self.data_feed.get_data()
         if df is None or len(df) < 50:
-            print("⚠️ Not enough market data")
+            log.warning("⚠️ Not enough market data")
             return
 
         price = float(df["close"].iloc[-1])
-        symbol = self.data_feed.symbol
+        # Live windows end in the forming bar; replay windows are closed
+        new_bars = self.features.ingest(
+            *self._feature_series,
+            df,
+            closed_only=getattr(self.data_feed, "last_bar_forming", True),
+        )
+        if new_bars:
+            self._update_edge(new_bars)
+        prof.lap("data")
 
-        # ===== VWAP ENGINE =====
-        vwap_df = self.vwap_engine.compute(df)
+        # One equity read per iteration (kill switch + risk)
+        equity = self.data_feed.get_equity()
+        self._m_equity.set(equity)
+        self.kill_switch.check_equity(equity)
+        prof.lap("equity")
+
+        # ===== DECISION (ONCE PER CLOSED BAR) =====
+        key = self._decision_key(equity)
+        decision = self.last_decision
+        if key is None or decision is None or decision["key"] != key:
+            decision = self._decide(df, price, equity, key)
+            if decision is None:
+                return
+            self.last_decision = decision
+        else:
+            self._m_decision_hits.inc()
+
+        if not self.kill_switch.can_trade():
+            log.warning("🚨 KILL SWITCH: %s", self.kill_switch.trip_reason)
+            return
+
+        if decision["size"] <= 0:
+            if not decision["sent"]:
+                log.info("⚠️ SIZE = 0 → Skip")
+                decision["sent"] = True
+            return
 
-        vwap_dev   = float(vwap_df["vwap_dev"].iloc[-1])
-        vol_weight = float(vwap_df["vol_weight"].iloc[-1])
-        bar_range  = float(vwap_df["bar_range"].iloc[-1])
-        avg_range  = float(vwap_df["avg_range"].iloc[-1])
-        atr        = float(vwap_df["atr"].iloc[-1])
+        if decision["sent"]:
+            return                          # same decision already executed
+
+        # ===== EXECUTION INTENT =====
+        if getattr(self.data_feed, "data_stale", False):
+            log.warning("⏱️ Stale market data (terminal timeout) → no execution")
+            return
+
+        if self.execution_gate is None:
+            raise RuntimeError(
+                "ExecutionGate is not injected"
+            )
+
+        intent = ExecutionIntent(
+            symbol=self.data_feed.symbol,
+            side="BUY",
+            size=decision["size"],
+            limit_price=price,
+            stop_price=decision["stop_price"],
+            take_profit=None,
+            comment="PHASE10A_DRY",
+        )
+
+        exec_result = self.execution_gate.send(intent)
+        decision["sent"] = True
+        decision["exec"] = exec_result
+        prof.lap("execution")
+
+        # ===== LOG (formatted on the writer thread) =====
+        log.info(
+            "VWAP Dev %+.5f | Regime %s | Stress %.2f | Equity %.2f | "
+            "Risk USD %.2f | STOP %.5f (%s) | SIZE %s | Edge %+.3f | EXEC %s",
+            decision["vwap_dev"],
+            decision["regime"],
+            decision["stress"],
+            equity,
+            decision["risk_amount"],
+            decision["stop_price"],
+            decision["stop_reason"],
+            decision["size"],
+            self.edge_model.edge,
+            exec_result,
+        )
+
+        self._i += 1
+
+    # ==================================================
+    # Decision cache
+    # ==================================================
+    def _decision_key(self, equity: float):
+        """
+        (symbol, last closed bar, equity bucket, engine‑state version).
+        Unchanged key → the closed‑bar inputs of VWAP / regime / stress
+        / risk / stop / sizing are unchanged too.
+        """
+        if not DECISION_CACHE:
+            return None
+
+        start = self.kill_switch.start_equity or 0.0
+        step = abs(start) * DECISION_EQUITY_BUCKET_PCT / 100.0
+        bucket = int(equity // step) if step > 0 else equity
+
+        return (
+            self.data_feed.symbol,
+            self.features.last_time(*self._feature_series),
+            bucket,
+            self._state_version,
+        )
+
+    def _decide(self, df, price: float, equity: float, key):
+        prof = self.profiler
+
+        # ===== VWAP ENGINE =====
+        snap = self._vwap_snapshot() if self._vwap_snapshot is not None else None
+        if snap is not None:
+            vwap_dev   = snap.vwap_dev
+            vol_weight = snap.vol_weight
+            bar_range  = snap.bar_range
+            avg_range  = snap.avg_range
+            atr        = snap.atr
+        else:
+            vwap_df = self.vwap_engine.compute(df)
+
+            vwap_dev   = float(vwap_df["vwap_dev"].iloc[-1])
+            vol_weight = float(vwap_df["vol_weight"].iloc[-1])
+            bar_range  = float(vwap_df["bar_range"].iloc[-1])
+            avg_range  = float(vwap_df["avg_range"].iloc[-1])
+            atr        = float(vwap_df["atr"].iloc[-1])
+        prof.lap("vwap")
 
         # ===== REGIME =====
-        regime = self.vwap_regime.detect(
+        regime = self.vwap_regime.update(
             vwap_dev,
             vol_weight,
             bar_range,
             avg_range,
         )
+        prof.lap("regime")
 
         # ===== STRESS =====
-        features = vwap_df[["vwap_dev", "vol_weight"]].values
+        features = self.features.window(
+            *self._feature_series, self._hmm_features, n=len(df)
+        )
         stress_score = float(self.hmm_stress.detect(features))
+        self._m_stress.set(stress_score)
+        self._m_vwap_dev.set(vwap_dev)
+        prof.lap("stress")
 
         self.kill_switch.check_stress(stress_score)
-        self.kill_switch.check_equity(
-            self.data_feed.get_equity()
-        )
 
         if not self.kill_switch.can_trade():
-            print(f"🚨 KILL SWITCH: {self.kill_switch.trip_reason}")
-            return
+            log.warning("🚨 KILL SWITCH: %s", self.kill_switch.trip_reason)
+            return None
 
         # ===== RISK =====
-        equity = self.data_feed.get_equity()
 
         risk = self.risk_mapper.compute(
             equity=equity,
@@ -142,14 +396,11 @@ class Orchestrator:
         )
 
         risk_amount = risk["risk_amount"]
+        prof.lap("risk")
 
         # ===== STOP =====
-        returns = (
-            df["close"]
-            .pct_change()
-            .dropna()
-            .values[-100:]
-        )
+        returns = self.features.window(*self._feature_series, "return", n=100)
+        returns = returns[~np.isnan(returns)]
 
         stop_price, stop_reason = self.stop_engine.compute(
             direction="LONG",
@@ -159,6 +410,7 @@ class Orchestrator:
             nds_slope=vwap_dev,
             returns=returns,
         )
+        prof.lap("stop")
 
         # ===== POSITION SIZE =====
         size_info = self.position_sizer.compute(
@@ -169,43 +421,104 @@ class Orchestrator:
             stress_score=stress_score,
             nds_slope=vwap_dev,
         )
+        prof.lap("sizing")
+
+        return {
+            "key": key,
+            "vwap_dev": vwap_dev,
+            "regime": regime,
+            "stress": stress_score,
+            "risk_amount": risk_amount,
+            "stop_price": stop_price,
+            "stop_reason": stop_reason,
+            "size": size_info["size"],
+            "sent": False,
+            "exec": None,
+        }
 
-        if size_info["size"] <= 0:
-            print("⚠️ SIZE = 0 → Skip")
-            return
-
-        # ===== EXECUTION INTENT =====
-        if self.execution_gate is None:
-            raise RuntimeError(
-                "ExecutionGate is not injected"
-            )
-
-        intent = ExecutionIntent(
-            symbol=symbol,
-            side="BUY",
-            size=size_info["size"],
-            limit_price=price,
-            stop_price=stop_price,
-            take_profit=None,
-            comment="PHASE10A_DRY",
-        )
-
-        exec_result = self.execution_gate.send(intent)
-
-        # ===== LOG =====
-        print("--------------------------------------------------")
-        print(f"VWAP Dev : {vwap_dev:+.5f}")
-        print(f"Regime   : {regime}")
-        print(f"Stress   : {stress_score:.2f}")
-        print(f"Equity   : {equity:.2f}")
-        print(f"Risk USD : {risk_amount:.2f}")
-        print(f"STOP     : {stop_price:.5f} ({stop_reason})")
-        print(f"SIZE     : {size_info['size']}")
-        print(f"EXEC     : {exec_result}")
-        print("--------------------------------------------------")
-
-        self._i += 1
+    # ==================================================
+    # Online edge model (closed bars only)
+    # ==================================================
+    def _update_edge(self, new_bars: int):
+        X = self.features.window(*self._feature_series, self._edge_features, n=new_bars)
+        R = self.features.window(*self._feature_series, "return", n=new_bars)
+
+        start = 0
+        learned = self._edge_learned_until
+        if learned is not None:
+            # restored model: skip the history it learned before the checkpoint
+            self._edge_learned_until = None
+            times = self.features.times(*self._feature_series, n=len(X))
+            start = int(np.searchsorted(times, learned, side="right"))
+        elif len(X) > 1 and self.edge_model.model.n_updates == 0:
+            self.edge_model.warm_start(X, R)       # fresh model: replay history
+            start = len(X) - 1
+
+        for i in range(start, len(X)):
+            self.edge_model.on_bar(X[i], R[i])
+
+        self._m_edge.set(self.edge_model.edge)
 
     # Backward compatibility
     def run(self):
         self.run_once()
+
+    # ==================================================
+    # Execution gate (injected by runner)
+    # ==================================================
+    @property
+    def execution_gate(self):
+        return self._execution_gate
+
+    @execution_gate.setter
+    def execution_gate(self, gate):
+        if gate is not None and self.wrap_adapter is not None:
+            gate.adapter = self.wrap_adapter(gate.adapter)
+        if gate is not None and self._pending_feedback is not None:
+            gate.feedback.set_state(self._pending_feedback)
+            self._pending_feedback = None
+        self._execution_gate = gate
+
+    # ==================================================
+    # Checkpoint (hot restart)
+    # ==================================================
+    def get_state(self) -> dict:
+        state = {
+            "armed": self._armed,
+            "iteration": self._i,
+            "kill_switch": self.kill_switch.get_state(),
+            "hmm_stress": self.hmm_stress.get_state(),
+            "stop_engine": self.stop_engine.get_state(),
+            "edge_model": self.edge_model.get_state(),
+            "edge_learned_until": (
+                self.features.last_time(*self._feature_series)
+                or self._edge_learned_until
+            ),
+        }
+
+        if self.execution_gate is not None:
+            state["feedback"] = self.execution_gate.feedback.get_state()
+        elif self._pending_feedback is not None:
+            state["feedback"] = self._pending_feedback
+
+        return state
+
+    def set_state(self, state: dict):
+        self._armed = bool(state.get("armed", False))
+        self._i = int(state.get("iteration", 0))
+
+        self.kill_switch.set_state(state.get("kill_switch", {}))
+        self.hmm_stress.set_state(state.get("hmm_stress", {}))
+        self.stop_engine.set_state(state.get("stop_engine", {}))
+        self.edge_model.set_state(state.get("edge_model", {}))
+
+        self._edge_learned_until = state.get("edge_learned_until")
+
+        if "feedback" in state:
+            if self.execution_gate is not None:
+                self.execution_gate.feedback.set_state(state["feedback"])
+            else:
+                self._pending_feedback = state["feedback"]
+
+        self._state_version += 1
+        self.last_decision = None
@@ -0,0 +1,239 @@
+# core/rolling_stats.py
+# =====================================================
+# Streaming rolling statistics (O(1) per push)
+#   RollingWindow  – last n values, lag access
+#   RollingSum     – windowed sum / mean (drift‑free)
+#   RollingMeanVar – windowed Welford mean / variance
+#   RollingMin / RollingMax – monotonic deques
+#   EWMA           – exponential mean / variance
+# No per‑push allocation: fixed rings, Python floats.
+# =====================================================
+
+import math
+import operator
+from collections import deque
+
+
+class RollingWindow:
+    """
+    Fixed ring of the last `size` values.
+    w[-1] = newest, w[-2] = previous, ...
+    """
+
+    __slots__ = ("size", "_buf", "_pos", "_count")
+
+    def __init__(self, size: int):
+        self.size = int(size)
+        self._buf = [0.0] * self.size
+        self._pos = 0
+        self._count = 0
+
+    def push(self, x: float):
+        """
+        Returns the value that fell out of the window (None until full).
+        """
+        old = self._buf[self._pos] if self._count == self.size else None
+        self._buf[self._pos] = x
+        self._pos = (self._pos + 1) % self.size
+        if self._count < self.size:
+            self._count += 1
+        return old
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def full(self) -> bool:
+        return self._count == self.size
+
+    def __getitem__(self, lag: int) -> float:
+        if not -self._count <= lag < 0:
+            raise IndexError("RollingWindow supports lags -1 .. -len")
+        return self._buf[(self._pos + lag) % self.size]
+
+    def values(self) -> list:
+        """Oldest → newest (copy; not for the hot path)."""
+        return [self[-k] for k in range(self._count, 0, -1)]
+
+    def clear(self):
+        self._pos = 0
+        self._count = 0
+
+
+class RollingSum:
+    """
+    Windowed sum. The sum is rebuilt from the ring once per wrap
+    (amortized O(1)) so float drift never accumulates.
+    """
+
+    __slots__ = ("window", "_sum")
+
+    def __init__(self, size: int):
+        self.window = RollingWindow(size)
+        self._sum = 0.0
+
+    def push(self, x: float) -> float:
+        w = self.window
+        old = w.push(x)
+        if old is None:
+            self._sum += x
+        elif w._pos == 0:
+            self._sum = math.fsum(w._buf)
+        else:
+            self._sum += x - old
+        return self._sum
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    @property
+    def mean(self) -> float:
+        n = len(self.window)
+        return self._sum / n if n else math.nan
+
+    def __len__(self):
+        return len(self.window)
+
+    @property
+    def full(self) -> bool:
+        return self.window.full
+
+
+class RollingMeanVar:
+    """
+    Windowed mean / variance: Welford add + Welford remove.
+    """
+
+    __slots__ = ("window", "_mean", "_m2")
+
+    def __init__(self, size: int):
+        self.window = RollingWindow(size)
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def push(self, x: float):
+        old = self.window.push(x)
+        if old is None:
+            n = len(self.window)
+            delta = x - self._mean
+            self._mean += delta / n
+            self._m2 += delta * (x - self._mean)
+        else:
+            # replace `old` by `x` at constant n
+            n = self.window.size
+            mean_old = self._mean
+            self._mean += (x - old) / n
+            self._m2 += (x - old) * (x - self._mean + old - mean_old)
+            if self._m2 < 0.0:
+                self._m2 = 0.0
+
+    def __len__(self):
+        return len(self.window)
+
+    @property
+    def full(self) -> bool:
+        return self.window.full
+
+    @property
+    def mean(self) -> float:
+        return self._mean if len(self.window) else math.nan
+
+    def var(self, ddof: int = 0) -> float:
+        n = len(self.window)
+        if n - ddof <= 0:
+            return math.nan
+        return self._m2 / (n - ddof)
+
+    def std(self, ddof: int = 0) -> float:
+        v = self.var(ddof)
+        return math.sqrt(v) if v == v else math.nan
+
+
+class _RollingExtreme:
+    """
+    Monotonic deque of (index, value): the front is always the extreme
+    of the last `size` pushes. Amortized O(1).
+    dominates(a, b) → a beats b (operator.gt for max, operator.lt for min).
+    """
+
+    __slots__ = ("size", "_dq", "_i", "_dominates")
+
+    def __init__(self, size: int, dominates):
+        self.size = int(size)
+        self._dq = deque()
+        self._i = 0
+        self._dominates = dominates
+
+    def push(self, x: float) -> float:
+        dq = self._dq
+        dominates = self._dominates
+        while dq and not dominates(dq[-1][1], x):
+            dq.pop()
+        dq.append((self._i, x))
+        if dq[0][0] <= self._i - self.size:
+            dq.popleft()
+        self._i += 1
+        return dq[0][1]
+
+    @property
+    def value(self) -> float:
+        return self._dq[0][1] if self._dq else math.nan
+
+    def __len__(self):
+        return min(self._i, self.size)
+
+
+class RollingMax(_RollingExtreme):
+    __slots__ = ()
+
+    def __init__(self, size: int):
+        super().__init__(size, operator.gt)
+
+
+class RollingMin(_RollingExtreme):
+    __slots__ = ()
+
+    def __init__(self, size: int):
+        super().__init__(size, operator.lt)
+
+
+class EWMA:
+    """
+    Exponential mean / variance (pandas adjust=False recursion).
+    alpha directly, or span → alpha = 2 / (span + 1).
+    """
+
+    __slots__ = ("alpha", "_mean", "_var", "count")
+
+    def __init__(self, alpha: float = None, span: float = None):
+        if alpha is None:
+            if span is None:
+                raise ValueError("EWMA needs alpha or span")
+            alpha = 2.0 / (span + 1.0)
+        self.alpha = float(alpha)
+        self._mean = math.nan
+        self._var = 0.0
+        self.count = 0
+
+    def push(self, x: float) -> float:
+        if self.count == 0:
+            self._mean = x
+        else:
+            delta = x - self._mean
+            self._mean += self.alpha * delta
+            self._var = (1.0 - self.alpha) * (self._var + self.alpha * delta * delta)
+        self.count += 1
+        return self._mean
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    @property
+    def var(self) -> float:
+        return self._var if self.count else math.nan
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self._var) if self.count else math.nan
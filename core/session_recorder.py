@@ -0,0 +1,257 @@
+# core/session_recorder.py
+
+import os
+import pickle
+import queue
+import struct
+import threading
+import time
+import zlib
+
+import numpy as np
+
+
+SESSION_MAGIC = b"X6RS"
+SESSION_VERSION = 1
+
+# magic | version
+SESSION_HEADER = struct.Struct(">4sH")
+
+# compressed length | record count
+CHUNK_HEADER = struct.Struct(">II")
+
+_STOP = object()
+
+
+class SessionRecorder:
+    """
+    Live Session Recorder – X6 System
+    ---------------------------------
+    ✅ Trading thread only enqueues (no I/O, no compression)
+    ✅ Background writer thread
+    ✅ Chunked, zlib‑compressed, length‑prefixed frames
+    ✅ Replayed by bt.session_replay_feed.SessionReplayFeed
+
+    Record = (kind, payload):
+      • ("meta",   {"symbol": ...})
+      • ("iter",   wall_time)
+      • ("data",   bar delta | None)
+      • ("tick",   {"time_msc", "bid", "ask", ...} | None)
+      • ("equity", float)
+      • ("point",  float)
+      • ("exec",   adapter response)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        chunk_records: int = 256,
+        flush_sec: float = 5.0,
+        level: int = 3,
+    ):
+        self.path = path
+        self.chunk_records = chunk_records
+        self.flush_sec = flush_sec
+        self.level = level
+
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self.records = 0
+        self.chunks = 0
+
+    # ==================================================
+    # LIFECYCLE
+    # ==================================================
+    def start(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._thread = threading.Thread(
+            target=self._writer,
+            name="x6-session-recorder",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def close(self):
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    # ==================================================
+    # ENQUEUE (TRADING THREAD)
+    # ==================================================
+    def record(self, kind: str, payload=None):
+        self._queue.put((kind, payload))
+
+    def mark_iteration(self):
+        self._queue.put(("iter", time.time()))
+
+    # ==================================================
+    # WRITER (BACKGROUND THREAD)
+    # ==================================================
+    def _writer(self):
+        with open(self.path, "wb") as f:
+            f.write(SESSION_HEADER.pack(SESSION_MAGIC, SESSION_VERSION))
+
+            chunk = []
+            last_flush = time.monotonic()
+
+            while True:
+                try:
+                    item = self._queue.get(timeout=self.flush_sec)
+                except queue.Empty:
+                    item = None
+
+                if item is _STOP:
+                    self._flush(f, chunk)
+                    return
+
+                if item is not None:
+                    chunk.append(item)
+
+                if (
+                    len(chunk) >= self.chunk_records
+                    or (chunk and time.monotonic() - last_flush >= self.flush_sec)
+                ):
+                    self._flush(f, chunk)
+                    chunk = []
+                    last_flush = time.monotonic()
+
+    def _flush(self, f, chunk):
+        if not chunk:
+            return
+
+        payload = zlib.compress(
+            pickle.dumps(chunk, protocol=pickle.HIGHEST_PROTOCOL),
+            self.level,
+        )
+        f.write(CHUNK_HEADER.pack(len(payload), len(chunk)))
+        f.write(payload)
+        f.flush()
+
+        self.records += len(chunk)
+        self.chunks += 1
+
+
+def read_session(path: str):
+    """
+    Yield recorded (kind, payload) tuples in order.
+    """
+    with open(path, "rb") as f:
+        magic, version = SESSION_HEADER.unpack(f.read(SESSION_HEADER.size))
+        if magic != SESSION_MAGIC or version != SESSION_VERSION:
+            raise RuntimeError(f"Not a v{SESSION_VERSION} session file: {path}")
+
+        while True:
+            head = f.read(CHUNK_HEADER.size)
+            if len(head) < CHUNK_HEADER.size:
+                return
+
+            length, _ = CHUNK_HEADER.unpack(head)
+            payload = f.read(length)
+            if len(payload) < length:
+                return  # truncated tail (crash) – keep what we have
+
+            yield from pickle.loads(zlib.decompress(payload))
+
+
+class RecordingFeed:
+    """
+    Transparent data‑feed wrapper
+    -----------------------------
+    Records only what changed since the previous get_data():
+    the re‑sent forming bar plus any newly closed bars, the
+    feed's data_stale flag, and the symbol's current tick
+    (feeds with get_tick()).
+    """
+
+    def __init__(self, feed, recorder: SessionRecorder):
+        self._feed = feed
+        self._recorder = recorder
+        self._last_time = None
+        self._get_tick = getattr(feed, "get_tick", None)
+
+        self._recorder.record("meta", {
+            "symbol": getattr(feed, "symbol", None),
+            "last_bar_forming": getattr(feed, "last_bar_forming", True),
+        })
+
+    def __getattr__(self, name):
+        return getattr(self._feed, name)
+
+    def get_data(self):
+        df = self._feed.get_data()
+        if self._get_tick is not None:
+            self.get_tick()
+
+        if df is None:
+            self._recorder.record("data", None)
+            return None
+
+        time_in_index = "time" not in df.columns
+        times = (
+            df.index.asi8 if time_in_index
+            else df["time"].to_numpy().astype(np.int64)
+        )
+
+        start = 0
+        if self._last_time is not None:
+            start = int(np.searchsorted(times, self._last_time, side="left"))
+
+        tail = df.iloc[start:]
+        delta = {c: tail[c].to_numpy(copy=True) for c in tail.columns}
+        if time_in_index:
+            delta[df.index.name or "time"] = tail.index.to_numpy(copy=True)
+
+        self._recorder.record("data", {
+            "rows": len(df),
+            "time_in_index": time_in_index,
+            "columns": list(df.columns),
+            "delta": delta,
+            "stale": getattr(self._feed, "data_stale", False),
+        })
+
+        if len(times):
+            self._last_time = int(times[-1])
+
+        return df
+
+    def get_tick(self):
+        tick = self._feed.get_tick()
+        self._recorder.record(
+            "tick", tick._asdict() if hasattr(tick, "_asdict") else tick
+        )
+        return tick
+
+    def get_equity(self) -> float:
+        equity = self._feed.get_equity()
+        self._recorder.record("equity", equity)
+        return equity
+
+    def get_point_value(self) -> float:
+        value = self._feed.get_point_value()
+        self._recorder.record("point", value)
+        return value
+
+
+class RecordingExecutionAdapter:
+    """
+    Transparent execution‑adapter wrapper (records responses).
+    """
+
+    def __init__(self, adapter, recorder: SessionRecorder):
+        self._adapter = adapter
+        self._recorder = recorder
+
+    def __getattr__(self, name):
+        return getattr(self._adapter, name)
+
+    def execute(self, intent):
+        result = self._adapter.execute(intent)
+        self._recorder.record("exec", result)
+        return result
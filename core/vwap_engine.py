@@ -1,5 +1,9 @@
+from typing import TYPE_CHECKING
+
 import numpy as np
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class VWAPEngine:
@@ -20,7 +24,9 @@ class VWAPEngine:
         self.range_ma_window = range_ma_window
         self.atr_window = atr_window
 
-    def compute(self, df: pd.DataFrame) -> pd.DataFrame:
+    def compute(self, df: "pd.DataFrame") -> "pd.DataFrame":
+        import pandas as pd  # lazy: keep cold start free of pandas
+
         data = df.copy()
 
         data["tp"] = (data["high"] + data["low"] + data["close"]) / 3.0
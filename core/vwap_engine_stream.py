@@ -1,10 +1,71 @@
+# core/vwap_engine_stream.py
+# =====================================================
+# Streaming twin of core.vwap_engine.VWAPEngine
+# Same columns, same pandas semantics, O(1) per bar:
+#   vwap      cumulative (since warmup) or rolling vwap_window
+#   vol_ma    rolling mean of tick_volume   (NaN until full)
+#   avg_range rolling mean of high − low    (NaN until full)
+#   atr       rolling mean of true range    (NaN until full)
+#             TR = max(h − l, |h − prev c|, |l − prev c|)
+# ±inf → NaN as in VWAPEngine.compute.
+# =====================================================
+
+import math
+
 import numpy as np
 
+from core.rolling_stats import RollingSum
+
+
+class VWAPSnapshot:
+    """
+    Preallocated snapshot record, rewritten in place on every step
+    (copy with as_dict() to keep a value). Mapping‑style reads
+    (snap["vwap_dev"]) are kept for the old dict contract.
+    """
+
+    __slots__ = (
+        "index", "vwap", "vwap_dev", "vol_weight",
+        "bar_range", "avg_range", "atr",
+    )
+
+    FIELDS = ("vwap_dev", "vol_weight", "bar_range", "avg_range", "atr")
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.index = -1
+        self.vwap = math.nan
+        self.vwap_dev = math.nan
+        self.vol_weight = math.nan
+        self.bar_range = math.nan
+        self.avg_range = math.nan
+        self.atr = math.nan
+
+    def __getitem__(self, name: str) -> float:
+        return getattr(self, name)
+
+    def keys(self):
+        return self.FIELDS
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+
+def _finite(x: float) -> float:
+    return x if -math.inf < x < math.inf else math.nan
+
 
 class VWAPEngine:
     """
-    Freeze‑Proof, O(1), NumPy‑Only VWAP Engine
+    Freeze‑Proof, O(1), Streaming VWAP Engine
     Compatible with Orchestrator Phase‑9C
+    ------------------------------------------
+    ✅ Running sums (core.rolling_stats.RollingSum), no slices
+    ✅ True‑range ATR – parity with core.vwap_engine.VWAPEngine
+    ✅ Snapshot written into one preallocated __slots__ record
+    ✅ push(bar) for live bars, warmup(df) + step(i) for history
     """
 
     def __init__(
@@ -12,41 +73,52 @@ class VWAPEngine:
         vol_ma_window=20,
         range_ma_window=20,
         atr_window=14,
+        vwap_window=None,
     ):
         self.vol_ma_window = vol_ma_window
         self.range_ma_window = range_ma_window
         self.atr_window = atr_window
+        self.vwap_window = vwap_window
 
+        self.record = VWAPSnapshot()
         self._init = False
+        self.reset()
 
     # ==================================================
-    # One‑time initialization
+    # State
     # ==================================================
-    def warmup(self, df):
-        self._close = df["close"].to_numpy(dtype=np.float64, copy=False)
-        self._high  = df["high"].to_numpy(dtype=np.float64, copy=False)
-        self._low   = df["low"].to_numpy(dtype=np.float64, copy=False)
-        self._vol   = df["tick_volume"].to_numpy(dtype=np.float64, copy=False)
-
-        n = len(self._close)
+    def reset(self):
+        self._vol_ma = RollingSum(self.vol_ma_window)
+        self._range_ma = RollingSum(self.range_ma_window)
+        self._tr_ma = RollingSum(self.atr_window)
+
+        if self.vwap_window:
+            self._pv_sum = RollingSum(self.vwap_window)
+            self._v_sum = RollingSum(self.vwap_window)
+        else:
+            self._pv_sum = self._v_sum = None
+        self._pv = 0.0
+        self._v = 0.0
+
+        self._prev_close = None
+        self._next = 0
+        self.record.clear()
 
-        # ---- VWAP ----
-        tp = (self._high + self._low + self._close) / 3.0
-        pv = tp * self._vol
-        self._vwap = np.cumsum(pv) / np.cumsum(self._vol)
-
-        # ---- Ranges ----
-        self._bar_range = self._high - self._low
-
-        # ---- Rolling buffers ----
-        self._vol_ma     = np.full(n, np.nan)
-        self._avg_range  = np.full(n, np.nan)
-        self._atr        = np.full(n, np.nan)
+    # ==================================================
+    # One‑time initialization (history arrays)
+    # ==================================================
+    def warmup(self, df):
+        # Python floats: element reads in step() stay off NumPy scalars
+        self._high = df["high"].to_numpy(dtype=np.float64).tolist()
+        self._low = df["low"].to_numpy(dtype=np.float64).tolist()
+        self._close = df["close"].to_numpy(dtype=np.float64).tolist()
+        self._vol = df["tick_volume"].to_numpy(dtype=np.float64).tolist()
 
+        self.reset()
         self._init = True
 
     # ==================================================
-    # O(1) step
+    # O(1) step (sequential; rewinds / skips catch up)
     # ==================================================
     def step(self, i: int):
         if not self._init:
@@ -56,40 +128,72 @@ class VWAPEngine:
         if i >= n:
             i = n - 1
 
+        if i < self._next - 1:
+            self.reset()
+
+        while self._next <= i:
+            k = self._next
+            self.push(self._high[k], self._low[k], self._close[k], self._vol[k])
+
+    def push(self, high: float, low: float, close: float, volume: float):
+        """One closed bar → record (O(1))."""
+        rec = self.record
+
+        # -------- VWAP --------
+        pv = (high + low + close) / 3.0 * volume
+        if self._v_sum is None:
+            self._pv += pv
+            self._v += volume
+            vwap = self._pv / self._v if self._v != 0.0 else math.nan
+        else:
+            pv_sum = self._pv_sum.push(pv)
+            v_sum = self._v_sum.push(volume)
+            if self._v_sum.full and v_sum != 0.0:
+                vwap = pv_sum / v_sum
+            else:
+                vwap = math.nan
+        vwap = _finite(vwap)
+
         # -------- Volume MA --------
-        w = self.vol_ma_window
-        start = max(0, i - w + 1)
-        self._vol_ma[i] = np.mean(self._vol[start : i + 1])
+        self._vol_ma.push(volume)
+        vol_ma = self._vol_ma.mean if self._vol_ma.full else math.nan
 
         # -------- Avg Range --------
-        w = self.range_ma_window
-        start = max(0, i - w + 1)
-        self._avg_range[i] = np.mean(self._bar_range[start : i + 1])
-
-        # -------- ATR proxy --------
-        w = self.atr_window
-        start = max(0, i - w + 1)
-        self._atr[i] = np.mean(self._bar_range[start : i + 1])
+        bar_range = high - low
+        self._range_ma.push(bar_range)
+
+        # -------- ATR (true range) --------
+        prev = self._prev_close
+        if prev is None:
+            tr = bar_range
+        else:
+            tr = max(bar_range, abs(high - prev), abs(low - prev))
+        self._tr_ma.push(tr)
+        self._prev_close = close
+
+        rec.index = self._next
+        rec.vwap = vwap
+        rec.vwap_dev = (
+            _finite((close - vwap) / vwap) if vwap == vwap and vwap != 0.0 else math.nan
+        )
+        rec.vol_weight = (
+            _finite(volume / vol_ma) if vol_ma == vol_ma and vol_ma != 0.0 else math.nan
+        )
+        rec.bar_range = bar_range
+        rec.avg_range = self._range_ma.mean if self._range_ma.full else math.nan
+        rec.atr = self._tr_ma.mean if self._tr_ma.full else math.nan
+
+        self._next += 1
+        return rec
 
     # ==================================================
-    # Snapshot (pure read)
+    # Snapshot (record of bar i, no allocation)
     # ==================================================
-    def snapshot(self, i: int):
-        n = len(self._close)
-        if i >= n:
-            i = n - 1  # ✅ clamp index (CRITICAL)
-
-        vwap = self._vwap[i]
-        close = self._close[i]
-
-        return {
-            "vwap_dev": (close - vwap) / vwap,
-            "vol_weight": (
-                self._vol[i] / self._vol_ma[i]
-                if not np.isnan(self._vol_ma[i]) and self._vol_ma[i] > 0
-                else 1.0
-            ),
-            "bar_range": self._bar_range[i],
-            "avg_range": self._avg_range[i],
-            "atr": self._atr[i],
-        }
+    def snapshot(self, i: int = None) -> VWAPSnapshot:
+        if i is not None:
+            n = len(self._close)
+            if i >= n:
+                i = n - 1  # ✅ clamp index (CRITICAL)
+            if i != self.record.index:
+                self.step(i)
+        return self.record
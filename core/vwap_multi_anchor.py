@@ -0,0 +1,281 @@
+# core/vwap_multi_anchor.py
+# =====================================================
+# Multi‑anchor VWAP: session / day / week / N‑bar rolling
+# VWAPs and volume‑weighted σ bands from ONE set of prefix sums
+#   P = Σ v·(tp − ref)   V = Σ v   Q = Σ v·(tp − ref)²
+#   anchored at a : vwap = ref + ΔP/ΔV,  σ² = ΔQ/ΔV − (ΔP/ΔV)²
+# Batch (history) and incremental (one bar, O(anchors)).
+# Times are epoch seconds (MT5 server time); weeks start Monday.
+# =====================================================
+
+import math
+
+import numpy as np
+
+CALENDAR_ANCHORS = ("session", "day", "week")
+
+_DAY = 86400
+
+
+def anchor_ids(times, anchor: str, session_hours=(0,)):
+    """
+    Period id per bar (non‑decreasing); a new id starts an anchor.
+    """
+    t = np.asarray(times, dtype=np.int64)
+    day = t // _DAY
+    if anchor == "day":
+        return day
+    if anchor == "week":
+        return (day + 3) // 7                 # 1970‑01‑01 is a Thursday
+    if anchor == "session":
+        hours = np.asarray(session_hours, dtype=np.int64)
+        slot = np.searchsorted(hours, (t % _DAY) // 3600, side="right") - 1
+        return day * len(hours) + slot
+    raise KeyError(f"Unknown VWAP anchor: {anchor}")
+
+
+def _as_epoch(times) -> np.ndarray:
+    times = np.asarray(times)
+    if np.issubdtype(times.dtype, np.datetime64):
+        return times.astype("datetime64[s]").astype(np.int64)
+    return times.astype(np.int64)
+
+
+class MultiAnchorVWAP:
+    """
+    Multi‑Anchor VWAP – X6 System
+    -----------------------------
+    ✅ session / day / week / N‑bar rolling anchors in one pass
+    ✅ Shared pv / volume / pv² prefix sums (one cumsum per column)
+    ✅ Volume‑weighted σ bands: band(name, ±k)
+    ✅ compute() for history, update() per closed bar (O(anchors))
+
+    Anchor names: "session", "day", "week", "r<N>" (e.g. "r20").
+    """
+
+    def __init__(
+        self,
+        anchors=("session", "day", "week"),
+        rolling=(20, 240),
+        session_hours=(0, 7, 13),
+        rebase_every: int = 10_000,
+    ):
+        for name in anchors:
+            if name not in CALENDAR_ANCHORS:
+                raise KeyError(f"Unknown VWAP anchor: {name}")
+
+        self.anchors = tuple(anchors)
+        self.rolling = tuple(int(n) for n in rolling)
+        self.session_hours = tuple(sorted(int(h) for h in session_hours))
+        self.rebase_every = int(rebase_every)
+        self.names = self.anchors + tuple(f"r{n}" for n in self.rolling)
+
+        self.reset()
+
+    # ==================================================
+    # BATCH (HISTORY)
+    # ==================================================
+    def compute(self, times, high, low, close, volume) -> dict:
+        """
+        Arrays → {"vwap_<name>", "vwap_<name>_std", "vwap_<name>_dev"}.
+        Rolling anchors are NaN until N bars exist (as pandas rolling).
+        """
+        times = _as_epoch(times)
+        close = np.asarray(close, dtype=np.float64)
+        tp = (np.asarray(high, dtype=np.float64)
+              + np.asarray(low, dtype=np.float64) + close) / 3.0
+        vol = np.asarray(volume, dtype=np.float64)
+        size = len(tp)
+
+        ref = float(tp[0]) if size else 0.0
+        x = tp - ref
+        P = np.zeros(size + 1)
+        V = np.zeros(size + 1)
+        Q = np.zeros(size + 1)
+        np.cumsum(vol * x, out=P[1:])
+        np.cumsum(vol, out=V[1:])
+        np.cumsum(vol * x * x, out=Q[1:])
+
+        idx = np.arange(size)
+        end = idx + 1
+        out = {}
+
+        for name in self.names:
+            if name[0] == "r":
+                n = int(name[1:])
+                start = np.maximum(end - n, 0)
+            else:
+                ids = anchor_ids(times, name, self.session_hours)
+                first = np.ones(size, dtype=bool)
+                first[1:] = ids[1:] != ids[:-1]
+                start = np.maximum.accumulate(np.where(first, idx, 0))
+
+            dv = V[end] - V[start]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mean = (P[end] - P[start]) / dv
+                var = (Q[end] - Q[start]) / dv - mean * mean
+            var = np.where(dv > 0, np.maximum(var, 0.0), np.nan)
+            if name[0] == "r":
+                mean[: n - 1] = np.nan
+                var[: n - 1] = np.nan
+
+            vwap = np.where(dv > 0, mean + ref, np.nan)
+            out[f"vwap_{name}"] = vwap
+            out[f"vwap_{name}_std"] = np.sqrt(var)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                out[f"vwap_{name}_dev"] = (close - vwap) / vwap
+        return out
+
+    def compute_frame(self, df) -> dict:
+        """MT5 rates DataFrame (time index or "time" column)."""
+        times = df["time"].to_numpy() if "time" in df.columns else df.index.to_numpy()
+        return self.compute(
+            times,
+            df["high"].to_numpy(dtype=np.float64),
+            df["low"].to_numpy(dtype=np.float64),
+            df["close"].to_numpy(dtype=np.float64),
+            df["tick_volume"].to_numpy(dtype=np.float64),
+        )
+
+    # ==================================================
+    # INCREMENTAL (ONE CLOSED BAR)
+    # ==================================================
+    def reset(self):
+        self._n = 0
+        self._ref = None
+        self._p = self._v = self._q = 0.0
+        self.close = math.nan
+
+        # calendar anchors: name → [period id, P0, V0, Q0]
+        self._starts = {name: [None, 0.0, 0.0, 0.0] for name in self.anchors}
+
+        # prefix snapshots of the last max(N) bars (rolling anchors)
+        size = max(self.rolling, default=0) + 1
+        self._ring_p = [0.0] * size
+        self._ring_v = [0.0] * size
+        self._ring_q = [0.0] * size
+        self._ring_size = size
+
+        self._mean = dict.fromkeys(self.names, math.nan)
+        self._var = dict.fromkeys(self.names, math.nan)
+
+    def update(self, time, high, low, close, volume):
+        tp = (high + low + close) / 3.0
+        if self._ref is None:
+            self._ref = tp
+        n = self._n
+
+        # ---- calendar anchors: period change → snapshot prefix ----
+        if self.anchors:
+            t = int(time)
+            day = t // _DAY
+            for name, start in self._starts.items():
+                if name == "day":
+                    pid = day
+                elif name == "week":
+                    pid = (day + 3) // 7
+                else:
+                    slot = -1
+                    hour = (t % _DAY) // 3600
+                    for h in self.session_hours:
+                        if hour >= h:
+                            slot += 1
+                    pid = day * len(self.session_hours) + slot
+                if pid != start[0]:
+                    start[0] = pid
+                    start[1] = self._p
+                    start[2] = self._v
+                    start[3] = self._q
+
+        # ---- shared prefix sums ----
+        x = tp - self._ref
+        self._p += volume * x
+        self._v += volume
+        self._q += volume * x * x
+        self._n = n + 1
+        self.close = close
+
+        ring = self._ring_size
+        slot = self._n % ring
+        self._ring_p[slot] = self._p
+        self._ring_v[slot] = self._v
+        self._ring_q[slot] = self._q
+
+        # ---- anchored values ----
+        for name, start in self._starts.items():
+            self._set(name, start[1], start[2], start[3])
+        for length in self.rolling:
+            if self._n < length:
+                continue
+            back = (self._n - length) % ring
+            self._set(
+                f"r{length}",
+                self._ring_p[back], self._ring_v[back], self._ring_q[back],
+            )
+
+        if self.rebase_every and self._n % self.rebase_every == 0:
+            self._rebase()
+
+    def _set(self, name, p0, v0, q0):
+        dv = self._v - v0
+        if dv <= 0:
+            self._mean[name] = self._var[name] = math.nan
+            return
+        mean = (self._p - p0) / dv
+        self._mean[name] = mean
+        self._var[name] = max((self._q - q0) / dv - mean * mean, 0.0)
+
+    def _rebase(self):
+        """
+        Keep the running sums small: re‑centre on the current mean
+        and subtract the oldest live snapshot (amortized O(1)).
+        """
+        shift = self._p / self._v if self._v > 0 else 0.0
+
+        def moved(p, v, q):
+            return p - shift * v, v, q - 2.0 * shift * p + shift * shift * v
+
+        snaps = [(self._p, self._v, self._q)]
+        snaps += [tuple(s[1:]) for s in self._starts.values()]
+        snaps += list(zip(self._ring_p, self._ring_v, self._ring_q))
+        snaps = [moved(*s) for s in snaps]
+
+        # every live snapshot has V ≥ the oldest one's
+        base = min(snaps, key=lambda s: s[1])
+        bp, bv, bq = base
+
+        self._p, self._v, self._q = (
+            snaps[0][0] - bp, snaps[0][1] - bv, snaps[0][2] - bq,
+        )
+        for start, (p, v, q) in zip(self._starts.values(), snaps[1:]):
+            start[1], start[2], start[3] = p - bp, v - bv, q - bq
+        ring = snaps[1 + len(self._starts):]
+        self._ring_p = [p - bp for p, _, _ in ring]
+        self._ring_v = [v - bv for _, v, _ in ring]
+        self._ring_q = [q - bq for _, _, q in ring]
+        self._ref += shift
+        for name, mean in self._mean.items():
+            self._mean[name] = mean - shift
+
+    # ==================================================
+    # READ
+    # ==================================================
+    def vwap(self, name: str) -> float:
+        return self._mean[name] + self._ref if self._ref is not None else math.nan
+
+    def std(self, name: str) -> float:
+        return math.sqrt(self._var[name])
+
+    def dev(self, name: str) -> float:
+        vwap = self.vwap(name)
+        return (self.close - vwap) / vwap
+
+    def band(self, name: str, k: float) -> float:
+        """vwap ± k·σ (k < 0 → lower band)."""
+        return self.vwap(name) + k * self.std(name)
+
+    def snapshot(self) -> dict:
+        return {
+            name: {"vwap": self.vwap(name), "std": self.std(name), "dev": self.dev(name)}
+            for name in self.names
+        }
@@ -1,7 +1,19 @@
 # core/vwap_regime.py
 
 import numpy as np
-import pandas as pd
+
+from config.settings import REGIME_HYSTERESIS, REGIME_MIN_DWELL
+
+# ─────────────────────────────────────────────
+# Regime codes (int8) ↔ names
+# ─────────────────────────────────────────────
+WARMUP = 0
+RANGE = 1
+NEUTRAL = 2
+TREND = 3
+
+REGIME_NAMES = ("WARMUP", "RANGE", "NEUTRAL", "TREND")
+REGIME_CODES = {name: code for code, name in enumerate(REGIME_NAMES)}
 
 
 class VWAPRegimeDetector:
@@ -12,10 +24,30 @@ class VWAPRegimeDetector:
       • detect(vwap_dev, vol_weight, bar_range, avg_range)
       • detect(vwap_dev=..., vol_weight=..., bar_range=..., avg_range=...)
 
+    Fast paths:
+      • detect_point(vwap_dev, vol_weight, bar_range, avg_range)
+        fixed signature, stateless
+      • update(...)  same inputs, hysteresis + min‑dwell state
+      • classify(vwap_dev, bar_range, avg_range)
+        whole series → int8 codes (WARMUP / RANGE / NEUTRAL / TREND)
+
+    Hysteresis: TREND is kept while |dev| > trend_threshold − h
+    (bar range still above average), RANGE while
+    |dev| < range_threshold + h. Min‑dwell: a new regime
+    must be proposed for min_dwell consecutive bars before it is
+    taken (WARMUP is always immediate). Defaults (0, 1) reproduce
+    the stateless detector.
+
     Phase‑7 / Phase‑8 SAFE
     """
 
-    def __init__(self, window: int = 100, atr_window: int = 14):
+    def __init__(
+        self,
+        window: int = 100,
+        atr_window: int = 14,
+        hysteresis: float = REGIME_HYSTERESIS,
+        min_dwell: int = REGIME_MIN_DWELL,
+    ):
         self.window = window
         self.atr_window = atr_window
 
@@ -25,6 +57,22 @@ class VWAPRegimeDetector:
         self.trend_threshold = 2.5
         self.range_threshold = 1.0
 
+        # ─────────────────────────────────────────────
+        # Anti‑flicker state (update / classify)
+        # ─────────────────────────────────────────────
+        self.hysteresis = float(hysteresis)
+        self.min_dwell = max(1, int(min_dwell))
+        self.reset()
+
+    def reset(self):
+        self.code = WARMUP
+        self._pending = WARMUP
+        self._pending_bars = 0
+
+    @property
+    def regime(self) -> str:
+        return REGIME_NAMES[self.code]
+
     # ─────────────────────────────────────────────
     # Main API (CANONICAL)
     # ─────────────────────────────────────────────
@@ -85,23 +133,156 @@ class VWAPRegimeDetector:
                 "  • detect(vwap_dev=..., vol_weight=..., bar_range=..., avg_range=...)"
             )
 
-        # ─────────────────────────────────────────────
+        return self.detect_point(vwap_dev, vol_weight, bar_range, avg_range)
+
+    # ─────────────────────────────────────────────
+    # Scalar fast path (stateless)
+    # ─────────────────────────────────────────────
+    def _code(self, vwap_dev, bar_range, avg_range) -> int:
         # Safety / Warmup
-        # ─────────────────────────────────────────────
-        if avg_range is None or avg_range <= 0 or np.isnan(avg_range):
-            return "WARMUP"
+        if avg_range is None or not avg_range > 0:
+            return WARMUP
 
-        # ─────────────────────────────────────────────
-        # Regime logic
-        # ─────────────────────────────────────────────
         abs_dev = abs(vwap_dev)
 
         # Trend
         if abs_dev > self.trend_threshold and bar_range > avg_range:
-            return "TREND"
+            return TREND
 
         # Range
         if abs_dev < self.range_threshold:
-            return "RANGE"
+            return RANGE
+
+        return NEUTRAL
+
+    def detect_point(self, vwap_dev, vol_weight, bar_range, avg_range) -> str:
+        return REGIME_NAMES[self._code(vwap_dev, bar_range, avg_range)]
+
+    # ─────────────────────────────────────────────
+    # Stateful scalar path (hysteresis + min‑dwell)
+    # ─────────────────────────────────────────────
+    def update(self, vwap_dev, vol_weight, bar_range, avg_range) -> str:
+        raw = self._code(vwap_dev, bar_range, avg_range)
+        abs_dev = abs(vwap_dev)
+        h = self.hysteresis
+
+        if raw == WARMUP:
+            candidate = WARMUP
+        elif (
+            self.code == TREND
+            and abs_dev > self.trend_threshold - h
+            and bar_range > avg_range
+        ):
+            candidate = TREND
+        elif self.code == RANGE and abs_dev < self.range_threshold + h:
+            candidate = RANGE
+        else:
+            candidate = raw
+
+        self._step(candidate)
+        return REGIME_NAMES[self.code]
+
+    def _step(self, candidate: int):
+        if candidate == self.code:
+            self._pending_bars = 0
+            return
+
+        if candidate == self._pending and self._pending_bars:
+            self._pending_bars += 1
+        else:
+            self._pending = candidate
+            self._pending_bars = 1
+
+        if candidate == WARMUP or self._pending_bars >= self.min_dwell:
+            self.code = candidate
+            self._pending_bars = 0
+
+    # ─────────────────────────────────────────────
+    # Vectorized history
+    # ─────────────────────────────────────────────
+    def classify_raw(self, vwap_dev, bar_range, avg_range) -> np.ndarray:
+        """Stateless codes for whole arrays (same rule as detect)."""
+        vwap_dev = np.asarray(vwap_dev, dtype=np.float64)
+        bar_range = np.asarray(bar_range, dtype=np.float64)
+        avg_range = np.asarray(avg_range, dtype=np.float64)
+
+        abs_dev = np.abs(vwap_dev)
+        codes = np.full(abs_dev.shape, NEUTRAL, dtype=np.int8)
+        codes[abs_dev < self.range_threshold] = RANGE
+        codes[(abs_dev > self.trend_threshold) & (bar_range > avg_range)] = TREND
+        codes[~(avg_range > 0)] = WARMUP
+        return codes
+
+    def classify(self, vwap_dev, bar_range, avg_range) -> np.ndarray:
+        """
+        int8 regime codes for a full series, from a fresh state.
+        Equals update() bar by bar; without hysteresis / dwell it is
+        fully vectorized, otherwise one state step per input run.
+        """
+        raw = self.classify_raw(vwap_dev, bar_range, avg_range)
+        if self.hysteresis == 0.0 and self.min_dwell == 1:
+            return raw
+        if raw.ndim != 1:
+            raise ValueError("classify with hysteresis / min_dwell expects 1‑D series")
+
+        abs_dev = np.abs(np.asarray(vwap_dev, dtype=np.float64))
+        h = self.hysteresis
+        keep_trend = (abs_dev > self.trend_threshold - h) & (
+            np.asarray(bar_range, dtype=np.float64)
+            > np.asarray(avg_range, dtype=np.float64)
+        )
+        keep_range = abs_dev < self.range_threshold + h
+
+        # Inputs are constant within a run → O(1) state work per run
+        key = raw.astype(np.int16) * 4 + keep_trend * 2 + keep_range
+        starts = np.flatnonzero(np.diff(key, prepend=-1))
+        ends = np.append(starts[1:], len(key))
+
+        out = np.empty_like(raw)
+        state = VWAPRegimeDetector(hysteresis=h, min_dwell=self.min_dwell)
+        state.trend_threshold = self.trend_threshold
+        state.range_threshold = self.range_threshold
+
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            r = int(raw[start])
+            if r == WARMUP:
+                state._step(WARMUP)
+                out[start:end] = WARMUP
+                continue
+
+            pos = start
+            while pos < end:
+                if state.code == TREND and keep_trend[start]:
+                    candidate = TREND
+                elif state.code == RANGE and keep_range[start]:
+                    candidate = RANGE
+                else:
+                    candidate = r
+
+                if candidate == state.code:
+                    state._pending_bars = 0
+                    out[pos:end] = state.code
+                    break
+
+                # bars still needed before the switch
+                if candidate == state._pending and state._pending_bars:
+                    need = state.min_dwell - state._pending_bars
+                else:
+                    need = state.min_dwell
+                if need > end - pos:
+                    out[pos:end] = state.code
+                    state._pending = candidate
+                    state._pending_bars = state.min_dwell - need + (end - pos)
+                    break
+
+                out[pos:pos + need - 1] = state.code
+                state.code = candidate
+                state._pending_bars = 0
+                out[pos + need - 1] = candidate
+                pos += need
+        return out
 
-        return "NEUTRAL"
+    @staticmethod
+    def names(codes) -> np.ndarray:
+        """int8 codes → regime name strings (for reports)."""
+        return np.asarray(REGIME_NAMES, dtype=object)[np.asarray(codes)]
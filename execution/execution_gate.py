@@ -4,6 +4,10 @@ import time
 from execution.execution_registry import ExecutionRegistry
 from execution.execution_metrics import ExecutionMetrics
 from execution.feedback_controller import ExecutionFeedbackController
+from monitoring.logger import get_logger
+from monitoring.telemetry import REGISTRY
+
+log = get_logger(__name__)
 
 
 class ExecutionGate:
@@ -23,7 +27,58 @@ class ExecutionGate:
             kill_switch=kill_switch
         )
 
-        print("✅ [10B.1] ExecutionGate armed")
+        self._init_metrics()
+
+        log.info("✅ [10B.1] ExecutionGate armed")
+
+    # ============================
+    # TELEMETRY (registered once)
+    # ============================
+    def _init_metrics(self):
+        self._m_sent = REGISTRY.counter(
+            "x6_exec_sent_total", "Intents sent to the adapter"
+        )
+        self._m_filled = REGISTRY.counter(
+            "x6_exec_filled_total", "Adapter fills"
+        )
+        self._m_rejected = REGISTRY.counter(
+            "x6_exec_rejected_total", "Adapter rejections"
+        )
+        self._m_blocked = REGISTRY.counter(
+            "x6_exec_blocked_total", "Intents blocked before the adapter"
+        )
+        self._m_latency = REGISTRY.histogram(
+            "x6_exec_latency_seconds", "Adapter execute() latency"
+        )
+
+        feedback = self.feedback
+        metrics = self.metrics
+        registry = self.registry
+
+        REGISTRY.gauge(
+            "x6_feedback_throttle", "Feedback throttle (1.0 = none)",
+            fn=lambda: feedback.throttle,
+        )
+        REGISTRY.gauge(
+            "x6_feedback_size_multiplier", "Feedback size multiplier",
+            fn=lambda: feedback.size_multiplier,
+        )
+        REGISTRY.gauge(
+            "x6_feedback_paused", "1 when sending is paused by feedback",
+            fn=lambda: float(feedback.pause),
+        )
+        REGISTRY.gauge(
+            "x6_exec_avg_latency_ms", "ExecutionMetrics rolling average latency",
+            fn=lambda: metrics.avg_latency_ms,
+        )
+        REGISTRY.gauge(
+            "x6_registry_records", "ExecutionRegistry records held",
+            fn=lambda: registry.stats()["total"],
+        )
+        REGISTRY.gauge(
+            "x6_registry_reject_ratio", "ExecutionRegistry reject ratio",
+            fn=lambda: registry.stats()["reject_ratio"],
+        )
 
     def send(self, intent):
 
@@ -31,12 +86,14 @@ class ExecutionGate:
         # HARD KILL
         # ============================
         if self.kill_switch and self.kill_switch.is_triggered():
+            self._m_blocked.inc()
             return {"success": False, "reason": "KILL_SWITCH_ACTIVE"}
 
         # ============================
         # FEEDBACK PAUSE
         # ============================
         if not self.feedback.allow_send():
+            self._m_blocked.inc()
             return {
                 "success": False,
                 "reason": "EXECUTION_PAUSED_BY_FEEDBACK",
@@ -46,6 +103,7 @@ class ExecutionGate:
         # DUPLICATE GUARD
         # ============================
         if self.registry.has_similar(intent):
+            self._m_blocked.inc()
             return {
                 "success": False,
                 "reason": "DUPLICATE_INTENT",
@@ -77,6 +135,7 @@ class ExecutionGate:
         execution_id = self.registry.create(exec_intent)
         self.registry.mark_sent(execution_id)
         self.metrics.on_send()
+        self._m_sent.inc()
 
         # ============================
         # EXECUTE
@@ -84,6 +143,7 @@ class ExecutionGate:
         t0 = time.time()
         result = self.adapter.execute(exec_intent)
         latency_ms = (time.time() - t0) * 1000
+        self._m_latency.observe(latency_ms / 1000.0)
 
         # ============================
         # REJECT PATH
@@ -97,6 +157,7 @@ class ExecutionGate:
                 result.get("reason", "UNKNOWN"),
             )
             self.feedback.evaluate(self.metrics)
+            self._m_rejected.inc()
             return result
 
         # ============================
@@ -112,6 +173,7 @@ class ExecutionGate:
         )
 
         self.metrics.on_fill(latency_ms)
+        self._m_filled.inc()
         self.feedback.evaluate(self.metrics)
 
         return result
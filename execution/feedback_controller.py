@@ -82,6 +82,24 @@ class ExecutionFeedbackController:
         if self.throttle <= self.min_throttle:
             self.pause = True
 
+    def get_state(self):
+        """
+        Adaptive controls snapshot (checkpoint).
+        """
+        return {
+            "throttle": self.throttle,
+            "size_multiplier": self.size_multiplier,
+            "pause": self.pause,
+        }
+
+    def set_state(self, state):
+        """
+        Restore adaptive controls from a checkpoint.
+        """
+        self.throttle = float(state.get("throttle", 1.0))
+        self.size_multiplier = float(state.get("size_multiplier", 1.0))
+        self.pause = bool(state.get("pause", False))
+
     def allow_send(self):
         """
         Whether execution is currently allowed.
@@ -1,4 +1,6 @@
-import MetaTrader5 as mt5
+from core.mt5_backend import mt5
+from core.mt5_gateway import get_gateway
+from core.mt5_session import get_session
 from dataclasses import dataclass
 from typing import Optional
 
@@ -31,7 +33,9 @@ class MT5ExecutionAdapter:
     """
 
     def __init__(self):
-        if not mt5.initialize():
+        self.session = get_session()
+        self.gateway = get_gateway(self.session)
+        if not self.session.initialize():
             raise RuntimeError("MT5 initialization failed")
 
     def _build_request(self, req: ExecutionRequest) -> dict:
@@ -60,7 +64,18 @@ class MT5ExecutionAdapter:
     def send(self, req: ExecutionRequest) -> ExecutionResult:
         payload = self._build_request(req)
 
-        result = mt5.order_send(payload)
+        sent = self.gateway.send_order(payload)
+        if sent.timed_out:
+            return ExecutionResult(
+                success=False,
+                order_ticket=None,
+                reason=(
+                    "MT5 order_send timeout (in flight)" if sent.in_flight
+                    else "MT5 order_send timeout (not sent)"
+                ),
+            )
+
+        result = sent.value
 
         if result is None:
             return ExecutionResult(
@@ -85,4 +100,4 @@ class MT5ExecutionAdapter:
         )
 
     def shutdown(self):
-        mt5.shutdown()
+        self.session.shutdown()
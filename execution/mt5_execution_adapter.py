@@ -1,4 +1,6 @@
-import MetaTrader5 as mt5
+from core.mt5_backend import mt5
+from core.mt5_gateway import get_gateway
+from core.mt5_session import get_session
 
 
 class MT5ExecutionAdapter:
@@ -8,7 +10,9 @@ class MT5ExecutionAdapter:
     """
 
     def __init__(self):
-        if not mt5.initialize():
+        self.session = get_session()
+        self.gateway = get_gateway(self.session)
+        if not self.session.initialize():
             raise RuntimeError("❌ MT5 initialization failed")
 
     def send(self, intent):
@@ -33,7 +37,17 @@ class MT5ExecutionAdapter:
             "type_filling": mt5.ORDER_FILLING_RETURN,
         }
 
-        result = mt5.order_send(request)
+        sent = self.gateway.send_order(request)
+        if sent.timed_out:
+            return {
+                "success": False,
+                "reason": (
+                    "MT5 order_send timeout (in flight)" if sent.in_flight
+                    else "MT5 order_send timeout (not sent)"
+                ),
+            }
+
+        result = sent.value
 
         if result is None:
             return {
@@ -55,4 +69,4 @@ class MT5ExecutionAdapter:
         }
 
     def shutdown(self):
-        mt5.shutdown()
+        self.session.shutdown()
@@ -78,3 +78,16 @@ class StopEngine:
                 (1.0 - self.alpha) * self._ewma_tail
                 + self.alpha * r
             )
+
+    # ==================================================
+    # CHECKPOINT
+    # ==================================================
+    def get_state(self) -> dict:
+        return {
+            "ewma_tail": self._ewma_tail,
+            "samples": self._samples,
+        }
+
+    def set_state(self, state: dict):
+        self._ewma_tail = state.get("ewma_tail")
+        self._samples = int(state.get("samples", 0))
@@ -40,6 +40,7 @@ class M15TrendExitDetector:
         structure_ctx : output of structure / trend analyzer (M15)
         vwap_ctx      : VWAP metrics (deviation, slope)
         fractal_ctx   : fractal / cycle stability info
+                        (strategy.fractal_engine.FractalEngine.context)
         side          : "LONG" | "SHORT"
         """
 
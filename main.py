@@ -1,18 +1,40 @@
 import time
 import logging
 import os
-import MetaTrader5 as MT5
+from core.mt5_backend import mt5 as MT5
 from core.market_data import MarketDataFeed
 from core.orchestrator import Orchestrator
-
-print("✅ RUNNING MAIN FROM:", os.path.abspath(__file__))
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(message)s"
+from core.checkpoint import EngineCheckpointer
+from ai.online_model import ModelSnapshotStore
+from monitoring.logger import shutdown as shutdown_logging
+from monitoring.telemetry import MetricsServer
+from monitoring.watchdog import LoopWatchdog
+from core.session_recorder import (
+    SessionRecorder,
+    RecordingFeed,
+    RecordingExecutionAdapter,
+)
+from config.settings import (
+    CHECKPOINT_PATH,
+    CHECKPOINT_INTERVAL_SEC,
+    RECORD_SESSION_PATH,
+    METRICS_HOST,
+    METRICS_PORT,
+    EDGE_MODEL_DIR,
+    MT5_ITERATION_MAX_WAIT_SEC,
+    WATCHDOG_BUDGET_SEC,
+    WATCHDOG_TRIP_AFTER,
+    WATCHDOG_SAMPLE_HZ,
+    WATCHDOG_REPORT_SEC,
 )
 
 def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)s | %(message)s"
+    )
+
+    print("✅ RUNNING MAIN FROM:", os.path.abspath(__file__))
     logging.info("🚀 X6 ENGINE STARTED")
 
     feed = MarketDataFeed(
@@ -22,18 +44,103 @@ def main():
         bars=2000
     )
 
+    # ---- Session recording (deterministic replay) ----
+    recorder = None
+    if RECORD_SESSION_PATH:
+        recorder = SessionRecorder(RECORD_SESSION_PATH).start()
+        feed = RecordingFeed(feed, recorder)
+        logging.info(f"🎥 RECORDING SESSION: {RECORD_SESSION_PATH}")
+
     orchestrator = Orchestrator(feed)
 
-    while True:
-        try:
-            orchestrator.run()        # ✅ single iteration
-            time.sleep(1.0)           # ✅ heartbeat (not decision rate)
-        except KeyboardInterrupt:
-            logging.warning("🛑 ENGINE STOPPED BY USER")
-            break
-        except Exception as e:
-            logging.exception(f"🔥 ENGINE ERROR: {e}")
-            time.sleep(5.0)
+    # Adapter responses are recorded for any gate the runner injects
+    if recorder:
+        orchestrator.wrap_adapter = lambda adapter: RecordingExecutionAdapter(
+            adapter, recorder
+        )
+
+    # ---- Telemetry endpoint (Prometheus text) ----
+    metrics_server = None
+    if METRICS_PORT:
+        metrics_server = MetricsServer(host=METRICS_HOST, port=METRICS_PORT).start()
+
+    # ---- Hot restart: restore engine states ----
+    restored = False
+    checkpointer = None
+    if CHECKPOINT_PATH:
+        checkpointer = EngineCheckpointer(
+            path=CHECKPOINT_PATH,
+            components={"orchestrator": orchestrator},
+            interval_sec=CHECKPOINT_INTERVAL_SEC,
+        )
+        restored = checkpointer.restore()
+        if restored:
+            logging.info(f"♻️ ENGINE STATE RESTORED: {CHECKPOINT_PATH}")
+
+    # ---- Edge model: continue from the last published weights ----
+    snapshots = ModelSnapshotStore(EDGE_MODEL_DIR) if EDGE_MODEL_DIR else None
+    if snapshots and not restored:
+        if snapshots.load(orchestrator.edge_model.model):
+            logging.info(
+                f"🧠 EDGE MODEL v{orchestrator.edge_model.model.version} LOADED"
+            )
+
+    # ---- Loop watchdog (stall detection + sampling profiler) ----
+    watchdog = None
+    if WATCHDOG_BUDGET_SEC > 0:
+        # Waiting out gateway deadlines is not a stall
+        budget = WATCHDOG_BUDGET_SEC
+        if budget <= MT5_ITERATION_MAX_WAIT_SEC:
+            budget = MT5_ITERATION_MAX_WAIT_SEC + 1.0
+            logging.warning(
+                f"⏱️ WATCHDOG_BUDGET_SEC={WATCHDOG_BUDGET_SEC:g}s is within the "
+                f"gateway wait of one iteration ({MT5_ITERATION_MAX_WAIT_SEC:g}s) "
+                f"→ using {budget:g}s"
+            )
+        watchdog = LoopWatchdog(
+            budget_sec=budget,
+            kill_switch=orchestrator.kill_switch,
+            trip_after=WATCHDOG_TRIP_AFTER,
+            sample_hz=WATCHDOG_SAMPLE_HZ,
+            report_every_sec=WATCHDOG_REPORT_SEC,
+        ).start()
+
+    try:
+        while True:
+            try:
+                if recorder:
+                    recorder.mark_iteration()
+                if watchdog:
+                    watchdog.begin()
+                try:
+                    orchestrator.run()    # ✅ single iteration
+                finally:
+                    if watchdog:
+                        watchdog.end()
+                if checkpointer:
+                    checkpointer.maybe_save()
+                time.sleep(1.0)           # ✅ heartbeat (not decision rate)
+            except KeyboardInterrupt:
+                logging.warning("🛑 ENGINE STOPPED BY USER")
+                break
+            except Exception as e:
+                logging.exception(f"🔥 ENGINE ERROR: {e}")
+                time.sleep(5.0)
+    finally:
+        if checkpointer:
+            checkpointer.save()
+            logging.info(f"💾 ENGINE STATE SAVED: {CHECKPOINT_PATH}")
+        if snapshots and orchestrator.edge_model.model.n_updates:
+            version = snapshots.save(orchestrator.edge_model.model)
+            logging.info(f"🧠 EDGE MODEL v{version} SAVED: {EDGE_MODEL_DIR}")
+        if recorder:
+            recorder.close()
+        if metrics_server:
+            metrics_server.stop()
+        if watchdog:
+            watchdog.stop()
+            watchdog.report()
+        shutdown_logging()               # flush async log queue
 
 if __name__ == "__main__":
     main()
@@ -76,6 +76,23 @@ class KillSwitch:
             "time": self.trip_time,
         }
 
+    # ---------- CHECKPOINT ----------
+    def get_state(self):
+        return {
+            "start_equity": self.start_equity,
+            "rejections": self.rejections,
+            "tripped": self.tripped,
+            "trip_reason": self.trip_reason,
+            "trip_time": self.trip_time,
+        }
+
+    def set_state(self, state):
+        self.start_equity = state.get("start_equity")
+        self.rejections = state.get("rejections", 0)
+        self.tripped = state.get("tripped", False)
+        self.trip_reason = state.get("trip_reason")
+        self.trip_time = state.get("trip_time")
+
     # ---------- RESET ----------
     def reset(self):
         if self.trip_time is None:
@@ -1 +1,431 @@
-# logger.py
+# monitoring/logger.py
+
+import atexit
+import json
+import os
+import pickle
+import struct
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+from config.settings import (
+    LogFormat,
+    LOG_FORMAT,
+    LOG_PATH,
+    LOG_LEVEL,
+    LOG_LEVELS,
+    LOG_RATE_PER_SEC,
+    LOG_QUEUE_MAX,
+)
+
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+CRITICAL = 50
+
+LEVEL_NAMES = {
+    DEBUG: "DEBUG",
+    INFO: "INFO",
+    WARNING: "WARNING",
+    ERROR: "ERROR",
+    CRITICAL: "CRITICAL",
+}
+_LEVELS_BY_NAME = {v: k for k, v in LEVEL_NAMES.items()}
+
+LOG_MAGIC = b"X6LG"
+LOG_VERSION = 1
+
+# magic | version
+LOG_HEADER = struct.Struct(">4sH")
+
+# pickled batch length
+BATCH_HEADER = struct.Struct(">I")
+
+
+def _parse_level(value, default=INFO) -> int:
+    if isinstance(value, int):
+        return value
+    return _LEVELS_BY_NAME.get(str(value).strip().upper(), default)
+
+
+def _parse_levels(spec: str) -> dict:
+    levels = {}
+    for item in spec.split(","):
+        if "=" not in item:
+            continue
+        name, level = item.split("=", 1)
+        levels[name.strip()] = _parse_level(level)
+    return levels
+
+
+# ==================================================
+# RECORD FORMATTING (WRITER THREAD ONLY)
+# ==================================================
+def format_message(msg, args) -> str:
+    if not args:
+        return str(msg)
+    try:
+        return str(msg) % args
+    except (TypeError, ValueError):
+        return f"{msg} {args!r}"
+
+
+def format_record(record, fmt: LogFormat = LogFormat.TEXT) -> str:
+    """
+    record = (ts, level, name, msg, args, exc_text, suppressed)
+    """
+    ts, level, name, msg, args, exc_text, suppressed = record
+    message = format_message(msg, args)
+    if suppressed:
+        message += f" (+{suppressed} suppressed)"
+
+    if fmt is LogFormat.JSON:
+        entry = {
+            "ts": ts,
+            "level": LEVEL_NAMES.get(level, str(level)),
+            "logger": name,
+            "msg": message,
+        }
+        if exc_text:
+            entry["exc"] = exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+    stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+    line = (
+        f"{stamp},{int(ts % 1 * 1000):03d} | "
+        f"{LEVEL_NAMES.get(level, level)} | {name} | {message}"
+    )
+    if exc_text:
+        line += "\n" + exc_text.rstrip("\n")
+    return line
+
+
+def read_log(path: str):
+    """
+    Yield raw records from a BINARY log file.
+    """
+    with open(path, "rb") as f:
+        magic, version = LOG_HEADER.unpack(f.read(LOG_HEADER.size))
+        if magic != LOG_MAGIC or version != LOG_VERSION:
+            raise RuntimeError(f"Not a v{LOG_VERSION} log file: {path}")
+
+        while True:
+            head = f.read(BATCH_HEADER.size)
+            if len(head) < BATCH_HEADER.size:
+                return
+            (length,) = BATCH_HEADER.unpack(head)
+            payload = f.read(length)
+            if len(payload) < length:
+                return  # truncated tail (crash)
+            yield from pickle.loads(payload)
+
+
+class AsyncLogWriter:
+    """
+    Async Log Writer – X6 System
+    ----------------------------
+    ✅ Producer = deque.append (atomic, no lock, no formatting, no I/O)
+    ✅ Background thread formats + writes in batches
+    ✅ TEXT / JSON‑lines / BINARY (length‑prefixed pickle batches)
+    ✅ Bounded queue – drops (and counts) instead of blocking
+
+    Note: arguments are formatted later, on the writer thread.
+    Pass values, not objects that the caller mutates afterwards.
+    """
+
+    def __init__(
+        self,
+        fmt: LogFormat = LogFormat.TEXT,
+        path: str = "",
+        max_queue: int = 100_000,
+        flush_interval: float = 0.05,
+    ):
+        if fmt is LogFormat.BINARY and not path:
+            raise ValueError("BINARY log format requires LOG_PATH")
+
+        self.fmt = fmt
+        self.path = path
+        self.max_queue = max_queue
+        self.flush_interval = flush_interval
+
+        self._queue = deque()
+        self._thread = None
+        self._running = False
+        self._stream = None
+        self._busy = False
+
+        self.written = 0
+        self.dropped = 0
+
+    # ==================================================
+    # PRODUCER (TRADING THREAD)
+    # ==================================================
+    def enqueue(self, record):
+        if len(self._queue) >= self.max_queue:
+            self.dropped += 1
+            return
+        self._queue.append(record)
+
+    # ==================================================
+    # LIFECYCLE
+    # ==================================================
+    def start(self):
+        if self._thread is not None:
+            return self
+
+        self._open()
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run,
+            name="x6-log-writer",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def close(self):
+        if self._thread is None:
+            return
+        self._running = False
+        self._thread.join()
+        self._thread = None
+        self._drain()
+        if self._stream not in (None, sys.stdout):
+            self._stream.close()
+        self._stream = None
+
+    def flush(self, timeout: float = 2.0):
+        """
+        Wait until everything enqueued so far is written.
+        """
+        deadline = time.monotonic() + timeout
+        while (self._queue or self._busy) and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    def _open(self):
+        if not self.path:
+            self._stream = sys.stdout
+            return
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if self.fmt is LogFormat.BINARY:
+            fresh = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+            self._stream = open(self.path, "ab")
+            if fresh:
+                self._stream.write(LOG_HEADER.pack(LOG_MAGIC, LOG_VERSION))
+        else:
+            self._stream = open(self.path, "a", encoding="utf-8")
+
+    # ==================================================
+    # WRITER (BACKGROUND THREAD)
+    # ==================================================
+    def _run(self):
+        while self._running:
+            if not self._queue:
+                time.sleep(self.flush_interval)
+                continue
+            self._drain()
+
+    def _drain(self):
+        self._busy = True
+        try:
+            self._write_batch()
+        finally:
+            self._busy = False
+
+    def _write_batch(self):
+        batch = []
+        queue = self._queue
+        while queue:
+            batch.append(queue.popleft())
+        if not batch:
+            return
+
+        try:
+            if self.fmt is LogFormat.BINARY:
+                self._write_binary(batch)
+            else:
+                self._stream.write(
+                    "\n".join(format_record(r, self.fmt) for r in batch) + "\n"
+                )
+            self._stream.flush()
+            self.written += len(batch)
+        except Exception:
+            # Logging must never take the engine down
+            self.dropped += len(batch)
+
+    def _write_binary(self, batch):
+        try:
+            payload = pickle.dumps(batch, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            batch = [
+                (ts, lvl, name, msg, tuple(repr(a) for a in args), exc, sup)
+                for ts, lvl, name, msg, args, exc, sup in batch
+            ]
+            payload = pickle.dumps(batch, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self._stream.write(BATCH_HEADER.pack(len(payload)))
+        self._stream.write(payload)
+
+
+class Logger:
+    """
+    Stdlib‑compatible logger front‑end
+    ----------------------------------
+    log.info("Equity %.2f", equity)  – same signature as logging
+
+    ✅ Level check first (one int compare when filtered)
+    ✅ Token‑bucket rate limit per message template
+    """
+
+    def __init__(self, name: str, level: int, rate_per_sec: float = 0.0):
+        self.name = name
+        self.level = level
+        self.rate_per_sec = rate_per_sec
+        self.burst = max(1.0, rate_per_sec)
+
+        # template → [tokens, last_refill, suppressed]
+        self._buckets = {}
+
+    def setLevel(self, level):
+        self.level = _parse_level(level)
+
+    def isEnabledFor(self, level: int) -> bool:
+        return level >= self.level
+
+    # ==================================================
+    # API
+    # ==================================================
+    def debug(self, msg, *args):
+        if DEBUG >= self.level:
+            self._log(DEBUG, msg, args, None)
+
+    def info(self, msg, *args):
+        if INFO >= self.level:
+            self._log(INFO, msg, args, None)
+
+    def warning(self, msg, *args):
+        if WARNING >= self.level:
+            self._log(WARNING, msg, args, None)
+
+    def error(self, msg, *args):
+        if ERROR >= self.level:
+            self._log(ERROR, msg, args, None)
+
+    def critical(self, msg, *args):
+        if CRITICAL >= self.level:
+            self._log(CRITICAL, msg, args, None)
+
+    def exception(self, msg, *args):
+        if ERROR >= self.level:
+            self._log(ERROR, msg, args, traceback.format_exc())
+
+    def log(self, level, msg, *args):
+        level = _parse_level(level)
+        if level >= self.level:
+            self._log(level, msg, args, None)
+
+    # ==================================================
+    # INTERNAL
+    # ==================================================
+    def _log(self, level, msg, args, exc_text):
+        suppressed = 0
+        if self.rate_per_sec > 0:
+            now = time.monotonic()
+            bucket = self._buckets.get(msg)
+            if bucket is None:
+                if len(self._buckets) >= 1024:
+                    self._buckets.clear()    # f‑string templates – stay bounded
+                bucket = self._buckets[msg] = [self.burst, now, 0]
+            else:
+                bucket[0] = min(
+                    self.burst,
+                    bucket[0] + (now - bucket[1]) * self.rate_per_sec,
+                )
+                bucket[1] = now
+
+            if bucket[0] < 1.0:
+                bucket[2] += 1
+                return
+            bucket[0] -= 1.0
+            suppressed, bucket[2] = bucket[2], 0
+
+        _writer().enqueue(
+            (time.time(), level, self.name, msg, args, exc_text, suppressed)
+        )
+
+
+# ==================================================
+# REGISTRY (NO THREAD UNTIL THE FIRST RECORD)
+# ==================================================
+_loggers = {}
+_module_levels = _parse_levels(LOG_LEVELS)
+_default_level = _parse_level(LOG_LEVEL)
+_active_writer = None
+_writer_lock = threading.Lock()
+
+
+def _level_for(name: str) -> int:
+    best, best_len = _default_level, -1
+    for prefix, level in _module_levels.items():
+        if (name == prefix or name.startswith(prefix + ".")) and len(prefix) > best_len:
+            best, best_len = level, len(prefix)
+    return best
+
+
+def _writer() -> AsyncLogWriter:
+    global _active_writer
+    if _active_writer is not None:
+        return _active_writer
+
+    with _writer_lock:
+        if _active_writer is None:
+            writer = AsyncLogWriter(
+                fmt=LOG_FORMAT,
+                path=LOG_PATH,
+                max_queue=LOG_QUEUE_MAX,
+            ).start()
+            atexit.register(writer.close)
+            _active_writer = writer
+    return _active_writer
+
+
+def get_logger(name: str) -> Logger:
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = _loggers[name] = Logger(
+            name,
+            level=_level_for(name),
+            rate_per_sec=LOG_RATE_PER_SEC,
+        )
+    return logger
+
+
+def set_level(name: str, level):
+    """
+    Runtime per‑module override (applies to existing loggers too).
+    """
+    level = _parse_level(level)
+    _module_levels[name] = level
+    for logger_name, logger in _loggers.items():
+        logger.level = _level_for(logger_name)
+
+
+def flush():
+    if _active_writer is not None:
+        _active_writer.flush()
+
+
+def shutdown():
+    global _active_writer
+    if _active_writer is not None:
+        _active_writer.close()
+        _active_writer = None
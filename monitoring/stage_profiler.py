@@ -0,0 +1,173 @@
+# monitoring/stage_profiler.py
+
+import time
+
+
+class LatencyHistogram:
+    """
+    HDR‑style Latency Histogram
+    ---------------------------
+    ✅ Fixed size (log‑linear buckets, ~3% precision)
+    ✅ O(1) record – one shift, one list increment
+    ✅ Range: 1 ns … ~68 s (nanoseconds)
+    """
+
+    SUB_BITS = 5                    # 32 linear sub‑buckets per octave
+    MAX_SHIFT = 31
+
+    def __init__(self):
+        half = 1 << (self.SUB_BITS - 1)
+        self._size = (self.MAX_SHIFT + 2) * half + half
+        self.reset()
+
+    def reset(self):
+        self.counts = [0] * self._size
+        self.count = 0
+        self.max_ns = 0
+
+    # ==================================================
+    # RECORD
+    # ==================================================
+    def record(self, ns: int):
+        if ns < 0:
+            ns = 0
+        self.counts[self._index(ns)] += 1
+        self.count += 1
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def _index(self, ns: int) -> int:
+        sub_bits = self.SUB_BITS
+        if ns < (1 << sub_bits):
+            return ns
+        shift = min(ns.bit_length() - sub_bits, self.MAX_SHIFT)
+        return (shift << (sub_bits - 1)) + min(ns >> shift, (1 << sub_bits) - 1)
+
+    def _upper_ns(self, index: int) -> int:
+        sub_bits = self.SUB_BITS
+        if index < (1 << sub_bits):
+            return index
+        half = 1 << (sub_bits - 1)
+        shift = index // half - 1
+        sub = index - (shift << (sub_bits - 1))
+        return ((sub + 1) << shift) - 1
+
+    # ==================================================
+    # QUERY
+    # ==================================================
+    def percentile(self, q: float) -> int:
+        """
+        Upper bound (ns) of the bucket holding the q‑th percentile.
+        """
+        if self.count == 0:
+            return 0
+
+        target = max(1, int(round(q / 100.0 * self.count)))
+        seen = 0
+        for index, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                return min(self._upper_ns(index), self.max_ns)
+        return self.max_ns
+
+
+class StageProfiler:
+    """
+    Pipeline Stage Profiler – X6 System
+    -----------------------------------
+    Usage (one iteration):
+        profiler.begin()
+        ...; profiler.lap("data")
+        ...; profiler.lap("vwap")
+        profiler.end()
+
+    ✅ Monotonic clock (perf_counter_ns)
+    ✅ Disabled → every call returns on the first line
+    ✅ p50 / p99 per stage via summary() and a periodic summary line
+    """
+
+    TOTAL = "total"
+
+    def __init__(
+        self,
+        stages,
+        enabled: bool = True,
+        report_every_sec: float = 60.0,
+        sink=print,
+    ):
+        self.enabled = enabled
+        self.stages = tuple(stages)
+        self.report_every_sec = report_every_sec
+        self.sink = sink
+
+        self.histograms = {
+            name: LatencyHistogram()
+            for name in self.stages + (self.TOTAL,)
+        }
+
+        self._t_begin = 0
+        self._t_last = 0
+        self._last_report = time.monotonic()
+
+    # ==================================================
+    # HOT PATH
+    # ==================================================
+    def begin(self):
+        if not self.enabled:
+            return
+        self._t_begin = self._t_last = time.perf_counter_ns()
+
+    def lap(self, stage: str):
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        self.histograms[stage].record(now - self._t_last)
+        self._t_last = now
+
+    def end(self):
+        if not self.enabled:
+            return
+        self.histograms[self.TOTAL].record(
+            time.perf_counter_ns() - self._t_begin
+        )
+        self.maybe_report()
+
+    # ==================================================
+    # REPORTING
+    # ==================================================
+    def summary(self) -> dict:
+        """
+        {stage: {"count", "p50_ms", "p99_ms", "max_ms"}}
+        """
+        out = {}
+        for name, h in self.histograms.items():
+            out[name] = {
+                "count": h.count,
+                "p50_ms": h.percentile(50) / 1e6,
+                "p99_ms": h.percentile(99) / 1e6,
+                "max_ms": h.max_ns / 1e6,
+            }
+        return out
+
+    def summary_line(self) -> str:
+        parts = []
+        for name, s in self.summary().items():
+            if s["count"] == 0:
+                continue
+            parts.append(
+                f"{name} p50={s['p50_ms']:.3f} p99={s['p99_ms']:.3f}"
+            )
+        return "⏱️ STAGES [ms] | " + " | ".join(parts)
+
+    def maybe_report(self):
+        if self.sink is None:
+            return
+        now = time.monotonic()
+        if now - self._last_report < self.report_every_sec:
+            return
+        self._last_report = now
+        self.sink(self.summary_line())
+
+    def reset(self):
+        for h in self.histograms.values():
+            h.reset()
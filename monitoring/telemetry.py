@@ -0,0 +1,231 @@
+# monitoring/telemetry.py
+
+import math
+import threading
+from bisect import bisect_left
+
+from monitoring.logger import get_logger
+
+log = get_logger(__name__)
+
+
+def _fmt_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    body = ",".join(
+        f'{k}="{str(v)}"'.replace("\n", " ") for k, v in labels.items()
+    )
+    return "{" + body + "}"
+
+
+def _fmt_value(value) -> str:
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+# ==================================================
+# METRIC HANDLES (HOT PATH = ONE ATTRIBUTE WRITE)
+# ==================================================
+class Counter:
+    TYPE = "counter"
+
+    def __init__(self, name, help_text, labels=None):
+        self.name = name
+        self.help = help_text
+        self.labels = labels or {}
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def samples(self):
+        yield self.name, self.labels, self.value
+
+
+class Gauge:
+    """
+    set() from the trading thread, or fn() evaluated at scrape time.
+    """
+
+    TYPE = "gauge"
+
+    def __init__(self, name, help_text, labels=None, fn=None):
+        self.name = name
+        self.help = help_text
+        self.labels = labels or {}
+        self.fn = fn
+        self.value = 0.0
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def samples(self):
+        value = self.value
+        if self.fn is not None:
+            try:
+                value = self.fn()
+            except Exception:
+                value = math.nan
+            if value is None:
+                value = math.nan
+        yield self.name, self.labels, value
+
+
+class Histogram:
+    TYPE = "histogram"
+
+    DEFAULT_BUCKETS = (
+        0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+        0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+    )
+
+    def __init__(self, name, help_text, labels=None, buckets=None):
+        self.name = name
+        self.help = help_text
+        self.labels = labels or {}
+        self.buckets = tuple(sorted(buckets or self.DEFAULT_BUCKETS))
+        self.counts = [0] * (len(self.buckets) + 1)   # last = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self):
+        cumulative = 0
+        for bound, c in zip(self.buckets, self.counts):
+            cumulative += c
+            yield self.name + "_bucket", {**self.labels, "le": _fmt_value(bound)}, cumulative
+        yield self.name + "_bucket", {**self.labels, "le": "+Inf"}, self.count
+        yield self.name + "_sum", self.labels, self.sum
+        yield self.name + "_count", self.labels, self.count
+
+
+class MetricsRegistry:
+    """
+    In‑Process Metrics Registry – X6 System
+    ---------------------------------------
+    ✅ Handles are created once (init) and kept by the component
+    ✅ Re‑registering a name returns the existing handle
+    ✅ Prometheus text exposition (format 0.0.4)
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name, help_text, labels=None, **kwargs):
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = self._metrics[key] = cls(name, help_text, labels, **kwargs)
+            elif kwargs.get("fn") is not None:
+                metric.fn = kwargs["fn"]     # newest owner wins
+        return metric
+
+    def counter(self, name, help_text, labels=None) -> Counter:
+        return self._register(Counter, name, help_text, labels)
+
+    def gauge(self, name, help_text, labels=None, fn=None) -> Gauge:
+        return self._register(Gauge, name, help_text, labels, fn=fn)
+
+    def histogram(self, name, help_text, labels=None, buckets=None) -> Histogram:
+        return self._register(Histogram, name, help_text, labels, buckets=buckets)
+
+    # ==================================================
+    # EXPOSITION (SCRAPE THREAD)
+    # ==================================================
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        seen = set()
+        for metric in sorted(metrics, key=lambda m: m.name):
+            if metric.name not in seen:
+                seen.add(metric.name)
+                lines.append(f"# HELP {metric.name} {metric.help}")
+                lines.append(f"# TYPE {metric.name} {metric.TYPE}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_fmt_labels(labels)} {_fmt_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+# ==================================================
+# HTTP ENDPOINT
+# ==================================================
+class MetricsServer:
+    """
+    Serves GET /metrics from a daemon thread.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY,
+                 host: str = "127.0.0.1", port: int = 9108):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+
+    def start(self):
+        # lazy: http.server pulls email/html parsers into cold start
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self.registry
+        content_type = self.CONTENT_TYPE
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass  # keep scrapes out of the engine log
+
+        try:
+            self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        except OSError as e:
+            log.warning("⚠️ Metrics endpoint disabled (%s:%s): %s", self.host, self.port, e)
+            return self
+
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="x6-metrics",
+            daemon=True,
+        )
+        self._thread.start()
+        log.info("📈 Metrics endpoint: http://%s:%s/metrics", self.host, self.port)
+        return self
+
+    def stop(self):
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
@@ -0,0 +1,230 @@
+# monitoring/watchdog.py
+
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+
+from monitoring.logger import get_logger
+from monitoring.telemetry import REGISTRY
+
+log = get_logger(__name__)
+
+
+class LoopWatchdog:
+    """
+    Loop Watchdog – X6 System
+    -------------------------
+    ✅ Heartbeat per iteration (begin / end from the loop thread)
+    ✅ Stall = iteration running longer than budget_sec → the loop
+       thread's Python stack is captured (sys._current_frames)
+    ✅ Optional: trip_after consecutive stalled iterations → KillSwitch.trip
+    ✅ Low‑rate sampling profiler of the loop thread (sample_hz)
+       → collapsed stacks (flamegraph format) + periodic top report
+
+    Usage:
+        wd = LoopWatchdog(budget_sec=20, kill_switch=ks).start()
+        while True:
+            wd.begin()
+            try:
+                orchestrator.run()
+            finally:
+                wd.end()
+    """
+
+    MAX_STACKS = 5000
+    MAX_DEPTH = 48
+
+    def __init__(
+        self,
+        budget_sec: float = 5.0,
+        kill_switch=None,
+        trip_after: int = 0,
+        sample_hz: float = 0.0,
+        report_every_sec: float = 300.0,
+        check_every_sec: float = None,
+    ):
+        self.budget_sec = budget_sec
+        self.kill_switch = kill_switch
+        self.trip_after = trip_after
+        self.sample_hz = sample_hz
+        self.report_every_sec = report_every_sec
+        self.check_every_sec = check_every_sec or min(0.25, budget_sec / 4.0)
+
+        # heartbeat (written by the loop thread)
+        self._loop_ident = None
+        self._started = None          # monotonic start of running iteration
+        self._iteration = 0
+        self.last_duration = 0.0
+
+        # stall bookkeeping (watchdog thread)
+        self._flagged = -1            # iteration already reported
+        self.stalls = 0
+        self.consecutive = 0
+        self.last_stack = None
+
+        # sampling profiler
+        self.samples = Counter()
+        self.sample_count = 0
+        self._next_report = time.monotonic() + report_every_sec
+
+        self._stop = threading.Event()
+        self._thread = None
+
+        self._m_stalls = REGISTRY.counter(
+            "x6_loop_stalls_total", "Iterations that exceeded the watchdog budget"
+        )
+        REGISTRY.gauge(
+            "x6_loop_heartbeat_age_seconds", "Seconds since the running iteration started (0 when idle)",
+            fn=self.running_for,
+        )
+
+    # ==================================================
+    # HEARTBEAT (LOOP THREAD)
+    # ==================================================
+    def begin(self):
+        self._loop_ident = threading.get_ident()
+        self._iteration += 1
+        self._started = time.monotonic()
+
+    def end(self):
+        started, self._started = self._started, None
+        if started is None:
+            return
+        self.last_duration = time.monotonic() - started
+        if self._flagged != self._iteration:
+            self.consecutive = 0          # finished within budget
+        elif self.last_duration > self.budget_sec:
+            log.warning(
+                "🐢 Stalled iteration #%d finished after %.2fs",
+                self._iteration, self.last_duration,
+            )
+
+    def running_for(self) -> float:
+        started = self._started
+        return 0.0 if started is None else time.monotonic() - started
+
+    # ==================================================
+    # WATCHDOG THREAD
+    # ==================================================
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="x6-watchdog", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def _run(self):
+        sample_every = 1.0 / self.sample_hz if self.sample_hz > 0 else None
+        tick = self.check_every_sec if sample_every is None else min(self.check_every_sec, sample_every)
+        next_sample = time.monotonic()
+
+        while not self._stop.wait(tick):
+            now = time.monotonic()
+            try:
+                self._check(now)
+                if sample_every is not None and now >= next_sample:
+                    next_sample = now + sample_every
+                    self._sample()
+                if self.report_every_sec and now >= self._next_report:
+                    self._next_report = now + self.report_every_sec
+                    self.report()
+            except Exception as e:          # never let the watchdog die
+                log.error("❌ Watchdog error: %s", e)
+
+    def _loop_frame(self):
+        ident = self._loop_ident
+        if ident is None:
+            return None
+        return sys._current_frames().get(ident)
+
+    def _check(self, now: float):
+        started = self._started
+        iteration = self._iteration
+        if started is None or self._flagged == iteration:
+            return
+        elapsed = now - started
+        if elapsed <= self.budget_sec:
+            return
+
+        self._flagged = iteration
+        self.stalls += 1
+        self.consecutive += 1
+        self._m_stalls.inc()
+
+        frame = self._loop_frame()
+        self.last_stack = (
+            "".join(traceback.format_stack(frame, limit=self.MAX_DEPTH))
+            if frame is not None else "<loop thread not found>"
+        )
+        log.warning(
+            "🐢 LOOP STALL: iteration #%d running %.2fs (budget %.2fs, %d in a row)\n%s",
+            iteration, elapsed, self.budget_sec, self.consecutive, self.last_stack,
+        )
+
+        if (
+            self.kill_switch is not None
+            and self.trip_after
+            and self.consecutive >= self.trip_after
+            and not self.kill_switch.tripped
+        ):
+            self.kill_switch.trip(f"Loop stalled {self.consecutive}x (> {self.budget_sec:.1f}s)")
+            log.error("🚨 KILL SWITCH: loop stalled %d iterations in a row", self.consecutive)
+
+    # ==================================================
+    # SAMPLING PROFILER (LOOP THREAD, ONLY WHILE RUNNING)
+    # ==================================================
+    def _sample(self):
+        if self._started is None:
+            return
+        frame = self._loop_frame()
+        if frame is None:
+            return
+
+        stack = []
+        while frame is not None and len(stack) < self.MAX_DEPTH:
+            code = frame.f_code
+            stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+            frame = frame.f_back
+        key = ";".join(reversed(stack))
+
+        if key in self.samples or len(self.samples) < self.MAX_STACKS:
+            self.samples[key] += 1
+        else:
+            self.samples["<other>"] += 1
+        self.sample_count += 1
+
+    def top(self, n: int = 10, leaf: bool = True) -> list:
+        """
+        [(function or stack, share of samples)], leaf=True → self time.
+        """
+        total = self.sample_count
+        if not total:
+            return []
+        if not leaf:
+            return [(k, c / total) for k, c in self.samples.most_common(n)]
+        funcs = Counter()
+        for stack, c in self.samples.items():
+            funcs[stack.rsplit(";", 1)[-1]] += c
+        return [(k, c / total) for k, c in funcs.most_common(n)]
+
+    def report(self):
+        if not self.sample_count:
+            return
+        body = " | ".join(f"{name} {share:.0%}" for name, share in self.top(5))
+        log.info("🔬 Loop profile (%d samples): %s", self.sample_count, body)
+
+    def dump_collapsed(self, path: str):
+        """Brendan Gregg collapsed format (flamegraph.pl / speedscope)."""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
@@ -8,6 +8,7 @@ from nds.capacity import CapacityEngine
 from nds.judgment_engine import JudgmentEngine
 from nds.decision_engine import DecisionEngine
 from nds.verdict import NDSVerdictEnvelope
+from monitoring.logger import get_logger
 
 from config.settings import (
     # Warm‑Up
@@ -21,6 +22,8 @@ from config.settings import (
     MAX_TRADE_STRESS,
 )
 
+log = get_logger(__name__)
+
 
 class NDSCore:
     """
@@ -49,6 +52,20 @@ class NDSCore:
         self.logger = logger
         self._warmup_tick = 0
 
+    # --------------------------------------------------
+    # Checkpoint (hot restart)
+    # --------------------------------------------------
+    def get_state(self) -> dict:
+        return {
+            "confirm_memory": list(self._confirm_memory),
+            "warmup_tick": self._warmup_tick,
+        }
+
+    def set_state(self, state: dict):
+        self._confirm_memory.clear()
+        self._confirm_memory.extend(state.get("confirm_memory", []))
+        self._warmup_tick = int(state.get("warmup_tick", 0))
+
     # --------------------------------------------------
     # Adaptive confirmation bars (volatility aware)
     # --------------------------------------------------
@@ -185,14 +202,16 @@ class NDSCore:
         # ---------- Warm‑Up Debug (RATE‑LIMITED) ----------
         if WARMUP_MODE and WARMUP_JUDGMENT_DEBUG:
             if self._warmup_tick % 200 == 0:
-                print("🧪 [WARMUP][NDS SNAPSHOT]")
-                print("CONTEXT:", context)
-                print("MARKET:", market)
-                print("STRUCTURE:", structure)
-                print("PRESSURE:", pressure)
-                print("CAPACITY:", capacity)
-                print("DECISION:", decision)
-                print("-" * 60)
+                log.info(
+                    "🧪 [WARMUP][NDS SNAPSHOT] CONTEXT=%s | MARKET=%s | "
+                    "STRUCTURE=%s | PRESSURE=%s | CAPACITY=%s | DECISION=%s",
+                    dict(context),
+                    market,
+                    structure,
+                    pressure,
+                    capacity,
+                    decision,
+                )
             self._warmup_tick += 1
 
         return verdict
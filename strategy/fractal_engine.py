@@ -1 +1,222 @@
-# fractal_engine.py
+# strategy/fractal_engine.py
+# =====================================================
+# Williams fractals / swing points on several scales
+#   • detect_fractals : vectorized batch detection (history)
+#   • FractalEngine   : incremental, amortized O(1) per bar
+#                       and scale (monotonic deques)
+#   • context()       : {"stability", ...} for M15TrendExitDetector
+#
+# Swing high at bar c (scale n):
+#   high[c] >  max(high[c-n : c])        (n bars before)
+#   high[c] >= max(high[c+1 : c+n+1])    (n bars after)
+# (swing low mirrored). A pivot is only known once the n bars
+# after it have closed → reported at bar c + n, never earlier.
+# =====================================================
+
+import math
+
+import numpy as np
+
+from core.rolling_stats import RollingMax, RollingMin, RollingSum, RollingWindow
+
+SWING_HIGH = 1
+SWING_LOW = -1
+
+_NONE = ()
+
+
+def detect_fractals(high, low, n: int = 2):
+    """
+    Vectorized detection over a full history.
+    Returns (is_high, is_low) boolean arrays indexed by the pivot
+    bar; pivot i is confirmed at bar i + n (last n bars are False).
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    size = len(high)
+
+    is_high = np.zeros(size, dtype=bool)
+    is_low = np.zeros(size, dtype=bool)
+    if size < 2 * n + 1:
+        return is_high, is_low
+
+    win_h = np.lib.stride_tricks.sliding_window_view(high, n)
+    win_l = np.lib.stride_tricks.sliding_window_view(low, n)
+    max_h = win_h.max(axis=1)       # max_h[k] = max(high[k : k+n])
+    min_l = win_l.min(axis=1)
+
+    c = np.arange(n, size - n)
+    is_high[c] = (high[c] > max_h[c - n]) & (high[c] >= max_h[c + 1])
+    is_low[c] = (low[c] < min_l[c - n]) & (low[c] <= min_l[c + 1])
+    return is_high, is_low
+
+
+class _Scale:
+    """
+    One fractal scale: delay line of n+1 bars, the n bars left of
+    the candidate in one deque pair, the n bars right of it in another.
+    """
+
+    __slots__ = (
+        "n", "t", "_h", "_l",
+        "_left_max", "_left_min", "_right_max", "_right_min",
+        "last_high", "last_low", "high_signs", "low_signs",
+    )
+
+    def __init__(self, n: int, memory: int):
+        self.n = n
+        self.t = 0
+
+        self._h = RollingWindow(n + 1)
+        self._l = RollingWindow(n + 1)
+        self._left_max = RollingMax(n)
+        self._left_min = RollingMin(n)
+        self._right_max = RollingMax(n)
+        self._right_min = RollingMin(n)
+
+        self.last_high = math.nan
+        self.last_low = math.nan
+        # +1 higher high / higher low, −1 lower high / lower low
+        self.high_signs = RollingSum(memory)
+        self.low_signs = RollingSum(memory)
+
+    def push(self, high: float, low: float, detect: bool = True):
+        n = self.n
+        t = self.t
+        self.t = t + 1
+
+        out_h = self._h.push(high)
+        out_l = self._l.push(low)
+        self._right_max.push(high)
+        self._right_min.push(low)
+        if out_h is None:
+            return _NONE
+
+        # bar t‑n‑1 leaves the delay line → left neighbour of bar t‑n
+        self._left_max.push(out_h)
+        self._left_min.push(out_l)
+        if not detect or t < 2 * n:
+            return _NONE
+
+        found = _NONE
+        c_high = self._h[-(n + 1)]
+        if c_high > self._left_max.value and c_high >= self._right_max.value:
+            self.on_high(c_high)
+            found = ((n, SWING_HIGH, t - n, c_high),)
+
+        c_low = self._l[-(n + 1)]
+        if c_low < self._left_min.value and c_low <= self._right_min.value:
+            self.on_low(c_low)
+            found += ((n, SWING_LOW, t - n, c_low),)
+        return found
+
+    def on_high(self, price: float):
+        if self.last_high == self.last_high:
+            self.high_signs.push(1.0 if price > self.last_high else -1.0)
+        self.last_high = price
+
+    def on_low(self, price: float):
+        if self.last_low == self.last_low:
+            self.low_signs.push(1.0 if price > self.last_low else -1.0)
+        self.last_low = price
+
+
+class FractalEngine:
+    """
+    Fractal Engine – X6 System
+    --------------------------
+    ✅ Williams fractals on several scales (n bars each side)
+    ✅ update(high, low) per closed bar: amortized O(1) per scale
+    ✅ Lookahead‑correct: pivot at bar i reported at bar i + n
+    ✅ warm_up(history) through the vectorized detect_fractals
+    ✅ stability ∈ [0, 1]: agreement of recent swing transitions
+       (HH / HL vs LH / LL) across all scales
+         1.0 → clean swing structure, all scales aligned
+         ~0  → chop or scales in conflict
+
+    One engine per (symbol, timeframe); feed closed bars only.
+    """
+
+    def __init__(self, scales=(2, 5, 13), memory: int = 4):
+        self.scales = tuple(sorted(int(n) for n in scales))
+        self.memory = int(memory)
+        self._scales = [_Scale(n, self.memory) for n in self.scales]
+
+    # ==================================================
+    # INCREMENTAL (ONE CLOSED BAR)
+    # ==================================================
+    def update(self, high: float, low: float):
+        """
+        Returns the pivots confirmed by this bar as a tuple of
+        (scale, SWING_HIGH | SWING_LOW, bar index, price).
+        """
+        found = _NONE
+        for scale in self._scales:
+            pivots = scale.push(high, low)
+            if pivots:
+                found += pivots
+        return found
+
+    # ==================================================
+    # BATCH (HISTORY)
+    # ==================================================
+    def warm_up(self, high, low):
+        """
+        Replace the state with the one after `high` / `low`:
+        pivots by detect_fractals, only the last 2·n bars per scale
+        are pushed through the deques.
+        """
+        high = np.asarray(high, dtype=np.float64)
+        low = np.asarray(low, dtype=np.float64)
+        size = len(high)
+        self._scales = [_Scale(n, self.memory) for n in self.scales]
+
+        for scale in self._scales:
+            n = scale.n
+            is_high, is_low = detect_fractals(high, low, n)
+
+            for price in high[is_high][-(self.memory + 1):].tolist():
+                scale.on_high(price)
+            for price in low[is_low][-(self.memory + 1):].tolist():
+                scale.on_low(price)
+
+            start = max(0, size - 2 * n)
+            scale.t = start
+            for h, l in zip(high[start:].tolist(), low[start:].tolist()):
+                scale.push(h, l, detect=False)
+        return self
+
+    # ==================================================
+    # CONTEXT (EXIT ENGINE)
+    # ==================================================
+    @property
+    def bars(self) -> int:
+        return self._scales[0].t if self._scales else 0
+
+    def _signs(self):
+        total = 0.0
+        count = 0
+        for scale in self._scales:
+            total += scale.high_signs.sum + scale.low_signs.sum
+            count += len(scale.high_signs) + len(scale.low_signs)
+        return total, count
+
+    @property
+    def stability(self) -> float:
+        total, count = self._signs()
+        return abs(total) / count if count else 1.0
+
+    @property
+    def direction(self) -> int:
+        total, _ = self._signs()
+        return (total > 0) - (total < 0)
+
+    def context(self) -> dict:
+        """fractal_ctx for M15TrendExitDetector.evaluate."""
+        top = self._scales[-1]
+        return {
+            "stability": self.stability,
+            "direction": self.direction,
+            "swing_high": top.last_high,
+            "swing_low": top.last_low,
+        }
@@ -1 +1,258 @@
-# signal_fusion.py
+# strategy/signal_fusion.py
+# =====================================================
+# Signal fusion: every X8 analyzer for a whole window (or all
+# symbols at once) as NumPy arrays, fused with NDS confidence.
+#
+# Same formulas as the per‑call analyzers, along the last axis:
+#   X8_3  momentum_raw / slope / acceleration
+#   X8_6  momentum, volume_pressure, order_flow, market_score,
+#         direction (+1 buy, −1 sell, 0 hold)
+#   X8_1  cohesion_sign (momentum & volume agree), x8_1_score
+#   X8_2  order_flow_score, order_flow_ewma (span)
+#   X8_6_1 cohesion = 1 / (1 + rolling std(close))
+#   X8_5  stability = 1 / (1 + |momentum − order_flow|)
+#   X8_6_2 reward = market_score·w + cohesion·w + stability·w
+#
+# fused = reward · (1 − w_nds + w_nds · nds_confidence)
+# Values are not rounded (the analyzers round to 4 decimals).
+# =====================================================
+
+from functools import lru_cache
+
+import numpy as np
+
+from config.settings import FUSION_WEIGHTS
+
+DEFAULT_WEIGHTS = {
+    "market_score": 0.50,
+    "cohesion": 0.30,
+    "stability": 0.20,
+    "nds": 0.50,
+}
+
+_EWMA_CHUNK = 64
+
+
+def parse_weights(spec: str) -> dict:
+    """"market_score=0.5,nds=0.3" → DEFAULT_WEIGHTS with overrides."""
+    weights = dict(DEFAULT_WEIGHTS)
+    for item in spec.split(","):
+        if "=" not in item:
+            continue
+        name, value = item.split("=", 1)
+        name = name.strip()
+        if name not in weights:
+            raise KeyError(f"Unknown fusion weight: {name}")
+        weights[name] = float(value)
+    return weights
+
+
+def nds_confidence(verdict) -> float:
+    """NDSVerdictEnvelope → confidence, 0.0 when the decision rejects."""
+    decision = verdict.decision
+    if not getattr(decision, "accept", False):
+        return 0.0
+    return float(getattr(decision, "confidence", 0.0))
+
+
+# -----------------------------------------------------
+# Kernels (last axis = time)
+# -----------------------------------------------------
+def _lag_diff(x, lag: int):
+    out = np.zeros_like(x)
+    out[..., lag:] = x[..., lag:] - x[..., :-lag]
+    return out
+
+
+@lru_cache(maxsize=16)
+def _ewma_kernel(span: float):
+    alpha = 2.0 / (span + 1.0)
+    decay = 1.0 - alpha
+
+    lag = np.arange(_EWMA_CHUNK)
+    power = np.where(
+        lag[:, None] >= lag[None, :],
+        decay ** np.maximum(lag[:, None] - lag[None, :], 0),
+        0.0,
+    )
+    kernel_t = (alpha * power).T          # (k, j)
+    carry = decay ** (lag + 1)
+    return kernel_t, carry
+
+
+def ewma(x, span: float):
+    """
+    pandas adjust=False EWMA (core.rolling_stats.EWMA) along the
+    last axis, in chunks: y = x_chunk @ K.T + decay powers · y_prev.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    out = np.empty_like(x)
+    if x.shape[-1] == 0:
+        return out
+
+    kernel_t, carry = _ewma_kernel(float(span))
+    prev = out[..., 0] = x[..., 0]
+    size = x.shape[-1]
+    for start in range(1, size, _EWMA_CHUNK):
+        stop = min(start + _EWMA_CHUNK, size)
+        n = stop - start
+        block = x[..., start:stop] @ kernel_t[:n, :n]
+        block += prev[..., None] * carry[:n]
+        out[..., start:stop] = block
+        prev = block[..., -1]
+    return out
+
+
+def rolling_std(x, window: int):
+    """
+    Population std of the last `window` values (expanding at the
+    start), as core.rolling_stats.RollingMeanVar.std().
+    """
+    x = np.asarray(x, dtype=np.float64)
+    shifted = x - x[..., :1]                 # less cancellation
+    zero = np.zeros(x.shape[:-1] + (1,))
+    s1 = np.concatenate((zero, np.cumsum(shifted, axis=-1)), axis=-1)
+    s2 = np.concatenate((zero, np.cumsum(shifted * shifted, axis=-1)), axis=-1)
+
+    end = np.arange(1, x.shape[-1] + 1)
+    begin = np.maximum(end - window, 0)
+    count = end - begin
+
+    mean = (s1[..., end] - s1[..., begin]) / count
+    var = (s2[..., end] - s2[..., begin]) / count - mean * mean
+    return np.sqrt(np.maximum(var, 0.0)), count
+
+
+def x8_signals(
+    close,
+    volume,
+    spread=None,
+    cohesion_window: int = 20,
+    cohesion_min_samples: int = 5,
+    flow_span: float = 20,
+) -> dict:
+    """
+    All X8 signals for (T,) windows or (symbols, T) panels.
+    Index t equals the analyzers' output after feeding bars 0..t.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    volume = np.asarray(volume, dtype=np.float64)
+    size = close.shape[-1]
+    bar = np.arange(size)
+
+    # ---------- X8_3 / X8_6 ----------
+    momentum = _lag_diff(close, 1)
+    volume_pressure = _lag_diff(volume, 1)
+    order_flow = _lag_diff(close, 2)
+    acceleration = _lag_diff(momentum, 1)
+    acceleration[..., :2] = 0.0
+
+    market_score = momentum * 0.4 + volume_pressure * 0.3 + order_flow * 0.3
+    direction = (
+        ((momentum > 0) & (order_flow > 0)).astype(np.int8)
+        - ((momentum < 0) & (order_flow < 0)).astype(np.int8)
+    )
+
+    # ---------- X8_1 (zeros until 3 bars) ----------
+    cohesion_sign = (
+        ((momentum > 0) & (volume_pressure > 0)).astype(np.float64)
+        - ((momentum < 0) & (volume_pressure < 0)).astype(np.float64)
+    )
+    early = bar < 2
+    cohesion_sign[..., early] = 0.0
+    x8_1_score = momentum * 0.4 + volume_pressure * 0.3 + cohesion_sign * 0.3
+    x8_1_score[..., early] = 0.0
+
+    # ---------- X8_2 ----------
+    if spread is None:
+        spread = np.zeros_like(volume)
+    spread = np.asarray(spread, dtype=np.float64)
+    flow_score = np.where(spread < 10, 0.2, -0.2) * volume
+    flow_ewma = ewma(flow_score, flow_span)
+
+    # ---------- X8_6_1 ----------
+    vol, count = rolling_std(close, cohesion_window)
+    cohesion = np.where(vol == 0, 1.0, 1.0 / (1.0 + vol))
+    cohesion[..., count < cohesion_min_samples] = 0.0
+
+    # ---------- X8_5 ----------
+    stability = 1.0 / (1.0 + np.abs(momentum - order_flow))
+
+    return {
+        "momentum": momentum,
+        "momentum_slope": order_flow * 0.5,
+        "momentum_acceleration": acceleration,
+        "volume_pressure": volume_pressure,
+        "order_flow": order_flow,
+        "market_score": market_score,
+        "direction": direction,
+        "cohesion_sign": cohesion_sign,
+        "x8_1_score": x8_1_score,
+        "order_flow_score": flow_score,
+        "order_flow_ewma": flow_ewma,
+        "cohesion": cohesion,
+        "stability": stability,
+    }
+
+
+def fuse(signals: dict, nds_conf=1.0, weights: dict = None):
+    """
+    X8_6_2 reward scaled by NDS confidence. nds_conf broadcasts:
+    scalar, (T,) per bar or (symbols, 1) per symbol.
+    """
+    w = DEFAULT_WEIGHTS if weights is None else weights
+    reward = (
+        signals["market_score"] * w["market_score"]
+        + signals["cohesion"] * w["cohesion"]
+        + signals["stability"] * w["stability"]
+    )
+    gate = 1.0 - w["nds"] + w["nds"] * np.asarray(nds_conf, dtype=np.float64)
+    return reward * gate
+
+
+class SignalFusion:
+    """
+    Signal Fusion – X6 System
+    -------------------------
+    ✅ X8_1 / X8_2 / X8_3 / X8_5 / X8_6* in one NumPy pass
+    ✅ (T,) window or (symbols, T) panel
+    ✅ NDS confidence through configurable weights (FUSION_WEIGHTS)
+    ✅ One fused score array out; per‑signal arrays in .signals
+    """
+
+    def __init__(
+        self,
+        weights: dict = None,
+        cohesion_window: int = 20,
+        cohesion_min_samples: int = 5,
+        flow_span: float = 20,
+    ):
+        self.weights = parse_weights(FUSION_WEIGHTS) if weights is None else {
+            **DEFAULT_WEIGHTS, **weights
+        }
+        self.cohesion_window = cohesion_window
+        self.cohesion_min_samples = cohesion_min_samples
+        self.flow_span = flow_span
+        self.signals = None
+
+    def compute(self, close, volume, spread=None, nds_conf=1.0):
+        self.signals = x8_signals(
+            close,
+            volume,
+            spread,
+            cohesion_window=self.cohesion_window,
+            cohesion_min_samples=self.cohesion_min_samples,
+            flow_span=self.flow_span,
+        )
+        return fuse(self.signals, nds_conf, self.weights)
+
+    def compute_frame(self, df, nds_conf=1.0):
+        """MT5 rates DataFrame (close, tick_volume, spread)."""
+        volume = df["tick_volume"] if "tick_volume" in df.columns else df["volume"]
+        spread = df["spread"] if "spread" in df.columns else None
+        return self.compute(
+            df["close"].to_numpy(dtype=np.float64),
+            volume.to_numpy(dtype=np.float64),
+            None if spread is None else spread.to_numpy(dtype=np.float64),
+            nds_conf,
+        )
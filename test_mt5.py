@@ -1,4 +1,4 @@
-import MetaTrader5 as mt5
+from core.mt5_backend import mt5
 
 print("Initializing...")
 if not mt5.initialize():